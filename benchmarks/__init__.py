@@ -0,0 +1,9 @@
+"""
+Benchmarks de desempenho do Transcript Analyzer
+
+- synthetic: gerador de transcrições sintéticas em português
+- run_benchmarks: mede cada analisador e o pipeline completo e compara com o baseline
+
+Uso:
+    python -m benchmarks.run_benchmarks --sizes 10KB 1MB
+"""
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+🏁 Benchmarks - Throughput e memória dos analisadores e do pipeline
+
+Para cada tamanho de transcrição sintética (benchmarks.synthetic) mede:
+- tokenização (TokenizedDocument)
+- cada analisador de engine/analyzers, isolado (dependências calculadas antes, fora da medição)
+- o pipeline completo do AnalysisRunner (análise + gráficos + relatório) num projeto
+  temporário, dentro de uma instalação isolada (nada é gravado em projects/ ou .cache/)
+
+Cada caso roda num processo novo, então o pico de RSS (ru_maxrss) é do caso.
+O resultado vai para benchmarks/results/latest.json e é comparado com
+benchmarks/baseline.json: queda de throughput ou aumento de RSS acima da
+tolerância é regressão (código de saída 1).
+
+Uso:
+    python -m benchmarks.run_benchmarks                         # 10KB, 100KB, 1MB
+    python -m benchmarks.run_benchmarks --sizes 100MB --analyzers word_frequency
+    python -m benchmarks.run_benchmarks --update-baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import TranscriptGenerator, format_size, parse_size
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BASELINE_PATH = BENCHMARKS_DIR / "baseline.json"
+RESULTS_PATH = BENCHMARKS_DIR / "results" / "latest.json"
+
+DEFAULT_SIZES = ['10KB', '100KB', '1MB']
+DEFAULT_TOLERANCE = 0.25
+
+# Casos mais rápidos que isso são dominados por ruído e não entram na comparação
+MIN_COMPARABLE_SECONDS = 0.01
+
+
+def _peak_rss_kb() -> float:
+    """Pico de RSS do processo atual (ru_maxrss é KB no Linux, bytes no macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform == 'darwin' else float(peak)
+
+
+def _case_record(wall_times: List[float], input_chars: int, files: int = 1) -> Dict:
+    best = min(wall_times)
+    return {
+        'wall_time': round(best, 6),
+        'runs': len(wall_times),
+        'input_chars': input_chars,
+        'chars_per_sec': round(input_chars / best, 1) if best else None,
+        'files_per_sec': round(files / best, 3) if best else None,
+        'peak_rss_kb': round(_peak_rss_kb(), 1)
+    }
+
+
+# ---------------------------------------------------------------------------
+# Casos (executados em processos filhos)
+# ---------------------------------------------------------------------------
+
+def _bench_tokenizer(text_path: str, repeat: int) -> Dict:
+    from engine.text.tokenized_document import TokenizedDocument
+    
+    text = Path(text_path).read_text(encoding='utf-8')
+    wall_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        TokenizedDocument(text)
+        wall_times.append(time.perf_counter() - start)
+    return _case_record(wall_times, len(text))
+
+
+def _bench_analyzer(analyzer_key: str, text_path: str, repeat: int) -> Dict:
+    from core.engine.analysis_orchestrator import AnalysisOrchestrator
+    from engine.text.tokenized_document import TokenizedDocument
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        orchestrator = AnalysisOrchestrator(max_workers=1)
+        
+    text = Path(text_path).read_text(encoding='utf-8')
+    document = TokenizedDocument(text)
+    
+    # Dependências fora da medição, na ordem do DAG
+    needed, pending = set(), [analyzer_key]
+    while pending:
+        for dep in orchestrator.dependencies.get(pending.pop(), []):
+            if dep not in needed:
+                needed.add(dep)
+                pending.append(dep)
+                
+    with contextlib.redirect_stdout(io.StringIO()):
+        for dep in orchestrator._resolve_execution_order():
+            if dep in needed:
+                orchestrator.results_cache[dep] = orchestrator._execute_analyzer(dep, text, {}, document)
+                
+    inputs = orchestrator._prepare_inputs(analyzer_key, document)
+    
+    wall_times = []
+    for _ in range(repeat):
+        log = io.StringIO()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(log):
+            result = orchestrator._execute_analyzer(analyzer_key, text, {}, document, inputs)
+        wall_times.append(time.perf_counter() - start)
+        if result is None:
+            return {'error': log.getvalue().strip() or 'Nenhum resultado retornado'}
+            
+    return _case_record(wall_times, len(text))
+
+
+# Código e recursos lidos por caminho relativo; config/ é copiado (ver _isolated_root)
+ISOLATED_LINKS = ('core', 'engine', 'visuals', 'resources')
+
+
+def _isolated_root(root: Path) -> Path:
+    """
+    Instalação descartável para o pipeline: links para o código, cópia de config/
+
+    O AnalysisRunner resolve projects/results.db, .cache/fulltext/ e
+    .cache/near_duplicates.pkl a partir do diretório atual; rodando aqui,
+    o benchmark nunca grava em projects/ ou .cache/ da instalação real.
+    """
+    for name in ISOLATED_LINKS:
+        (root / name).symlink_to(PROJECT_ROOT / name, target_is_directory=True)
+    shutil.copytree(PROJECT_ROOT / 'config', root / 'config')
+    
+    # Cópias da mesma transcrição sintética seriam todas marcadas como duplicatas
+    config_path = root / 'config' / 'global_config.json'
+    config = json.loads(config_path.read_text(encoding='utf-8'))
+    config.setdefault('system', {})['near_duplicates'] = 'off'
+    config_path.write_text(json.dumps(config, ensure_ascii=False, indent=4), encoding='utf-8')
+    return root
+
+
+def _bench_pipeline(text_path: str, files: int, repeat: int) -> Dict:
+    from core.managers.analysis_runner import AnalysisRunner
+    
+    text_path = Path(text_path)
+    input_chars = len(text_path.read_text(encoding='utf-8')) * files
+    
+    session_root = os.getcwd()
+    wall_times = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory(prefix='bench_root_') as tmp:
+            # Instalação nova a cada repetição: banco e índices começam vazios
+            os.chdir(_isolated_root(Path(tmp)))
+            project = Path(tmp) / 'projects' / 'bench'
+            arquivos = project / 'arquivos'
+            arquivos.mkdir(parents=True)
+            for i in range(files):
+                shutil.copyfile(text_path, arquivos / f'entrevista_{i + 1:02d}.txt')
+                
+            log = io.StringIO()
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(log):
+                runner = AnalysisRunner(jobs=1, use_cache=False)
+                ok = runner.analyze_project(project)
+            wall_times.append(time.perf_counter() - start)
+            os.chdir(session_root)
+            if not ok:
+                lines = log.getvalue().strip().splitlines()
+                return {'error': lines[-1] if lines else 'Falha no pipeline'}
+                
+    return _case_record(wall_times, input_chars, files)
+
+
+def _run_isolated(func, *args) -> Dict:
+    """Executa o caso num processo novo (spawn) para isolar o pico de RSS"""
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        try:
+            return executor.submit(func, *args).result()
+        except Exception as e:
+            return {'error': f"{type(e).__name__}: {e}"}
+
+
+# ---------------------------------------------------------------------------
+# Execução e comparação
+# ---------------------------------------------------------------------------
+
+def available_analyzers() -> List[str]:
+    from core.engine.analysis_orchestrator import AnalysisOrchestrator
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        orchestrator = AnalysisOrchestrator(max_workers=1)
+        return orchestrator._resolve_execution_order()
+
+
+def _run_cases(tmp: Path, sizes: List[str], analyzers: Optional[List[str]], pipeline: bool,
+               pipeline_files: int, repeat: int, speakers: int, lexicon_density: float,
+               seed: int) -> Dict[str, Dict]:
+    """Gera as transcrições em `tmp` e executa cada caso num processo novo"""
+    # Descoberta num processo filho: grava .cache/discovery.json da instalação isolada
+    # sem carregar os analisadores aqui (o pico de RSS do pai passa aos filhos)
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        analyzer_keys = executor.submit(available_analyzers).result()
+    if analyzers:
+        unknown = sorted(set(analyzers) - set(analyzer_keys))
+        if unknown:
+            raise ValueError(f"Analisadores desconhecidos: {', '.join(unknown)}")
+        analyzer_keys = [key for key in analyzer_keys if key in analyzers]
+        
+    cases = {}
+    for size in sizes:
+        size_bytes = parse_size(size)
+        label = format_size(size_bytes)
+        text_path = tmp / f'sintetico_{label}.txt'
+        TranscriptGenerator(speakers, lexicon_density, seed).write(text_path, size_bytes)
+        print(f"\n📄 {label} ({text_path.stat().st_size / 1024:.0f} KB)")
+        
+        planned = [(f"tokenizer@{label}", _bench_tokenizer, (str(text_path), repeat))]
+        planned += [(f"analyzer:{key}@{label}", _bench_analyzer, (key, str(text_path), repeat))
+                    for key in analyzer_keys]
+        if pipeline:
+            planned.append((f"pipeline@{label}", _bench_pipeline,
+                            (str(text_path), pipeline_files, repeat)))
+                            
+        for name, func, args in planned:
+            record = _run_isolated(func, *args)
+            cases[name] = record
+            print(_format_case(name, record))
+            
+    return cases
+
+
+def run_benchmarks(sizes: List[str], analyzers: Optional[List[str]] = None,
+                   pipeline: bool = True, pipeline_files: int = 2, repeat: int = 3,
+                   speakers: int = 2, lexicon_density: float = 0.05, seed: int = 42) -> Dict:
+    """
+    🏁 Executa todos os casos e retorna {'meta': ..., 'cases': {nome: registro}}
+    
+    Os casos rodam a partir de uma instalação isolada (os processos filhos
+    herdam o diretório atual), então nem a descoberta grava em .cache/.
+    """
+    with tempfile.TemporaryDirectory(prefix='bench_corpus_') as tmp:
+        os.chdir(_isolated_root(Path(tmp)))
+        try:
+            cases = _run_cases(Path(tmp), sizes, analyzers, pipeline, pipeline_files, repeat,
+                               speakers, lexicon_density, seed)
+        finally:
+            os.chdir(PROJECT_ROOT)
+            
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'repeat': repeat,
+            'speakers': speakers,
+            'lexicon_density': lexicon_density,
+            'seed': seed,
+            'pipeline_files': pipeline_files
+        },
+        'cases': cases
+    }
+
+
+def compare_with_baseline(current: Dict, baseline: Dict,
+                          tolerance: float = DEFAULT_TOLERANCE) -> List[Dict]:
+    """
+    🔍 Casos que pioraram além da tolerância em relação ao baseline
+    
+    Throughput (chars/s) abaixo de (1 - tolerância) ou pico de RSS acima de
+    (1 + tolerância) do baseline. Casos ausentes de um dos lados são ignorados.
+    """
+    regressions = []
+    
+    for name, record in current.get('cases', {}).items():
+        reference = baseline.get('cases', {}).get(name)
+        if not reference or 'error' in reference:
+            continue
+            
+        if 'error' in record:
+            regressions.append({'case': name, 'metric': 'error', 'detail': record['error']})
+            continue
+            
+        if reference.get('wall_time', 0) >= MIN_COMPARABLE_SECONDS:
+            before, after = reference.get('chars_per_sec'), record.get('chars_per_sec')
+            if before and after and after < before * (1 - tolerance):
+                regressions.append({'case': name, 'metric': 'chars_per_sec',
+                                    'baseline': before, 'current': after,
+                                    'change': round(after / before - 1, 3)})
+                                    
+        before, after = reference.get('peak_rss_kb'), record.get('peak_rss_kb')
+        if before and after and after > before * (1 + tolerance):
+            regressions.append({'case': name, 'metric': 'peak_rss_kb',
+                                'baseline': before, 'current': after,
+                                'change': round(after / before - 1, 3)})
+                                
+    return regressions
+
+
+def _format_case(name: str, record: Dict) -> str:
+    if 'error' in record:
+        return f"   ❌ {name}: {record['error']}"
+    line = (f"   ⏱️  {name:<40} {record['wall_time']:>9.4f}s "
+            f"{record['chars_per_sec'] / 1e6:>8.2f} Mchar/s "
+            f"{record['peak_rss_kb'] / 1024:>8.1f} MB RSS")
+    if name.startswith('pipeline@'):
+        line += f" {record['files_per_sec']:>7.2f} arquivos/s"
+    return line
+
+
+def _write_json(data: Dict, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='🏁 Benchmarks de throughput e memória')
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES,
+                        help='Tamanhos das transcrições sintéticas (ex: 10KB 1MB 100MB)')
+    parser.add_argument('--analyzers', nargs='+', help='Restringir aos analisadores indicados')
+    parser.add_argument('--no-pipeline', action='store_true', help='Não medir o pipeline completo')
+    parser.add_argument('--pipeline-files', type=int, default=2,
+                        help='Arquivos por projeto no caso de pipeline')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetições por caso (vale a melhor)')
+    parser.add_argument('--speakers', type=int, default=2)
+    parser.add_argument('--density', type=float, default=0.05,
+                        help='Fração de palavras vindas dos léxicos de resources/')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', type=Path, default=RESULTS_PATH, help='JSON de resultados')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH, help='JSON de referência')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Piora relativa aceita antes de acusar regressão (0.25 = 25%%)')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Gravar os resultados como novo baseline')
+    args = parser.parse_args()
+    
+    print("🏁 BENCHMARKS")
+    print("=" * 50)
+    
+    results = run_benchmarks(args.sizes, args.analyzers, not args.no_pipeline,
+                             args.pipeline_files, max(1, args.repeat),
+                             args.speakers, args.density, args.seed)
+    _write_json(results, args.output)
+    print(f"\n💾 Resultados: {args.output}")
+    
+    if args.update_baseline:
+        _write_json(results, args.baseline)
+        print(f"📌 Baseline atualizado: {args.baseline}")
+        return 0
+        
+    if not args.baseline.exists():
+        print(f"⚠️ Baseline não encontrado: {args.baseline} (use --update-baseline)")
+        return 0
+        
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+        
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+    if not regressions:
+        print(f"✅ Sem regressões (tolerância {args.tolerance:.0%})")
+        return 0
+        
+    print(f"\n❌ {len(regressions)} regressão(ões) acima de {args.tolerance:.0%}:")
+    for item in regressions:
+        if item['metric'] == 'error':
+            print(f"   • {item['case']}: {item['detail']}")
+        else:
+            print(f"   • {item['case']} {item['metric']}: "
+                  f"{item['baseline']} → {item['current']} ({item['change']:+.0%})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+Gerador de transcrições sintéticas de entrevistas
+
+Produz texto no formato dos projetos ("Entrevistador: ..." / "Participante: ...",
+parágrafos separados por linha em branco) em tamanhos controlados, de poucos KB
+a centenas de MB. A escrita é incremental, então arquivos grandes não passam
+pela memória. Mesma semente → mesmo texto.
+
+Uso:
+    python -m benchmarks.synthetic saida.txt --size 10MB --speakers 3 --density 0.08
+"""
+
+import argparse
+import random
+import re
+from pathlib import Path
+from typing import Iterator, List
+
+from engine.text.lexicons import resource_lexicons
+
+# Vocabulário neutro (conteúdo) usado no preenchimento das frases
+BASE_VOCABULARY = [
+    'escola', 'aluno', 'professor', 'aula', 'curso', 'ensino', 'projeto', 'trabalho',
+    'equipe', 'processo', 'resultado', 'tecnologia', 'sistema', 'dados', 'internet',
+    'aplicativo', 'computador', 'família', 'casa', 'tempo', 'dia', 'pessoa', 'gente',
+    'momento', 'experiência', 'problema', 'solução', 'questão', 'situação', 'exemplo',
+    'forma', 'maneira', 'ponto', 'conhecimento', 'educação', 'pandemia', 'tela',
+    'celular', 'plataforma', 'conteúdo', 'avaliação', 'metodologia', 'comunidade',
+    'infraestrutura', 'adaptação', 'mudança', 'desafio', 'ferramenta', 'turma',
+    'diretor', 'coordenação', 'prova', 'nota', 'atividade', 'material', 'sala',
+    'eu', 'a', 'o', 'de', 'que', 'em', 'um', 'uma', 'para', 'com', 'os', 'as',
+    'na', 'no', 'da', 'do', 'foi', 'era', 'tem', 'tinha', 'ficou', 'vejo', 'acho',
+    'fazer', 'usar', 'aprender', 'ensinar', 'mudar', 'pensar', 'falar', 'começar',
+    'muito', 'pouco', 'mais', 'menos', 'sempre', 'hoje', 'antes', 'depois', 'agora',
+    'ainda', 'também', 'só', 'bem', 'mal', 'todo', 'cada', 'outro', 'mesmo',
+]
+
+QUESTIONS = [
+    'Como foi sua experiência com {0}?',
+    'E o que mudou em relação a {0}?',
+    'Pode falar mais sobre {0}?',
+    'Quais foram os principais desafios com {0}?',
+    'Qual sua visão sobre {0} no futuro?',
+]
+
+SIZE_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([KMG]?B)?\s*$', re.IGNORECASE)
+SIZE_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+
+def parse_size(size: str) -> int:
+    """'10KB', '1.5MB', '2048' → bytes"""
+    match = SIZE_PATTERN.match(str(size))
+    if not match:
+        raise ValueError(f"Tamanho inválido: {size} (ex: 10KB, 1MB)")
+    value, unit = match.groups()
+    return int(float(value) * SIZE_UNITS[(unit or 'B').upper()])
+
+
+def format_size(size_bytes: int) -> str:
+    """bytes → '10KB', '1MB' (rótulo dos casos de benchmark)"""
+    for unit in ('GB', 'MB', 'KB'):
+        if size_bytes >= SIZE_UNITS[unit] and size_bytes % SIZE_UNITS[unit] == 0:
+            return f"{size_bytes // SIZE_UNITS[unit]}{unit}"
+    return f"{size_bytes}B"
+
+
+class TranscriptGenerator:
+    """Gera turnos de entrevista com densidade controlada de termos dos léxicos"""
+    
+    def __init__(self, speakers: int = 2, lexicon_density: float = 0.05, seed: int = 42):
+        if speakers < 1:
+            raise ValueError("É preciso pelo menos 1 participante")
+        if not 0.0 <= lexicon_density <= 1.0:
+            raise ValueError("lexicon_density deve estar entre 0 e 1")
+            
+        self.random = random.Random(seed)
+        self.lexicon_density = lexicon_density
+        self.lexicon_terms: List[str] = sorted({term for terms in resource_lexicons().values()
+                                                for term in terms if not term.endswith('*')})
+        self.vocabulary = BASE_VOCABULARY
+        
+        if speakers == 1:
+            self.participants = ['Participante']
+        else:
+            self.participants = [f'Participante {i}' for i in range(1, speakers + 1)]
+            
+    def _sentence(self) -> str:
+        length = self.random.randint(6, 24)
+        words = [self.random.choice(self.lexicon_terms)
+                 if self.lexicon_terms and self.random.random() < self.lexicon_density
+                 else self.random.choice(self.vocabulary)
+                 for _ in range(length)]
+        sentence = ' '.join(words)
+        punctuation = self.random.choices(['.', '?', '!', '...'], weights=[80, 8, 6, 6])[0]
+        return sentence[0].upper() + sentence[1:] + punctuation
+        
+    def turns(self) -> Iterator[str]:
+        """Turnos infinitos: pergunta do entrevistador + resposta em 1-4 parágrafos"""
+        while True:
+            topic = self.random.choice(self.vocabulary[:56])
+            yield f"Entrevistador: {self.random.choice(QUESTIONS).format(topic)}"
+            
+            speaker = self.random.choice(self.participants)
+            paragraphs = []
+            for _ in range(self.random.randint(1, 4)):
+                paragraphs.append(' '.join(self._sentence() for _ in range(self.random.randint(2, 6))))
+            yield f"{speaker}: " + '\n\n'.join(paragraphs)
+            
+    def write(self, path: Path, size_bytes: int) -> int:
+        """Grava a transcrição incrementalmente até ~size_bytes; retorna bytes escritos"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        written = 0
+        with open(path, 'w', encoding='utf-8') as f:
+            for turn in self.turns():
+                chunk = turn + '\n\n'
+                encoded = len(chunk.encode('utf-8'))
+                if written and written + encoded > size_bytes:
+                    break
+                f.write(chunk)
+                written += encoded
+        return written
+        
+    def generate(self, size_bytes: int) -> str:
+        """Transcrição em memória (para tamanhos pequenos)"""
+        parts, written = [], 0
+        for turn in self.turns():
+            chunk = turn + '\n\n'
+            encoded = len(chunk.encode('utf-8'))
+            if written and written + encoded > size_bytes:
+                break
+            parts.append(chunk)
+            written += encoded
+        return ''.join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='📝 Gera transcrição sintética de entrevista')
+    parser.add_argument('output', type=Path, help='Arquivo .txt de saída')
+    parser.add_argument('--size', default='100KB', help='Tamanho alvo (ex: 10KB, 5MB)')
+    parser.add_argument('--speakers', type=int, default=2, help='Número de participantes')
+    parser.add_argument('--density', type=float, default=0.05,
+                        help='Fração de palavras vindas dos léxicos de resources/')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    generator = TranscriptGenerator(args.speakers, args.density, args.seed)
+    written = generator.write(args.output, parse_size(args.size))
+    print(f"✅ {args.output}: {written / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
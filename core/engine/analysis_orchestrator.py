@@ -10,10 +10,41 @@ Princípio: "Descobre → Mapeia → Executa → Coordena"
 import os
 import importlib
 import inspect
+import re
+import time
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import json
 
+from engine.text.tokenized_document import TokenizedDocument
+from engine.text.speaker_turns import INTERVIEWER_LABELS, SpeakerTurns, StreamScope
+from engine.text.stream_reader import TranscriptStream
+from core.engine.result_cache import ResultCache, hash_text, fingerprint_source
+from core.engine.dag_scheduler import DAGScheduler
+from core.engine.profiler import profiled_call
+from core.engine.discovery import discover_plugins, load_class
+
+
+def support_sources() -> List[Path]:
+    """
+    📚 Código e dados compartilhados pelos analisadores: BaseAnalyzer,
+    engine/text/*.py e os léxicos de resources/ (entram na versão de cada analisador)
+    """
+    sources = [Path("engine/analyzers/__init__.py"), Path("engine/analyzers/base_analyzer.py")]
+    sources.extend(sorted(Path("engine/text").glob("*.py")))
+    sources.extend(sorted(path for path in Path("resources").glob("*") if path.is_file()))
+    return sources
+
+
+def _run_analyzer_in_process(module_name: str, class_name: str, text: str, inputs: Dict,
+                             config: Dict = None) -> Optional[Dict]:
+    """🧵 Executa um analisador em processo separado (modo 'process', opt-in por config)"""
+    module = importlib.import_module(module_name)
+    analyzer = getattr(module, class_name)()
+    analyzer.config = config or {}
+    return analyzer.analyze(text, **inputs)
+
+
 class AnalysisOrchestrator:
     """
     🎯 Orquestrador que descobre e coordena automaticamente todas as análises
@@ -26,57 +57,109 @@ class AnalysisOrchestrator:
     - Zero código hardcoded para análises
     """
     
-    def __init__(self, config_path: str = "config/analysis_configs"):
+    def __init__(self, config_path: str = "config/analysis_configs", max_workers: int = 4,
+                 streaming_threshold_mb: Optional[float] = None, stream_unit: str = 'paragraph'):
         self.config_path = Path(config_path)
         self.analyzers = {}
         self.dependencies = {}
+        self.injections = {}
         self.results_cache = {}
         
+        # Objetos de escopo do projeto injetados por nome em analyze() (ex: topic_model),
+        # definidos pelo AnalysisRunner; cada um expõe `signature` para cache e manifesto
+        self.shared_inputs: Dict[str, Any] = {}
+        
+        # Turnos de fala: 'respondent' entrega aos analisadores só as falas dos
+        # respondentes (documentos sem entrevistador identificado ficam inteiros)
+        self.speaker_scope = 'all'
+        self.interviewer_labels = list(INTERVIEWER_LABELS)
+        
+        # Cache persistente em disco (opcional, definido pelo AnalysisRunner)
+        self.disk_cache: Optional[ResultCache] = None
+        
+        # Agendador concorrente do DAG de dependências
+        self.scheduler = DAGScheduler(max_threads=max_workers)
+        
+        # Arquivos acima do limite são lidos em blocos (None = nunca automático)
+        self.streaming_threshold_mb = streaming_threshold_mb
+        self.stream_unit = stream_unit
+        
+        # Instrumentação: memória via tracemalloc e dumps cProfile opcionais
+        self.profile_memory = False
+        self.cprofile_dir: Optional[Path] = None
+        
         # Auto-descoberta revolucionária
         self._discover_analyzers()
         self._map_dependencies()
         
     def _discover_analyzers(self):
-        """🔍 Auto-descoberta de todos os analisadores disponíveis"""
+        """🔍 Auto-descoberta de todos os analisadores disponíveis (via manifesto, sem importar)"""
         analyzers_dir = Path("engine/analyzers")
         
         if not analyzers_dir.exists():
             print("⚠️  Diretório engine/analyzers não encontrado")
             return
             
-        # Percorrer todos os arquivos Python
-        for py_file in analyzers_dir.glob("*.py"):
-            if py_file.name.startswith("_") or py_file.name == "__init__.py":
-                continue
-                
-            try:
-                # Importar módulo dinamicamente
-                module_name = f"engine.analyzers.{py_file.stem}"
-                module = importlib.import_module(module_name)
-                
-                # Encontrar classes que terminam com 'Analyzer'
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if name.endswith('Analyzer') and not name.startswith('_') and name != 'BaseAnalyzer':
-                        analyzer_key = self._get_analyzer_key(name)
-                        self.analyzers[analyzer_key] = {
-                            'class': obj,
-                            'name': name,
-                            'module': module_name,
-                            'config': self._load_config(analyzer_key)
-                        }
-                        
-            except Exception as e:
-                print(f"⚠️  Erro ao carregar analisador de {py_file}: {e}")
-                
+        # Classes terminadas em 'Analyzer'; módulos só são importados quando alterados
+        discovered = discover_plugins(
+            "engine.analyzers", analyzers_dir,
+            predicate=lambda name, obj: (name.endswith('Analyzer') and not name.startswith('_')
+                                         and name != 'BaseAnalyzer'),
+            describe=self._describe_analyzer
+        )
+        
+        # Helpers e léxicos mudam o resultado tanto quanto o próprio analisador
+        support = fingerprint_source(*support_sources())
+        
+        for name, info in sorted(discovered.items(), key=lambda item: item[1]['file']):
+            analyzer_key = self._get_analyzer_key(name)
+            self.analyzers[analyzer_key] = {
+                'class': None,  # importada sob demanda (ver _analyzer_class)
+                'name': name,
+                'module': info['module'],
+                'declared_dependencies': info.get('dependencies') or {},
+                'streaming': info.get('streaming', False),
+                'config': self._load_config(analyzer_key),
+                'fingerprint': fingerprint_source(info['file']) + support
+            }
+            
         print(f"🎯 AnalysisOrchestrator: Descobertos {len(self.analyzers)} analisadores:")
         for key in self.analyzers.keys():
             print(f"   ✅ {key}")
     
+    @staticmethod
+    def _describe_analyzer(analyzer_class) -> Dict:
+        """📋 Metadados guardados no manifesto (consultados sem importar o módulo)"""
+        description = {'dependencies': {}, 'streaming': False}
+        if hasattr(analyzer_class, 'get_dependencies'):
+            try:
+                description['dependencies'] = analyzer_class.get_dependencies() or {}
+            except Exception as e:
+                print(f"⚠️  Erro ao obter dependências de {analyzer_class.__name__}: {e}")
+        if hasattr(analyzer_class, 'supports_streaming'):
+            description['streaming'] = bool(analyzer_class.supports_streaming())
+        return description
+    
+    def _analyzer_class(self, analyzer_key: str):
+        """📦 Classe do analisador, importada na primeira vez que é agendado"""
+        analyzer_info = self.analyzers[analyzer_key]
+        if analyzer_info['class'] is None:
+            analyzer_info['class'] = load_class(analyzer_info)
+        return analyzer_info['class']
+    
+    def _load_analyzer_classes(self, analyzer_keys: List[str]):
+        """📦 Importa de uma vez (thread principal) as classes ainda não carregadas"""
+        for analyzer_key in analyzer_keys:
+            try:
+                self._analyzer_class(analyzer_key)
+            except Exception as e:
+                # Erro reaparece (e é tratado) na execução do analisador
+                print(f"⚠️  Erro ao importar {analyzer_key}: {e}")
+    
     def _get_analyzer_key(self, class_name: str) -> str:
         """🔑 Converter nome da classe para chave de análise"""
         key = class_name.replace('Analyzer', '')
         # Converter CamelCase para snake_case
-        import re
         key = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', key)
         key = re.sub('([a-z0-9])([A-Z])', r'\1_\2', key).lower()
         return key
@@ -98,21 +181,22 @@ class AnalysisOrchestrator:
         """🗺️ Mapear dependências entre analisadores"""
         for key, analyzer_info in self.analyzers.items():
             deps = []
+            injections = {}
             
-            # Verificar se o analisador usa resultados de outros
-            analyzer_class = analyzer_info['class']
-            
-            # Verificar método analyze para dependencies
-            if hasattr(analyzer_class, 'analyze'):
-                try:
-                    # Instanciar temporariamente para verificar dependências
-                    temp_instance = analyzer_class()
-                    if hasattr(temp_instance, 'get_dependencies'):
-                        deps = temp_instance.get_dependencies()
-                except:
-                    pass
+            # Dependências declaradas na classe (lidas do manifesto, sem importar)
+            declared = analyzer_info['declared_dependencies']
+            if isinstance(declared, dict):
+                # {'parametro': {'analyzer': ..., 'result_key': ...}}
+                injections = declared
+                for spec in declared.values():
+                    if spec.get('analyzer') not in deps:
+                        deps.append(spec.get('analyzer'))
+            else:
+                # Formato antigo: lista de chaves (apenas ordenação)
+                deps = list(declared)
             
             self.dependencies[key] = deps
+            self.injections[key] = injections
             
         print(f"🗺️  Dependências mapeadas:")
         for key, deps in self.dependencies.items():
@@ -140,15 +224,24 @@ class AnalysisOrchestrator:
         return config
 
     
-    def analyze_transcript(self, file_path: Path, config: Dict = None) -> Dict[str, Any]:
+    def analyze_transcript(self, file_path: Path, config: Dict = None,
+                           streaming: Optional[bool] = None) -> Dict[str, Any]:
         """
         🎯 MÉTODO PRINCIPAL - Substitui TranscriptAnalyzer.analyze_transcript()
         
         REVOLUÇÃO: Uma linha substitui centenas de linhas hardcoded!
+        
+        streaming: True força leitura em blocos, False desativa; None decide
+        pelo tamanho do arquivo (streaming_threshold_mb)
         """
         
         print(f"\n🎭 AnalysisOrchestrator: Coordenando análise de {file_path.name}")
         
+        if streaming is None:
+            streaming = self._should_stream(file_path)
+        if streaming:
+            return self.analyze_stream(file_path, config)
+        
         # Ler texto do arquivo
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -160,7 +253,7 @@ class AnalysisOrchestrator:
         print(f"📄 Texto carregado: {len(text)} caracteres")
         
         # Executar orquestração completa
-        results = self.analyze(text, config or {})
+        results = self.analyze(text, config or {}, profile_label=file_path.stem)
         
         # Adicionar metadados
         results.update({
@@ -173,7 +266,7 @@ class AnalysisOrchestrator:
         
         return results
     
-    def analyze(self, text: str, config: Dict = None) -> Dict[str, Any]:
+    def analyze(self, text: str, config: Dict = None, profile_label: str = 'texto') -> Dict[str, Any]:
         """🎯 Coordena execução de todas as análises"""
         
         print(f"\n🎭 AnalysisOrchestrator: Iniciando coordenação de {len(self.analyzers)} análises...")
@@ -184,41 +277,252 @@ class AnalysisOrchestrator:
         # Configuração global + específica
         final_config = config or {}
         
+        # Tokenização e turnos únicos compartilhados (criados só se algum analisador precisar rodar)
+        shared = {'document': None, 'turns': None}
+        text_hash = hash_text(text) if self.disk_cache else None
+        pending_cache_keys = {}
+        profile = {}
+        
         # Executar análises respeitando dependências
         execution_order = self._resolve_execution_order()
         
-        results = {}
-        successful_analyses = 0
+        def resolve(analyzer_key):
+            """Chamado quando as dependências do analisador terminaram"""
+            if self.disk_cache:
+                cache_key = self._cache_key(analyzer_key, text_hash, final_config)
+                cached = self.disk_cache.get(cache_key)
+                if cached is not None:
+                    print(f"   💾 {analyzer_key}: Recuperado do cache")
+                    profile[analyzer_key] = {'cached': True, 'input_chars': len(text)}
+                    return ('done', cached)
+                pending_cache_keys[analyzer_key] = cache_key
+            
+            print(f"   🔄 Executando: {analyzer_key}")
+            
+            if shared['document'] is None:
+                document = TokenizedDocument(text)
+                print(f"   🔤 Documento tokenizado: {document.token_count} tokens, "
+                      f"{document.sentence_count} sentenças, {document.paragraph_count} parágrafos")
+                turns = shared['turns'] = SpeakerTurns.parse(document, self.interviewer_labels)
+                shared['document'] = self.scope_document(document, turns)
+                if turns.turn_count:
+                    print(f"   🗣️  Turnos: {turns.turn_count} ({', '.join(turns.speakers)})")
+                if shared['document'] is not document:
+                    print(f"   🗣️  Só respondentes: {shared['document'].token_count}/"
+                          f"{document.token_count} tokens")
+            
+            inputs = self._prepare_inputs(analyzer_key, shared['document'], shared['turns'], final_config)
+            analyzer_info = self.analyzers[analyzer_key]
+            
+            cprofile_path = None
+            if self.cprofile_dir:
+                cprofile_path = str(Path(self.cprofile_dir) / f"{profile_label}.{analyzer_key}.prof")
+            
+            if self._execution_mode(analyzer_key) == 'process':
+                call = (_run_analyzer_in_process,
+                        (analyzer_info['module'], analyzer_info['name'], text, inputs,
+                         self.analyzer_settings(analyzer_key, final_config)))
+                mode = 'process'
+            else:
+                call = (self._execute_analyzer,
+                        (analyzer_key, text, final_config, shared['document'], inputs))
+                mode = 'thread'
+            
+            # O pico do tracemalloc é global ao processo: analisadores em threads
+            # só são medidos quando rodam um de cada vez
+            track_memory = self.profile_memory and (mode == 'process' or self.scheduler.max_threads == 1)
+            return (mode, profiled_call, (*call, len(text), track_memory, cprofile_path))
         
-        for analyzer_key in execution_order:
-            try:
-                print(f"   🔄 Executando: {analyzer_key}")
+        def on_complete(analyzer_key, result):
+            """Registra o resultado (thread principal) para liberar dependentes"""
+            if isinstance(result, Exception):
+                print(f"   ❌ {analyzer_key}: Erro - {result}")
+                return
+            
+            # Execuções instrumentadas retornam (resultado, medições)
+            if analyzer_key not in profile:
+                result, profile[analyzer_key] = result
+            
+            if result:
+                self.results_cache[analyzer_key] = result
                 
-                result = self._execute_analyzer(analyzer_key, text, final_config)
+                cache_key = pending_cache_keys.get(analyzer_key)
+                if cache_key:
+                    self.disk_cache.put(cache_key, result)
                 
-                if result:
-                    results[analyzer_key] = result
-                    self.results_cache[analyzer_key] = result
-                    
-                    # CORREÇÃO: Expor dados internos no nível raiz para os gráficos
-                    if isinstance(result, dict):
-                        for key, value in result.items():
-                            if key not in ['analysis_type', 'calibration_used']:
-                                results[key] = value
-                    
-                    successful_analyses += 1
-                    print(f"   ✅ {analyzer_key}: Concluído")
-                else:
-                    print(f"   ⚠️  {analyzer_key}: Sem resultados")
-                    
+                print(f"   ✅ {analyzer_key}: Concluído")
+            else:
+                print(f"   ⚠️  {analyzer_key}: Sem resultados")
+        
+        # Importar os analisadores agendados antes de iniciar as threads: importações
+        # de extensões C (numpy/scipy/sklearn) concorrentes com análises em curso
+        # não são seguras
+        self._load_analyzer_classes(execution_order)
+        
+        timeline = self.scheduler.run(execution_order, self.dependencies, resolve, on_complete)
+        
+        # Montar resultado na ordem topológica (determinístico mesmo com execução concorrente)
+        results, successful_analyses = self._collect_results(execution_order)
+        results['_schedule'] = timeline
+        
+        for analyzer_key, record in profile.items():
+            record['mode'] = timeline.get(analyzer_key, {}).get('mode')
+        results['_profile'] = {
+            'input_chars': len(text),
+            'wall_time': round(self.scheduler.makespan(timeline), 6),
+            'analyzers': profile
+        }
+        
+        total_work = sum(t['end'] - t['start'] for t in timeline.values())
+        print(f"\n🎯 AnalysisOrchestrator: {successful_analyses}/{len(self.analyzers)} análises concluídas!")
+        print(f"⏱️  Tempo do DAG: {self.scheduler.makespan(timeline):.3f}s "
+              f"(soma dos analisadores: {total_work:.3f}s)")
+        
+        return results
+    
+    def analyze_stream(self, file_path: Path, config: Dict = None) -> Dict[str, Any]:
+        """
+        🌊 Análise em streaming para arquivos muito longos
+        
+        O arquivo é lido em blocos e cada segmento é tokenizado e entregue aos
+        analisadores com supports_streaming(); o texto inteiro nunca fica em
+        memória. Os demais analisadores precisam do texto completo e são pulados.
+        Com speaker_scope 'respondent' o recorte é aplicado a cada segmento
+        (StreamScope carrega o turno em aberto de um segmento para o próximo).
+        """
+        
+        try:
+            stream = TranscriptStream(file_path, unit=self.stream_unit)
+        except Exception as e:
+            print(f"❌ Erro ao ler arquivo {file_path}: {e}")
+            return {}
+        
+        print(f"🌊 Leitura em streaming: {stream.size_bytes / (1024 * 1024):.1f} MB "
+              f"em segmentos ({stream.unit})")
+        
+        stream_start = time.perf_counter()
+        self.results_cache = {}
+        execution_order = self._resolve_execution_order()
+        
+        consumers = {}
+        profile = {}
+        
+        def timed(analyzer_key, func, *args, **kwargs):
+            """Acumula tempo de relógio e de CPU de cada analisador ao longo do stream"""
+            record = profile.setdefault(analyzer_key, {
+                'wall_time': 0.0, 'cpu_time': 0.0, 'peak_memory_kb': None,
+                'input_chars': 0, 'mode': 'stream'
+            })
+            wall_start, cpu_start = time.perf_counter(), time.thread_time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record['wall_time'] += time.perf_counter() - wall_start
+                record['cpu_time'] += time.thread_time() - cpu_start
+        
+        for analyzer_key in execution_order:
+            if not self.analyzers[analyzer_key]['streaming']:
+                print(f"   ⏭️  {analyzer_key}: Sem suporte a streaming (pulado)")
+                continue
+            
+            try:
+                analyzer = self.create_analyzer(analyzer_key, config)
+                # Só dependências 'instance' (analisadores configurados): não há resultados upstream
+                upstream = self._accepted_kwargs(analyzer.begin_stream,
+                                                 self._dependency_inputs(analyzer_key, config))
+                timed(analyzer_key, analyzer.begin_stream, stream.size_bytes, **upstream)
+                consumers[analyzer_key] = analyzer
+            except Exception as e:
+                print(f"   ❌ {analyzer_key}: Erro - {e}")
+        
+        scope = StreamScope(self.interviewer_labels) if self.speaker_scope == 'respondent' else None
+        
+        # Uma única passada pelo arquivo alimenta todos os analisadores
+        for segment, position in stream:
+            document = TokenizedDocument(segment)
+            if scope is not None:
+                document = scope.select(document)
+            for analyzer_key, analyzer in list(consumers.items()):
+                try:
+                    timed(analyzer_key, analyzer.consume, document, position)
+                    profile[analyzer_key]['input_chars'] += len(segment)
+                except Exception as e:
+                    print(f"   ❌ {analyzer_key}: Erro - {e}")
+                    del consumers[analyzer_key]
+        
+        for analyzer_key, analyzer in consumers.items():
+            try:
+                result = timed(analyzer_key, analyzer.end_stream)
             except Exception as e:
                 print(f"   ❌ {analyzer_key}: Erro - {e}")
                 continue
+            
+            if result:
+                self.results_cache[analyzer_key] = result
+                print(f"   ✅ {analyzer_key}: Concluído")
         
-        print(f"\n🎯 AnalysisOrchestrator: {successful_analyses}/{len(self.analyzers)} análises concluídas!")
+        results, successful_analyses = self._collect_results(execution_order)
+        print(f"\n🎯 AnalysisOrchestrator: {successful_analyses}/{len(self.analyzers)} análises concluídas "
+              f"({stream.segments_read} segmentos)")
+        
+        results.update({
+            'filename': file_path.name,
+            'file_path': str(file_path),
+            'text_length': stream.chars_read,
+            'analysis_timestamp': str(Path(file_path).stat().st_mtime),
+            'orchestrator_version': '2.0',
+            'ingestion': 'stream',
+            '_profile': {
+                'input_chars': stream.chars_read,
+                'wall_time': round(time.perf_counter() - stream_start, 6),
+                'analyzers': {key: {**record,
+                                    'wall_time': round(record['wall_time'], 6),
+                                    'cpu_time': round(record['cpu_time'], 6)}
+                              for key, record in profile.items()}
+            }
+        })
         
         return results
     
+    def scope_document(self, document: TokenizedDocument, turns: SpeakerTurns = None) -> TokenizedDocument:
+        """🗣️ Documento entregue aos analisadores conforme speaker_scope (view sem cópia de texto)"""
+        if self.speaker_scope != 'respondent':
+            return document
+        turns = turns or SpeakerTurns.parse(document, self.interviewer_labels)
+        return turns.select(role='respondent') if turns.has_roles else document
+    
+    def _should_stream(self, file_path: Path) -> bool:
+        """📏 Arquivo acima do limite configurado?"""
+        if self.streaming_threshold_mb is None:
+            return False
+        try:
+            size = Path(file_path).stat().st_size
+        except OSError:
+            return False
+        return size > self.streaming_threshold_mb * 1024 * 1024
+    
+    def _collect_results(self, execution_order: List[str]) -> Tuple[Dict[str, Any], int]:
+        """📦 Resultados na ordem topológica, com dados internos expostos no nível raiz"""
+        results = {}
+        successful_analyses = 0
+        
+        for analyzer_key in execution_order:
+            result = self.results_cache.get(analyzer_key)
+            if not result:
+                continue
+            
+            results[analyzer_key] = result
+            
+            # CORREÇÃO: Expor dados internos no nível raiz para os gráficos
+            if isinstance(result, dict):
+                for key, value in result.items():
+                    if key not in ['analysis_type', 'calibration_used']:
+                        results[key] = value
+            
+            successful_analyses += 1
+        
+        return results, successful_analyses
+    
     def _resolve_execution_order(self) -> List[str]:
         """📊 Resolver ordem de execução baseada em dependências"""
         
@@ -252,31 +556,75 @@ class AnalysisOrchestrator:
         print(f"📊 Ordem de execução resolvida: {order}")
         return order
     
-    def _execute_analyzer(self, analyzer_key: str, text: str, config: Dict) -> Optional[Dict]:
-        """🚀 Executar um analisador específico"""
-        
+    def _cache_key(self, analyzer_key: str, text_hash: str, config: Dict) -> str:
+        """🔑 Chave de cache: texto + analisador + versão do código + config efetiva"""
         analyzer_info = self.analyzers[analyzer_key]
-        analyzer_class = analyzer_info['class']
-        analyzer_config = analyzer_info['config']
         
-        # Mesclar configurações: global + específica do analisador
-        final_config = {**config, **analyzer_config}
+        return self.disk_cache.make_key(
+            text_hash,
+            f"{analyzer_info['module']}.{analyzer_info['name']}",
+            analyzer_info['fingerprint'],
+            {**config, **analyzer_info['config']},
+            self._upstream_fingerprints(analyzer_key),
+            {**self._shared_signatures(analyzer_key), **self.speaker_signature()}
+        )
+    
+    def _shared_signatures(self, analyzer_key: str) -> Dict[str, Any]:
+        """🧬 Assinaturas das entradas de projeto que o analisador recebe"""
+        accepted = self._accepted_kwargs(self._analyzer_class(analyzer_key).analyze, self.shared_inputs)
+        return {name: getattr(value, 'signature', None) for name, value in sorted(accepted.items())}
+    
+    def speaker_signature(self) -> Dict[str, Any]:
+        """🧬 Configuração de turnos que altera o documento entregue aos analisadores"""
+        return {'speaker_scope': self.speaker_scope,
+                'interviewer_labels': sorted(label.lower() for label in self.interviewer_labels)}
+    
+    def _upstream_fingerprints(self, analyzer_key: str, seen: set = None) -> List[str]:
+        """🧬 Versões de todas as dependências (transitivas) de um analisador"""
+        seen = seen if seen is not None else set()
+        fingerprints = []
+        
+        for dep in self.dependencies.get(analyzer_key, []):
+            if dep in seen or dep not in self.analyzers:
+                continue
+            seen.add(dep)
+            # Config do upstream muda os valores injetados (resultados ou analisador configurado)
+            dep_config = hash_text(json.dumps(self.analyzers[dep]['config'], sort_keys=True, default=str))
+            fingerprints.append(f"{dep}:{self.analyzers[dep]['fingerprint']}:{dep_config[:16]}")
+            fingerprints.extend(self._upstream_fingerprints(dep, seen))
+        
+        return fingerprints
+    
+    def _execution_mode(self, analyzer_key: str) -> str:
+        """⚙️ Modo de execução do analisador: 'thread' (padrão) ou 'process' (opt-in no config JSON)"""
+        mode = self.analyzers[analyzer_key]['config'].get('execution_mode', 'thread')
+        return mode if mode in ('thread', 'process') else 'thread'
+    
+    def _prepare_inputs(self, analyzer_key: str, document: TokenizedDocument = None,
+                        turns: SpeakerTurns = None, config: Dict = None) -> Dict[str, Any]:
+        """📦 Argumentos nomeados do analisador: documento e turnos compartilhados + dependências"""
+        candidates = {'document': document, 'turns': turns, **self.shared_inputs}
+        candidates.update(self._dependency_inputs(analyzer_key, config))
+        
+        analyzer_class = self._analyzer_class(analyzer_key)
+        return self._accepted_kwargs(analyzer_class.analyze, candidates)
+    
+    def _execute_analyzer(self, analyzer_key: str, text: str, config: Dict,
+                          document: TokenizedDocument = None,
+                          inputs: Dict[str, Any] = None) -> Optional[Dict]:
+        """🚀 Executar um analisador específico"""
         
         try:
-            # Instanciar analisador
-            analyzer = analyzer_class()
-            
-            # Preparar dados de entrada
-            input_data = {'text': text, 'config': final_config}
+            # Instanciar analisador (importado sob demanda) com a configuração mesclada
+            analyzer = self.create_analyzer(analyzer_key, config)
             
-            # Adicionar resultados de dependências
-            for dep_key in self.dependencies.get(analyzer_key, []):
-                if dep_key in self.results_cache:
-                    input_data[dep_key] = self.results_cache[dep_key]
+            # Preparar argumentos: documento compartilhado + resultados de dependências
+            if inputs is None:
+                inputs = self._prepare_inputs(analyzer_key, document, config=config)
             
             # Executar análise
             if hasattr(analyzer, 'analyze'):
-                result = analyzer.analyze(text)
+                result = analyzer.analyze(text, **inputs)
                 return result
             else:
                 print(f"⚠️  {analyzer_key}: Método 'analyze' não encontrado")
@@ -286,6 +634,65 @@ class AnalysisOrchestrator:
             print(f"❌ Erro na execução de {analyzer_key}: {e}")
             return None
     
+    def analyzer_settings(self, analyzer_key: str, config: Dict = None) -> Dict[str, Any]:
+        """
+        ⚙️ Configuração entregue ao analisador (BaseAnalyzer.config)
+        
+        Global + JSON do analisador; a seção "parameters" também vai para o
+        nível raiz, onde os analisadores leem seus ajustes (self.config.get).
+        """
+        analyzer_config = self.analyzers[analyzer_key]['config']
+        return {**(config or {}), **analyzer_config, **analyzer_config.get('parameters', {})}
+    
+    def create_analyzer(self, analyzer_key: str, config: Dict = None):
+        """🏗️ Instância do analisador já configurada"""
+        analyzer = self._analyzer_class(analyzer_key)()
+        analyzer.config = self.analyzer_settings(analyzer_key, config)
+        return analyzer
+    
+    def _dependency_inputs(self, analyzer_key: str, config: Dict = None) -> Dict[str, Any]:
+        """🔗 Extrair dos resultados já calculados os valores declarados em get_dependencies"""
+        inputs = {}
+        
+        for param, spec in self.injections.get(analyzer_key, {}).items():
+            # 'instance': o próprio analisador upstream, com a configuração do orquestrador
+            if spec.get('instance'):
+                if spec.get('analyzer') in self.analyzers:
+                    inputs[param] = self.create_analyzer(spec['analyzer'], config)
+                continue
+            
+            upstream = self.results_cache.get(spec.get('analyzer'))
+            if not isinstance(upstream, dict):
+                continue
+            
+            result_key = spec.get('result_key')
+            inputs[param] = upstream.get(result_key) if result_key else upstream
+        
+        return inputs
+    
+    @staticmethod
+    def _accepted_kwargs(method, candidates: Dict[str, Any]) -> Dict[str, Any]:
+        """🔌 Filtrar argumentos opcionais pelos parâmetros que o método aceita"""
+        try:
+            params = inspect.signature(method).parameters
+        except (TypeError, ValueError):
+            return {}
+        
+        return {name: value for name, value in candidates.items()
+                if name in params and value is not None}
+    
+    def close(self):
+        """🔒 Encerrar pools de execução do agendador"""
+        self.scheduler.close()
+    
+    def get_signature(self, config: Dict = None) -> str:
+        """🧬 Impressão digital da análise: versão e configuração de cada analisador"""
+        parts = [(key, info['fingerprint'], info['config']) for key, info in sorted(self.analyzers.items())]
+        shared = {name: getattr(value, 'signature', None) for name, value in sorted(self.shared_inputs.items())}
+        payload = json.dumps([parts, config or {}, shared, self.speaker_signature()],
+                             sort_keys=True, default=str)
+        return hash_text(payload)[:16]
+    
     def get_available_analyzers(self) -> List[str]:
         """📋 Listar analisadores disponíveis"""
         return list(self.analyzers.keys())
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 
+from engine.text.pattern_matcher import get_matcher
 from .analyzers.word_frequency import WordFrequencyAnalyzer
 from .analyzers.temporal_analysis import TemporalAnalysisAnalyzer
 from .analyzers.global_metrics import GlobalMetricsAnalyzer
@@ -150,16 +151,23 @@ class TranscriptAnalyzer:
         # Hesitações
         hesitation_words = ['né', 'tipo', 'assim', 'então', 'eh', 'ah', 'uhm', 'ahn']
         
-        # Contar ocorrências
-        certainty_count = sum(1 for phrase in certainty_phrases if phrase in text_lower)
-        uncertainty_count = sum(1 for phrase in uncertainty_phrases if phrase in text_lower)
+        # Contar ocorrências (todas as categorias em uma única passada)
+        matches = get_matcher({
+            'certainty': certainty_phrases,
+            'uncertainty': uncertainty_phrases,
+            'hesitation': hesitation_words
+        }).scan(text)
+        certainty_found = matches.present('certainty')
+        uncertainty_found = matches.present('uncertainty')
+        certainty_count = len(certainty_found)
+        uncertainty_count = len(uncertainty_found)
         
         # Hesitações por palavra
+        hesitation_counts = matches.by_pattern('hesitation')
         hesitations_by_word = {}
         total_hesitations = 0
         
-        for word in hesitation_words:
-            count = text_lower.count(word)
+        for word, count in hesitation_counts.items():
             if count > 0:
                 hesitations_by_word[word] = {
                     'count': count,
@@ -175,17 +183,17 @@ class TranscriptAnalyzer:
         return {
             'certainty_markers': {
                 'count': certainty_count,
-                'examples': [p for p in certainty_phrases if p in text_lower][:5],
+                'examples': certainty_found[:5],
                 'percentage': (certainty_count / len(sentences)) * 100 if sentences else 0
             },
             'uncertainty_markers': {
                 'count': uncertainty_count,
-                'examples': [p for p in uncertainty_phrases if p in text_lower][:5],
+                'examples': uncertainty_found[:5],
                 'percentage': (uncertainty_count / len(sentences)) * 100 if sentences else 0,
                 'ratio_to_certainty': uncertainty_count / certainty_count if certainty_count > 0 else uncertainty_count
             },
             'hesitations_by_word': hesitations_by_word,
-            'hesitation_phrases': {word: text_lower.count(word) for word in hesitation_words if text_lower.count(word) > 0},
+            'hesitation_phrases': hesitation_counts,
             'total_hesitations': total_hesitations,
             'avg_sentence_length': round(avg_sentence_length, 1),
             'sentence_length_std': round(np.std(sentence_lengths), 1) if len(sentence_lengths) > 1 else 0,
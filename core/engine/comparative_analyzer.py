@@ -1,28 +1,210 @@
-"""🔄 Analisador comparativo entre projetos"""
+"""🔄 Analisador comparativo entre projetos
 
-from typing import Dict, List, Any
+Todas as transcrições dos projetos comparados são vetorizadas uma única vez
+(TF-IDF esparso, vocabulário comum) e as matrizes cosseno/Jaccard de todos os
+pares saem de um produto esparso em blocos (engine/text/similarity.py). As
+matrizes N × N são gravadas em .npy ao lado do JSON, que guarda só as médias
+por projeto e os pares mais próximos.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+from core.managers.duplicate_index import DUPLICATE_INDEX_PATH, DuplicateIndex
+from engine.text.similarity import (DEFAULT_BLOCK_ROWS, cosine_matrix, group_means,
+                                    jaccard_matrix, term_counts, tfidf)
+
+GLOBAL_CONFIG_PATH = Path("config/global_config.json")
 
 
 class ComparativeAnalyzer:
     """Análise comparativa entre múltiplos projetos"""
     
-    def __init__(self):
-        print("🔄 ComparativeAnalyzer inicializado")
+    TOP_PAIRS = 10
+    TOP_TERMS = 10
     
-    def compare_projects(self, all_results: List[Dict]) -> Dict[str, Any]:
-        """Compara resultados de múltiplos projetos"""
+    def __init__(self, block_rows: Optional[int] = None, min_word_length: int = 3):
+        system = self._load_system_config()
+        self.block_rows = block_rows or system.get('comparison_block_rows') or DEFAULT_BLOCK_ROWS
+        self.min_word_length = min_word_length
+        
+        # Entrevistas históricas semelhantes: índice MinHash/LSH da instalação
+        self.history_enabled = system.get('near_duplicates', 'flag') != 'off'
+        self.history_threshold = system.get('history_similarity_threshold', 0.5)
+        self.minhash_settings = {'num_perm': system.get('minhash_permutations', 128),
+                                 'bands': system.get('lsh_bands', 32)}
+        print("🔄 ComparativeAnalyzer inicializado")
+        
+    def _load_system_config(self) -> Dict:
+        """Seção "system" de config/global_config.json (vazia se ausente)"""
+        try:
+            with open(GLOBAL_CONFIG_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f).get('system', {})
+        except Exception:
+            return {}
+            
+    def compare_projects(self, projects: Dict[str, List[Path]]) -> Dict[str, Any]:
+        """
+        Compara as transcrições de vários projetos
+        
+        projects: nome do projeto → arquivos .txt
+        """
+        names = list(projects)
+        files = [(name, Path(path)) for name in names for path in projects[name]]
+        print(f"📊 Comparando {len(files)} transcrições de {len(names)} projetos")
+        
+        counts, vocabulary = term_counts((path for _, path in files), self.min_word_length)
+        vectors = tfidf(counts)
+        cosine = cosine_matrix(vectors, self.block_rows)
+        jaccard = jaccard_matrix(counts, self.block_rows)
         
-        print(f"📊 Comparando {len(all_results)} resultados")
+        groups = np.asarray([names.index(name) for name, _ in files], dtype=np.int64)
+        project_cosine = group_means(cosine, groups, len(names))
+        project_jaccard = group_means(jaccard, groups, len(names))
         
-        # Análise comparativa simulada
         comparison = {
-            "projects_compared": len(set(r.get('project', 'unknown') for r in all_results)),
-            "total_files": len(all_results),
-            "avg_sentiment": sum(r['global_metrics']['global_sentiment'] for r in all_results) / len(all_results),
-            "avg_coherence": sum(r['global_metrics']['thematic_coherence'] for r in all_results) / len(all_results),
-            "similarity_matrix": [],
+            "projects_compared": len(names),
+            "total_files": len(files),
+            "vocabulary_size": len(vocabulary),
+            "files": [{"project": name, "file": path.name} for name, path in files],
+            # Linhas/colunas na ordem de "files"; save() grava cada uma em .npy
+            "matrices": {"cosine": cosine, "jaccard": jaccard},
+            "project_similarity": {
+                "projects": names,
+                "cosine": self._rounded(project_cosine),
+                "jaccard": self._rounded(project_jaccard)
+            },
+            "most_similar_pairs": self._most_similar_pairs(cosine, jaccard, groups, files),
             "common_themes": [],
-            "distinctive_features": {}
+            "distinctive_features": {},
+            "historical_matches": self._historical_matches(files, names) if self.history_enabled else {}
         }
         
+        if vocabulary:
+            centroids = np.vstack([np.asarray(vectors[groups == g].mean(axis=0)).ravel()
+                                   for g in range(len(names))])
+            comparison["common_themes"] = self._common_themes(centroids, vocabulary)
+            comparison["distinctive_features"] = self._distinctive_features(centroids, vocabulary, names)
+            
         return comparison
+        
+    @staticmethod
+    def _rounded(matrix: np.ndarray) -> List[List[Optional[float]]]:
+        """Matriz → listas JSON (NaN vira None)"""
+        return [[None if np.isnan(value) else round(float(value), 4) for value in row]
+                for row in matrix]
+                
+    def _most_similar_pairs(self, cosine: np.ndarray, jaccard: np.ndarray, groups: np.ndarray,
+                            files: List) -> List[Dict]:
+        """Pares de arquivos de projetos diferentes com maior cosseno"""
+        first, second = np.triu_indices(len(files), k=1)
+        cross = groups[first] != groups[second]
+        first, second = first[cross], second[cross]
+        
+        scores = cosine[first, second]
+        order = np.argsort(-scores, kind='stable')[:self.TOP_PAIRS]
+        return [{
+            "project_a": files[first[i]][0], "file_a": files[first[i]][1].name,
+            "project_b": files[second[i]][0], "file_b": files[second[i]][1].name,
+            "cosine": round(float(cosine[first[i], second[i]]), 4),
+            "jaccard": round(float(jaccard[first[i], second[i]]), 4)
+        } for i in order]
+        
+    def _common_themes(self, centroids: np.ndarray, vocabulary: List[str]) -> List[Dict]:
+        """Termos presentes em todos os projetos, pelo menor peso médio entre eles"""
+        shared = centroids.min(axis=0)
+        order = [i for i in np.argsort(-shared, kind='stable')[:self.TOP_TERMS] if shared[i] > 0]
+        return [{"term": vocabulary[i], "weight": round(float(shared[i]), 4)} for i in order]
+        
+    def _distinctive_features(self, centroids: np.ndarray, vocabulary: List[str],
+                              names: List[str]) -> Dict[str, List[Dict]]:
+        """Termos de cada projeto com maior peso acima da média dos demais"""
+        features = {}
+        for g, name in enumerate(names):
+            others = np.delete(centroids, g, axis=0)
+            lift = centroids[g] - (others.mean(axis=0) if len(others) else 0.0)
+            order = [i for i in np.argsort(-lift, kind='stable')[:self.TOP_TERMS] if lift[i] > 0]
+            features[name] = [{"term": vocabulary[i], "lift": round(float(lift[i]), 4)} for i in order]
+        return features
+        
+    def _historical_matches(self, files: List, names: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Transcrições de outros projetos já registradas mais parecidas com cada
+        arquivo (via LSH); só consulta o índice, sem registrar nem gravar nada
+        """
+        index = DuplicateIndex(DUPLICATE_INDEX_PATH, **self.minhash_settings)
+        matches = {}
+        for name, path in files:
+            entry = index.lookup(name, path)
+            if entry is None:
+                continue
+            found = index.near_duplicates(entry, self.history_threshold, limit=3,
+                                          exclude_projects=tuple(names))
+            if found:
+                matches[entry['key']] = [{"key": match['key'], "similarity": match['similarity']}
+                                         for match in found]
+        return matches
+        
+    def save(self, comparison: Dict[str, Any], output_dir: Path) -> Path:
+        """
+        💾 Grava a comparação em JSON (projects/comparisons/ por padrão)
+        
+        Cada matriz N × N vai para <nome>_<tipo>.npy (float32) ao lado do JSON,
+        que registra só o nome dos arquivos .npy em "matrices".
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        names = "_".join(comparison["project_similarity"]["projects"])
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        stem = f"comparison_{names}_{timestamp}"
+        
+        matrices = {}
+        for kind, matrix in comparison.get("matrices", {}).items():
+            matrix_path = output_dir / f"{stem}_{kind}.npy"
+            np.save(matrix_path, np.asarray(matrix, dtype=np.float32))
+            matrices[kind] = matrix_path.name
+            
+        output_path = output_dir / f"{stem}.json"
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({**comparison, "matrices": matrices}, f, ensure_ascii=False, indent=2)
+        return output_path
+        
+    def print_summary(self, comparison: Dict[str, Any]):
+        """Resumo no terminal: similaridade entre projetos e pares mais próximos"""
+        names = comparison["project_similarity"]["projects"]
+        cosine = comparison["project_similarity"]["cosine"]
+        # Linhas com o nome completo; colunas pelo número do projeto
+        labels = [f"[{position}] {name}" for position, name in enumerate(names, start=1)]
+        width = max(len(label) for label in labels)
+        
+        print(f"\n🔄 SIMILARIDADE ENTRE PROJETOS (cosseno TF-IDF médio)")
+        print("-" * 50)
+        print(" " * width + "  " + "  ".join(f"{f'[{position}]':>8}" for position in range(1, len(names) + 1)))
+        for label, row in zip(labels, cosine):
+            cells = "  ".join(f"{'—':>8}" if value is None else f"{value:8.3f}" for value in row)
+            print(f"{label:<{width}}  {cells}")
+            
+        if comparison["most_similar_pairs"]:
+            print(f"\n🔗 PARES MAIS SEMELHANTES")
+            print("-" * 50)
+            for pair in comparison["most_similar_pairs"][:5]:
+                print(f"{pair['cosine']:.3f}  {pair['project_a']}/{pair['file_a']} ↔ "
+                      f"{pair['project_b']}/{pair['file_b']}")
+                      
+        if comparison["common_themes"]:
+            terms = ", ".join(theme["term"] for theme in comparison["common_themes"])
+            print(f"\n🎯 Temas comuns: {terms}")
+        for name, features in comparison["distinctive_features"].items():
+            if features:
+                print(f"🏷️  {name}: {', '.join(feature['term'] for feature in features[:5])}")
+                
+        if comparison.get("historical_matches"):
+            print(f"\n🪞 ENTREVISTAS SEMELHANTES EM OUTROS PROJETOS")
+            print("-" * 50)
+            for key, found in comparison["historical_matches"].items():
+                others = ", ".join(f"{match['key']} (~{match['similarity']:.2f})" for match in found)
+                print(f"{key} ≈ {others}")
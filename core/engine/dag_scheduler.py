@@ -0,0 +1,135 @@
+"""
+🕸️ DAGScheduler - Execução concorrente do grafo de dependências
+
+Executa simultaneamente todos os nós cujas dependências já terminaram, em vez
+de percorrer a ordem topológica em série. A latência por transcrição passa a
+ser a do caminho crítico, não a soma de todos os analisadores.
+
+- Nós leves rodam em um pool de threads
+- Nós marcados como 'process' rodam em um pool de processos (opt-in)
+- Início/fim de cada nó são registrados para diagnóstico
+"""
+
+import time
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _timed_call(func: Callable, args: tuple) -> Tuple[Any, float, float]:
+    """Executa func(*args) registrando início/fim (relógio de parede, comparável entre processos)"""
+    start = time.time()
+    try:
+        value = func(*args)
+    except Exception as e:
+        value = e
+    return value, start, time.time()
+
+
+class DAGScheduler:
+    """🕸️ Agenda nós prontos do DAG em threads/processos"""
+
+    def __init__(self, max_threads: int = 4, max_processes: Optional[int] = None):
+        self.max_threads = max(1, max_threads)
+        self.max_processes = max_processes
+        self._thread_pool = None
+        self._process_pool = None
+
+    def _get_pool(self, mode: str):
+        """Cria os pools sob demanda e os reaproveita entre execuções"""
+        if mode == 'process':
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.max_processes)
+            return self._process_pool
+
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.max_threads,
+                                                   thread_name_prefix='analyzer')
+        return self._thread_pool
+
+    def run(self, order: List[str], dependencies: Dict[str, List[str]],
+            resolve: Callable[[str], Tuple], on_complete: Callable[[str, Any], None]) -> Dict[str, Dict]:
+        """
+        Executa o DAG.
+
+        Args:
+            order: ordem topológica (usada como prioridade e para desempate)
+            dependencies: nó → nós dos quais depende
+            resolve: chamado na thread principal quando o nó fica pronto; retorna
+                     ('done', valor) para nós já resolvidos (ex: cache) ou
+                     (modo, func, args) com modo 'thread', 'process' ou 'inline'
+            on_complete: chamado na thread principal com (nó, valor ou exceção)
+
+        Returns:
+            Linha do tempo {nó: {'mode', 'start', 'end'}} relativa ao início
+        """
+        t0 = time.time()
+        nodes = set(order)
+        pending = list(order)
+        finished = set()
+        running = {}
+        timeline = {}
+
+        def finish(node, mode, value, start, end):
+            timeline[node] = {
+                'mode': mode,
+                'start': round(start - t0, 4),
+                'end': round(end - t0, 4)
+            }
+            finished.add(node)
+            on_complete(node, value)
+
+        while pending or running:
+            ready = [node for node in pending
+                     if all(dep in finished or dep not in nodes
+                            for dep in dependencies.get(node, []))]
+
+            # Ciclo de dependências: liberar o próximo da ordem topológica
+            if not ready and not running:
+                ready = [pending[0]]
+
+            for node in ready:
+                pending.remove(node)
+                plan = resolve(node)
+
+                if plan[0] == 'done':
+                    now = time.time()
+                    finish(node, 'cache', plan[1], now, now)
+                elif plan[0] == 'inline' or (plan[0] == 'thread' and self.max_threads == 1):
+                    value, start, end = _timed_call(plan[1], plan[2])
+                    finish(node, 'inline', value, start, end)
+                else:
+                    mode, func, args = plan
+                    future = self._get_pool(mode).submit(_timed_call, func, args)
+                    running[future] = (node, mode)
+
+            # Nós resolvidos imediatamente podem ter liberado outros
+            if not running:
+                continue
+
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                node, mode = running.pop(future)
+                try:
+                    value, start, end = future.result()
+                except Exception as e:
+                    value, start, end = e, time.time(), time.time()
+                finish(node, mode, value, start, end)
+
+        return timeline
+
+    @staticmethod
+    def makespan(timeline: Dict[str, Dict]) -> float:
+        """⏱️ Duração total do DAG (do primeiro início ao último término)"""
+        if not timeline:
+            return 0.0
+        return max(t['end'] for t in timeline.values()) - min(t['start'] for t in timeline.values())
+
+    def close(self):
+        """Encerra os pools"""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=True)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
@@ -0,0 +1,119 @@
+"""
+🧭 Discovery - Manifesto de descoberta de analisadores e gráficos
+
+A descoberta por importação carrega todos os módulos (e numpy/scipy/plotly
+junto) a cada inicialização. O manifesto guarda, por pacote, as classes
+encontradas e os metadados necessários para agendar sem importar (ex:
+dependências declaradas, suporte a streaming), em .cache/discovery.json.
+
+Cada módulo é identificado por mtime + tamanho: apenas módulos novos ou
+alterados são importados novamente; os demais vêm do manifesto. As classes
+são carregadas sob demanda com load_class().
+"""
+
+import importlib
+import inspect
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+MANIFEST_PATH = Path(".cache/discovery.json")
+MANIFEST_VERSION = 1
+
+
+def _stamp(path: Path) -> list:
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _read_manifest(manifest_path: Path) -> Dict:
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get('version') == MANIFEST_VERSION else {}
+
+
+def _write_manifest(manifest: Dict, manifest_path: Path):
+    """Gravação atômica (vários processos podem gerar o manifesto ao mesmo tempo)"""
+    try:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=manifest_path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, manifest_path)
+    except OSError:
+        # Manifesto é só uma otimização: diretório somente leitura não impede a execução
+        pass
+
+
+def discover_plugins(package: str, package_dir: Path, predicate: Callable[[str, type], bool],
+                     describe: Optional[Callable[[type], Dict]] = None,
+                     manifest_path: Path = MANIFEST_PATH) -> Dict[str, Dict]:
+    """
+    🔍 Classes de plugin de um pacote, via manifesto
+    
+    Retorna {nome_da_classe: {'name', 'module', 'file', **describe(classe)}}.
+    predicate(nome, classe) seleciona as classes (apenas as definidas no
+    próprio módulo); describe() extrai metadados serializáveis em JSON.
+    Mudanças no __init__.py do pacote (classe base) invalidam a seção inteira.
+    """
+    package_dir = Path(package_dir)
+    manifest = _read_manifest(manifest_path)
+    cached = manifest.get('packages', {}).get(package, {})
+    
+    init_file = package_dir / "__init__.py"
+    base_stamp = _stamp(init_file) if init_file.exists() else None
+    cached_modules = cached.get('modules', {}) if cached.get('base') == base_stamp else {}
+    
+    sources = [p for p in sorted(package_dir.glob("*.py")) if not p.name.startswith("_")]
+    modules = {}
+    changed = set(cached_modules) != {p.name for p in sources}
+    
+    for py_file in sources:
+        stamp = _stamp(py_file)
+        entry = cached_modules.get(py_file.name)
+        if entry and entry.get('stamp') == stamp:
+            modules[py_file.name] = entry
+            continue
+            
+        changed = True
+        module_name = f"{package}.{py_file.stem}"
+        entry = {'stamp': stamp, 'classes': [], 'error': None}
+        try:
+            module = importlib.import_module(module_name)
+            for name, obj in inspect.getmembers(module, inspect.isclass):
+                if obj.__module__ != module_name or not predicate(name, obj):
+                    continue
+                entry['classes'].append({
+                    'name': name,
+                    'module': module_name,
+                    'file': str(py_file),
+                    **(describe(obj) if describe else {})
+                })
+        except Exception as e:
+            entry['error'] = f"{type(e).__name__}: {e}"
+        modules[py_file.name] = entry
+        
+    if changed:
+        manifest['version'] = MANIFEST_VERSION
+        manifest.setdefault('packages', {})[package] = {'base': base_stamp, 'modules': modules}
+        _write_manifest(manifest, manifest_path)
+        
+    plugins = {}
+    for filename, entry in modules.items():
+        if entry.get('error'):
+            print(f"⚠️  Erro ao carregar {package_dir / filename}: {entry['error']}")
+        for info in entry['classes']:
+            plugins[info['name']] = dict(info)
+            
+    return plugins
+
+
+def load_class(info: Dict) -> type:
+    """📦 Importa a classe descrita por uma entrada do manifesto"""
+    module = importlib.import_module(info['module'])
+    return getattr(module, info['name'])
@@ -0,0 +1,157 @@
+"""
+⏱️ Profiler - Instrumentação de analisadores e gráficos
+
+Mede cada execução (analisador ou gráfico, por arquivo):
+- wall_time: tempo de relógio (s)
+- cpu_time: tempo de CPU da thread/processo que executou (s)
+- peak_memory_kb: pico de memória alocada durante a execução (tracemalloc)
+- input_chars: tamanho da entrada
+
+Os registros ficam em result['_profile'] e são agregados por projeto em
+output/profile.json. Opcionalmente grava um .prof (cProfile) por execução
+para investigar hot paths (`python -m pstats arquivo.prof`).
+
+A medição de memória é desligada por padrão (system.profile_memory): o
+tracemalloc intercepta toda alocação e deixa os analisadores bem mais lentos.
+Como ele é global ao processo, só uma execução por vez é medida: o
+AnalysisOrchestrator só pede memória com analisadores em série, e uma medição
+iniciada enquanto outra está em curso fica sem pico (None) em vez de zerar o
+pico da outra.
+"""
+
+import cProfile
+import json
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# tracemalloc é global ao processo: no máximo uma medição ativa por vez
+_tracing_lock = threading.Lock()
+_tracing_active = False
+_tracing_started = False
+
+
+def _start_tracing() -> Optional[int]:
+    """Inicia a medição; None se outra execução já está sendo medida"""
+    global _tracing_active, _tracing_started
+    with _tracing_lock:
+        if _tracing_active:
+            return None
+        _tracing_active = True
+        _tracing_started = not tracemalloc.is_tracing()
+        if _tracing_started:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0]
+
+
+def _stop_tracing(baseline: Optional[int]) -> Optional[float]:
+    """Encerra a medição e retorna o pico acima da linha de base (KB)"""
+    global _tracing_active
+    if baseline is None:
+        return None
+    with _tracing_lock:
+        peak = tracemalloc.get_traced_memory()[1]
+        if _tracing_started:
+            tracemalloc.stop()
+        _tracing_active = False
+    return max(0, peak - baseline) / 1024
+
+
+def profiled_call(func: Callable, args: tuple, input_chars: int = 0,
+                  track_memory: bool = False,
+                  cprofile_path: Optional[str] = None) -> Tuple[Any, Dict]:
+    """
+    Executa func(*args) medindo tempo, CPU e memória.
+    
+    Função de módulo (serializável) para rodar também em pools de processos.
+    Exceções de func são propagadas sem registro.
+    """
+    baseline = _start_tracing() if track_memory else None
+    profiler = cProfile.Profile() if cprofile_path else None
+    
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    if profiler:
+        profiler.enable()
+        
+    try:
+        value = func(*args)
+    finally:
+        if profiler:
+            profiler.disable()
+        cpu_time = time.thread_time() - cpu_start
+        wall_time = time.perf_counter() - wall_start
+        peak_kb = _stop_tracing(baseline) if track_memory else None
+        
+    record = {
+        'wall_time': round(wall_time, 6),
+        'cpu_time': round(cpu_time, 6),
+        'peak_memory_kb': round(peak_kb, 1) if peak_kb is not None else None,
+        'input_chars': input_chars
+    }
+    
+    if profiler:
+        path = Path(cprofile_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(path))
+        record['cprofile'] = str(path)
+        
+    return value, record
+
+
+def aggregate_profiles(results: List[Dict]) -> Dict:
+    """📊 Agrega os `_profile` de vários arquivos por analisador/gráfico"""
+    files = []
+    totals = {'analyzers': {}, 'charts': {}}
+    
+    for result in results:
+        profile = result.get('_profile')
+        if not profile:
+            continue
+            
+        files.append({'filename': result.get('filename'), **profile})
+        
+        for section in ('analyzers', 'charts'):
+            for name, record in profile.get(section, {}).items():
+                entry = totals[section].setdefault(name, {
+                    'runs': 0, 'cached': 0, 'wall_time': 0.0, 'cpu_time': 0.0,
+                    'max_peak_memory_kb': None, 'input_chars': 0
+                })
+                if record.get('cached'):
+                    entry['cached'] += 1
+                    continue
+                    
+                entry['runs'] += 1
+                entry['wall_time'] += record.get('wall_time', 0.0)
+                entry['cpu_time'] += record.get('cpu_time', 0.0)
+                if record.get('peak_memory_kb') is not None:
+                    entry['max_peak_memory_kb'] = max(entry['max_peak_memory_kb'] or 0.0,
+                                                      record['peak_memory_kb'])
+                entry['input_chars'] += record.get('input_chars', 0)
+                
+    for section in totals.values():
+        for entry in section.values():
+            entry['wall_time'] = round(entry['wall_time'], 6)
+            entry['cpu_time'] = round(entry['cpu_time'], 6)
+            entry['chars_per_sec'] = round(entry['input_chars'] / entry['wall_time'], 1) \
+                if entry['wall_time'] else None
+                
+    # Mais custosos primeiro
+    for section in ('analyzers', 'charts'):
+        totals[section] = dict(sorted(totals[section].items(),
+                                      key=lambda item: item[1]['wall_time'], reverse=True))
+                                      
+    return {'files': files, 'totals': totals}
+
+
+def write_project_profile(results: List[Dict], output_path: Path) -> Dict:
+    """💾 Grava o perfil agregado do projeto em JSON"""
+    profile = aggregate_profiles(results)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(profile, f, ensure_ascii=False, indent=2)
+    return profile
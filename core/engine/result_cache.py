@@ -0,0 +1,158 @@
+"""
+💾 ResultCache - Cache persistente de resultados de analisadores
+
+Cada entrada é endereçada pelo conteúdo: hash do texto + classe do analisador +
+impressão digital do código-fonte + configuração efetiva. Reexecutar um projeto
+após adicionar uma transcrição recalcula apenas o arquivo novo.
+
+Entradas ficam em projects/<nome>/.cache/results/<xx>/<chave>.pkl e são
+removidas por LRU (mtime = último acesso) quando o tamanho total excede o limite.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DEFAULT_MAX_SIZE_MB = 256
+
+
+def hash_text(text: str) -> str:
+    """🔑 Hash SHA-256 do conteúdo da transcrição"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def fingerprint_source(*paths) -> str:
+    """🧬 Impressão digital do código-fonte (muda quando o analisador é editado)"""
+    digest = hashlib.sha256()
+    for path in paths:
+        try:
+            digest.update(Path(path).read_bytes())
+        except (OSError, TypeError):
+            digest.update(str(path).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+class ResultCache:
+    """💾 Cache em disco, endereçado por conteúdo, com remoção LRU por tamanho"""
+
+    def __init__(self, cache_dir: Path, max_size_mb: float = DEFAULT_MAX_SIZE_MB):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self._size = None
+
+    def make_key(self, text_hash: str, analyzer_name: str, fingerprint: str,
+                 config: Dict = None, upstream: List[str] = None, shared: Dict = None) -> str:
+        """🔑 Chave da entrada: texto + analisador + versão + config + dependências + entradas do projeto"""
+        payload = json.dumps({
+            'text': text_hash,
+            'analyzer': analyzer_name,
+            'fingerprint': fingerprint,
+            'config': config or {},
+            'upstream': sorted(upstream or []),
+            'shared': shared or {}
+        }, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[Any]:
+        """📥 Recupera resultado (None se ausente ou corrompido)"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # Entrada corrompida: descartar e recalcular
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        # Marcar acesso para a política LRU
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any):
+        """📤 Grava resultado de forma atômica (seguro entre processos)"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            self._remove(Path(tmp_path))
+            raise
+
+        if self._size is not None:
+            self._size += path.stat().st_size
+            if self._size > self.max_bytes:
+                self.evict()
+
+    def evict(self) -> int:
+        """🧹 Remove entradas menos recentemente usadas até caber no limite"""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob('*/*.pkl'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        removed = 0
+        if total > self.max_bytes:
+            for _, size, path in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_bytes:
+                    break
+                self._remove(path)
+                total -= size
+                removed += 1
+
+        self._size = total
+        return removed
+
+    def clear(self):
+        """🗑️ Remove todas as entradas"""
+        for path in self.cache_dir.glob('*/*.pkl'):
+            self._remove(path)
+        self._size = 0
+
+    def size_bytes(self) -> int:
+        """📏 Tamanho atual do cache em bytes"""
+        if self._size is None:
+            self.evict()
+        return self._size
+
+    def get_stats(self) -> Dict:
+        """📈 Estatísticas de uso"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size_bytes': self.size_bytes(),
+            'max_bytes': self.max_bytes
+        }
+
+    @staticmethod
+    def _remove(path: Path):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
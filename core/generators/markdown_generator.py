@@ -81,6 +81,10 @@ class MarkdownReportGenerator:
         if 'word_frequencies' in result:
             sections.append(self._create_frequency_section(result['word_frequencies']))
         
+        if 'speaker_statistics' in result:
+            sections.append(self._create_speakers_section(result['speaker_statistics'],
+                                                          result.get('speaker_profiles', {})))
+        
         sections.append(self._create_footer())
         
         return '\n\n'.join(filter(None, sections))
@@ -244,6 +248,29 @@ class MarkdownReportGenerator:
         
         return '\n'.join(content)
     
+    def _create_speakers_section(self, statistics: Dict[str, Any], profiles: Dict[str, Any]) -> str:
+        """Cria seção de falantes (tempo de fala e turnos)"""
+        speakers = statistics.get('speakers', {})
+        if not speakers:
+            return ""
+        
+        content = ["## 🗣️ Falantes\n"]
+        content.append(f"- **Turnos**: {statistics.get('turn_count', 0)} "
+                       f"({statistics.get('speaker_switches', 0)} trocas de falante)")
+        content.append(f"- **Fala do Entrevistador**: {statistics.get('interviewer_share', 0):.1%}")
+        content.append(f"- **Resposta Média**: {statistics.get('mean_answer_tokens', 0):.0f} palavras")
+        content.append("")
+        
+        for name, data in speakers.items():
+            words = ', '.join(list(profiles.get(name, {}).get('top_words', {}))[:5])
+            line = (f"- **{name}** ({data.get('role')}): {data.get('talk_share', 0):.1%} da fala, "
+                    f"{data.get('turns', 0)} turnos")
+            if words:
+                line += f" — {words}"
+            content.append(line)
+        
+        return '\n'.join(content)
+    
     def _create_footer(self) -> str:
         """Cria rodapé do relatório"""
         return f"""---
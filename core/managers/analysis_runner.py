@@ -3,35 +3,184 @@
 Analysis Runner - Coordenação de análises
 """
 
+import contextlib
+import io
+import json
 import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
 # Imports dos orquestradores
 from core.engine.analysis_orchestrator import AnalysisOrchestrator
+from core.engine.result_cache import ResultCache, DEFAULT_MAX_SIZE_MB, fingerprint_source
+from core.engine.profiler import write_project_profile
 from core.visuals.chart_orchestrator import ChartOrchestrator
 from core.generators.markdown_generator import MarkdownReportGenerator
+from core.managers.output_stage import OutputStage
+from core.managers.duplicate_index import DUPLICATE_INDEX_PATH, DUPLICATE_MODES, DuplicateIndex
+from core.managers.fulltext_index import FULLTEXT_INDEX_PATH, FullTextIndex
+from core.managers.project_manifest import ProjectManifest, signature
+from core.managers.raw_export import RAW_EXPORT_DIR, write_raw_export
+from core.managers.result_store import ResultStore, result_filename
+from engine.text.speaker_turns import INTERVIEWER_LABELS, SPEAKER_SCOPES
+from engine.text.tokenized_document import TokenizedDocument
+from engine.text.topic_model import TOPIC_METHODS, TopicModel
+import core.generators.markdown_generator as markdown_generator_module
+
+
+GLOBAL_CONFIG_PATH = Path("config/global_config.json")
+
+# Perfil de arquivos reaproveitados (a execução anterior não se refere a esta)
+REUSED_PROFILE = {'reused': True, 'analyzers': {}, 'charts': {}}
+
+# Orquestrador de cada processo worker (criado uma vez por processo)
+_worker_orchestrator = None
+
+
+def _init_worker(streaming_threshold_mb: Optional[float] = None, profile_memory: bool = False,
+                 cprofile_dir: Optional[Path] = None, shared_inputs: Optional[Dict] = None,
+                 speaker_settings: Optional[Dict] = None):
+    """Inicializa o orquestrador do processo worker (descoberta feita uma única vez)"""
+    global _worker_orchestrator
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Arquivos já rodam em paralelo: analisadores em série dentro de cada worker
+        _worker_orchestrator = AnalysisOrchestrator(max_workers=1,
+                                                    streaming_threshold_mb=streaming_threshold_mb)
+    _worker_orchestrator.profile_memory = profile_memory
+    _worker_orchestrator.cprofile_dir = cprofile_dir
+    _worker_orchestrator.shared_inputs = dict(shared_inputs or {})
+    for name, value in (speaker_settings or {}).items():
+        setattr(_worker_orchestrator, name, value)
+
+
+def _analyze_file_worker(index: int, file_path: Path, cache_dir: Optional[Path] = None,
+                         cache_max_mb: float = DEFAULT_MAX_SIZE_MB,
+                         streaming: Optional[bool] = None) -> Dict:
+    """Analisa um arquivo dentro do worker, isolando falhas e capturando a saída"""
+    if cache_dir is not None:
+        _worker_orchestrator.disk_cache = ResultCache(cache_dir, cache_max_mb)
+    
+    log = io.StringIO()
+    start = time.perf_counter()
+    result, error = None, None
+    
+    try:
+        with contextlib.redirect_stdout(log):
+            result = _worker_orchestrator.analyze_transcript(file_path, streaming=streaming)
+        if not result:
+            error = "Nenhum resultado retornado"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        
+    return {
+        'index': index,
+        'file': file_path.name,
+        'result': result or None,
+        'error': error,
+        'elapsed': time.perf_counter() - start,
+        'log': log.getvalue()
+    }
 
 
 class AnalysisRunner:
     """Coordena a execução de análises"""
     
-    def __init__(self):
+    def __init__(self, jobs: Optional[int] = None, use_cache: Optional[bool] = None,
+                 stream: Optional[bool] = None, cprofile: bool = False):
         self.logger = logging.getLogger(__name__)
-        self.analysis_orchestrator = AnalysisOrchestrator()
-        self.chart_orchestrator = ChartOrchestrator()
+        self.global_config = self._load_global_config()
+        self.jobs = self._resolve_jobs(jobs)
+        
+        system = self.global_config.get('system', {})
+        self.use_cache = system.get('cache_enabled', False) if use_cache is None else use_cache
+        self.cache_max_mb = system.get('cache_max_size_mb') or DEFAULT_MAX_SIZE_MB
+        self.result_cache: Optional[ResultCache] = None
+        
+        # Streaming: --stream força; senão arquivos acima do limite são lidos em blocos
+        self.stream = stream
+        self.streaming_threshold_mb = system.get('streaming_threshold_mb')
+        
+        analyzer_workers = system.get('analyzer_workers') or 1
+        self.analysis_orchestrator = AnalysisOrchestrator(max_workers=analyzer_workers,
+                                                          streaming_threshold_mb=self.streaming_threshold_mb)
+        self.chart_orchestrator = ChartOrchestrator(render_mode=system.get('chart_rendering', 'standalone'))
         self.markdown_generator = MarkdownReportGenerator()
         
+        # Instrumentação: memória (tracemalloc) via config, dumps cProfile via --profile
+        self.profile_memory = system.get('profile_memory', False)
+        self.cprofile = cprofile
+        self.cprofile_dir: Optional[Path] = None
+        self.analysis_orchestrator.profile_memory = self.profile_memory
+        self.chart_orchestrator.profile_memory = self.profile_memory
+        
+        # Turnos de fala: analisadores veem todas as falas ou só as dos respondentes
+        self.speaker_settings = {
+            'speaker_scope': system.get('speaker_scope', 'all'),
+            'interviewer_labels': system.get('interviewer_labels') or list(INTERVIEWER_LABELS)
+        }
+        if self.speaker_settings['speaker_scope'] not in SPEAKER_SCOPES:
+            print(f"⚠️  system.speaker_scope inválido: {self.speaker_settings['speaker_scope']} "
+                  f"(opções: {', '.join(SPEAKER_SCOPES)})")
+            self.speaker_settings['speaker_scope'] = 'all'
+        for name, value in self.speaker_settings.items():
+            setattr(self.analysis_orchestrator, name, value)
+        
+        # Modelo de tópicos do projeto: reajustado quando o corpus cresce mais que esta fração
+        self.topic_refit_growth = system.get('topic_refit_growth', 0.5)
+        
+        # Quase-duplicatas entre projetos (índice MinHash/LSH da instalação)
+        self.near_duplicates = system.get('near_duplicates', 'flag')
+        self.near_duplicate_threshold = system.get('near_duplicate_threshold', 0.85)
+        self.minhash_settings = {'num_perm': system.get('minhash_permutations', 128),
+                                 'bands': system.get('lsh_bands', 32)}
+        
+        # Índice invertido de todas as transcrições (--search)
+        self.fulltext_index = system.get('fulltext_index', True)
+        self.fulltext_max_segments = system.get('fulltext_max_segments') or 8
+        
+        # Banco SQLite com os resultados de todos os projetos (None = desligado)
+        self.result_store_path = ResultStore.configured_path()
+        
+        # Gráficos e relatórios renderizados em paralelo à análise
+        # (0 = em série, None = conforme núcleos livres e arquivos do projeto)
+        self.output_stage = OutputStage(self.chart_orchestrator, self.markdown_generator,
+                                        workers=system.get('output_workers'),
+                                        max_pending=system.get('output_queue_size'))
+        
+    def _load_global_config(self) -> Dict:
+        """Carrega config/global_config.json (vazio se ausente)"""
+        if not GLOBAL_CONFIG_PATH.exists():
+            return {}
+        try:
+            with open(GLOBAL_CONFIG_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Erro ao ler {GLOBAL_CONFIG_PATH}: {e}")
+            return {}
+            
+    def _resolve_jobs(self, jobs: Optional[int]) -> int:
+        """Define número de processos: --jobs tem prioridade sobre global_config"""
+        if jobs is not None:
+            return max(1, jobs)
+            
+        system = self.global_config.get('system', {})
+        if system.get('parallel_processing'):
+            return max(1, system.get('max_workers') or os.cpu_count() or 1)
+        return 1
+        
     def analyze_project(self, project_path: Path) -> bool:
         """Executa análise completa de um projeto"""
         try:
             print(f"\n🎯 INICIANDO ANÁLISE: {project_path.name}")
             print("=" * 50)
             
-            # Encontrar arquivos
+            # Encontrar arquivos (ordem determinística)
             arquivos_dir = project_path / "arquivos"
-            txt_files = list(arquivos_dir.glob("*.txt"))
+            txt_files = sorted(arquivos_dir.glob("*.txt"))
             
             if not txt_files:
                 print("❌ Nenhum arquivo .txt encontrado!")
@@ -39,39 +188,115 @@ class AnalysisRunner:
                 
             print(f"📁 Arquivos detectados: {len(txt_files)}")
             
-            results = []
+            # Cópias reexportadas/editadas: sinalizar ou pular (system.near_duplicates);
+            # arquivos pulados só saem da análise, continuam no índice textual e no manifesto
+            analysis_files = self._check_near_duplicates(project_path, txt_files)
+            skipped = [path.name for path in txt_files if path not in analysis_files]
+            
+            # Busca textual: indexa só arquivos novos/alterados
+            self._update_fulltext_index(project_path, txt_files)
+            
+            if not analysis_files:
+                print("❌ Todos os arquivos são duplicatas de transcrições já registradas!")
+                return False
+            
+            # Cache persistente de resultados por projeto
+            if self.use_cache:
+                self.result_cache = ResultCache(project_path / ".cache" / "results", self.cache_max_mb)
+                print(f"💾 Cache de resultados: {self.result_cache.cache_dir}")
+            else:
+                self.result_cache = None
+            self.analysis_orchestrator.disk_cache = self.result_cache
+            
+            # Dumps cProfile por analisador/gráfico (opcional)
+            self.cprofile_dir = project_path / "output" / "profile" if self.cprofile else None
+            self.analysis_orchestrator.cprofile_dir = self.cprofile_dir
+            self.chart_orchestrator.cprofile_dir = self.cprofile_dir
+            
+            # Entradas de escopo do projeto (assinatura entra no cache e no manifesto)
+            topic_model = self._prepare_topic_model(project_path, analysis_files)
+            self.analysis_orchestrator.shared_inputs = {'topic_model': topic_model} if topic_model else {}
             
-            # Analisar cada arquivo
-            for file_path in txt_files:
-                print(f"\n🔍 Analisando: {file_path.name}")
+            # Reanálise incremental: só arquivos novos/alterados (manifesto em .cache/)
+            output_dir = project_path / "output"
+            manifest = ProjectManifest(project_path) if self.use_cache else None
+            analysis_signature, render_signature = self._signatures()
+            plan = self._plan(analysis_files, manifest, analysis_signature, render_signature)
+            
+            # Estágio de saída: cada resultado é renderizado assim que fica pronto
+            to_render = sum(1 for item in plan if item['charts'] or item['report'])
+            self.output_stage.start(output_dir, renders=to_render,
+                                    busy=min(self.jobs, max(1, len(plan))))
+            
+            try:
+                # Só resultados com saídas a refazer são carregados e entram no estágio de saída
+                reused = self._load_unchanged(plan, manifest)
+                to_analyze = [item for item in plan if item['analyze']]
+                if manifest:
+                    print(f"♻️  Inalterados: {len(plan) - len(to_analyze)} ({len(reused)} carregado(s)) "
+                          f"| a analisar: {len(to_analyze)}")
+                    
+                # Analisar arquivos (em paralelo se configurado)
+                if self.jobs > 1 and len(to_analyze) > 1:
+                    file_runs = self._analyze_files_parallel(to_analyze)
+                else:
+                    file_runs = self._analyze_files_sequential(to_analyze)
+                    
+                analyzed = {run['index']: run['result'] for run in file_runs if run['result']}
+                ordered = [analyzed.get(item['index']) or reused.get(item['index']) for item in plan]
                 
-                # Análise via orchestrator
-                result = self.analysis_orchestrator.analyze_transcript(file_path)
+                # Resumo por arquivo: do resultado carregado ou, se não carregado, do manifesto
+                digests = [self._digest(result) if result else (None if item['analyze'] else item['digest'])
+                           for item, result in zip(plan, ordered)]
                 
-                if result:
-                    results.append(result)
-                    print(f"✅ {file_path.name} processado")
-                else:
-                    print(f"❌ Erro ao processar {file_path.name}")
+                # Gráficos de nome fixo: refazer só os de dono alterado
+                chart_owners = {}
+                if manifest and self.chart_orchestrator.render_mode != 'single_page':
+                    chart_owners = self._render_stale_charts(manifest, plan, ordered, digests, output_dir)
+            finally:
+                print("\n📊 Gerando visualizações...")
+                renders = self.output_stage.close()
+                
+            present = [item for item, digest in zip(plan, digests) if digest]
+            
+            if manifest:
+                self._update_manifest(manifest, plan, analyzed, digests, renders, chart_owners, output_dir,
+                                      analysis_signature, render_signature, skipped)
+                
+            if self.result_cache:
+                evicted = self.result_cache.evict()
+                if evicted:
+                    print(f"🧹 Cache: {evicted} entrada(s) antiga(s) removida(s)")
             
-            if not results:
+            if not present:
                 print("\n❌ Nenhum arquivo foi processado com sucesso!")
                 return False
+                
+            # Resultados consultáveis entre projetos (--query): só arquivos novos/alterados/removidos
+            load = manifest.load_result if manifest else None
+            self._store_results(project_path.name, list(analyzed.values()),
+                                [item['path'].name for item in present] + skipped, load)
             
-            # Gerar visualizações e relatórios
-            output_dir = project_path / "output"
-            output_dir.mkdir(exist_ok=True)
+            # Rede de conceitos do projeto inteiro (uma matriz sobre todas as transcrições)
+            self._build_project_network(analysis_files, output_dir, analysis_signature)
             
-            print("\n📊 Gerando visualizações...")
-            for result in results:
-                # Gráficos via orchestrator
-                self.chart_orchestrator.analyze(result, str(output_dir))
+            # Exportação em colunas para consumidores em lote (output.save_raw_data)
+            if self._project_output_settings(project_path).get('save_raw_data'):
+                self._export_raw(present, ordered, load, output_dir, analysis_signature)
+                
+            # plotly.js compartilhado / página única (conforme system.chart_rendering)
+            for path in self.chart_orchestrator.finalize(str(output_dir)):
+                print(f"📦 {path}")
                 
-                # Relatório markdown
-                self.markdown_generator.generate_report(result, output_dir, result.get("filename", "arquivo.txt"))
+            # Perfil agregado do projeto (arquivos não carregados entram como reaproveitados)
+            profile = write_project_profile(
+                [ordered[item['index']] or {'filename': item['path'].name, '_profile': dict(REUSED_PROFILE)}
+                 for item in present], output_dir / "profile.json")
             
             # Resumo final
-            self._print_summary(results)
+            self._print_summary([digests[item['index']] for item in present])
+            self._print_timings(file_runs, renders)
+            self._print_profile(profile)
             
             print(f"\n✅ Análise concluída com sucesso!")
             return True
@@ -81,7 +306,404 @@ class AnalysisRunner:
             import traceback
             traceback.print_exc()
             return False
-    
+            
+    def _check_near_duplicates(self, project_path: Path, txt_files: List[Path]) -> List[Path]:
+        """
+        Registra as transcrições no índice de quase-duplicatas e aplica a política
+        
+        'flag' só avisa; 'skip' remove da análise arquivos que casam com uma
+        transcrição registrada antes (de qualquer projeto); 'off' desliga.
+        """
+        if self.near_duplicates not in DUPLICATE_MODES:
+            print(f"⚠️  system.near_duplicates inválido: {self.near_duplicates} "
+                  f"(opções: {', '.join(DUPLICATE_MODES)})")
+            return txt_files
+        if self.near_duplicates == 'off':
+            return txt_files
+            
+        index = DuplicateIndex(DUPLICATE_INDEX_PATH, **self.minhash_settings)
+        kept = []
+        for path in txt_files:
+            entry = index.register(project_path.name, path)
+            matches = index.near_duplicates(entry, self.near_duplicate_threshold) if entry else []
+            for match in matches[:3]:
+                print(f"🪞 {path.name} ≈ {match['key']} (Jaccard ~{match['similarity']:.2f})")
+                
+            if self.near_duplicates == 'skip' and any(match['seq'] < entry['seq'] for match in matches):
+                print(f"   ⏭️  {path.name} pulado (duplicata)")
+                continue
+            kept.append(path)
+            
+        try:
+            index.save()
+        except OSError as e:
+            self.logger.warning(f"Erro ao gravar {DUPLICATE_INDEX_PATH}: {e}")
+        return kept
+        
+    def _store_results(self, project_name: str, results: List[Dict], present: List[str], load=None):
+        """
+        Atualiza as linhas do projeto no banco de resultados (uma transação)
+        
+        Só os resultados desta execução são regravados e arquivos fora de
+        `present` são apagados; arquivos presentes que ainda não constam no
+        banco (banco novo ou apagado) são carregados com `load`.
+        """
+        if self.result_store_path is None:
+            return
+            
+        start = time.perf_counter()
+        try:
+            with ResultStore(self.result_store_path) as store:
+                written = {result_filename(result) for result in results}
+                missing = set(present) - written - set(store.project_files(project_name))
+                if missing and load:
+                    results = results + [result for result in map(load, sorted(missing)) if result]
+                counts = store.write_files(project_name, results, present)
+        except Exception as e:
+            self.logger.warning(f"Erro ao gravar {self.result_store_path}: {e}")
+            return
+        if counts['files'] or counts['removed']:
+            print(f"🗄️  Banco de resultados: {counts['files']} arquivo(s) gravado(s), "
+                  f"{counts['removed']} removido(s), {counts['metrics']} métricas "
+                  f"→ {self.result_store_path} ({time.perf_counter() - start:.2f}s)")
+        
+    def _project_output_settings(self, project_path: Path) -> Dict:
+        """Seção "output" de config_analise.json do projeto (vazia se ausente)"""
+        try:
+            with open(project_path / "config_analise.json", 'r', encoding='utf-8') as f:
+                return json.load(f).get('output') or {}
+        except Exception:
+            return {}
+            
+    def _export_raw(self, present: List[Dict], ordered: List[Optional[Dict]], load, output_dir: Path,
+                    analysis_signature: str):
+        """
+        Grava output/raw/ (um .npy por coluna, todos os arquivos do projeto)
+        
+        Refeita só quando os arquivos ou a análise mudam; resultados não
+        carregados nesta execução são lidos com `load`.
+        """
+        export_signature = None
+        if load:
+            export_signature = signature(analysis_signature,
+                                         [(item['path'].name, item['sha256']) for item in present])
+            try:
+                with open(output_dir / RAW_EXPORT_DIR / "schema.json", 'r', encoding='utf-8') as f:
+                    if json.load(f).get('signature') == export_signature:
+                        return
+            except (OSError, ValueError):
+                pass
+            
+        start = time.perf_counter()
+        try:
+            results = [ordered[item['index']] or load(item['path'].name) for item in present]
+            path = write_raw_export([result for result in results if result], output_dir,
+                                    signature=export_signature)
+        except Exception as e:
+            self.logger.warning(f"Erro na exportação de dados brutos: {e}")
+            return
+        print(f"📦 Dados brutos em colunas: {path} ({time.perf_counter() - start:.2f}s)")
+        
+    def _build_project_network(self, txt_files: List[Path], output_dir: Path, analysis_signature: str):
+        """
+        Grava output/concept_network_project.json: coocorrência de todas as
+        transcrições numa só matriz, com o vocabulário do projeto (até
+        max_words_for_network termos) e o mesmo recorte de falas da análise
+        
+        Refeita só quando os arquivos ou a configuração mudam.
+        """
+        orchestrator = self.analysis_orchestrator
+        if 'concept_network' not in orchestrator.analyzers:
+            return
+        analyzer = orchestrator.create_analyzer('concept_network')
+        if not analyzer.config.get('project_network', True):
+            return
+            
+        network_path = output_dir / "concept_network_project.json"
+        files = [(path.name, path.stat().st_size, path.stat().st_mtime_ns) for path in txt_files]
+        network_signature = signature(analysis_signature, files)
+        try:
+            with open(network_path, 'r', encoding='utf-8') as f:
+                if json.load(f).get('signature') == network_signature:
+                    return
+        except (OSError, ValueError):
+            pass
+            
+        def documents():
+            for path in txt_files:
+                yield orchestrator.scope_document(TokenizedDocument(path.read_text(encoding='utf-8')))
+                
+        start = time.perf_counter()
+        try:
+            network = analyzer.analyze_project(documents())
+            network.update(signature=network_signature, files=[name for name, _, _ in files])
+            with open(network_path, 'w', encoding='utf-8') as f:
+                json.dump(network, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            self.logger.warning(f"Erro na rede de conceitos do projeto: {e}")
+            return
+        print(f"🕸️  Rede do projeto: {network['words_analyzed']} termos, "
+              f"{network['significant_connections']} conexões → {network_path.name} "
+              f"({time.perf_counter() - start:.2f}s)")
+        
+    def _update_fulltext_index(self, project_path: Path, txt_files: List[Path]):
+        """Sincroniza as transcrições do projeto com o índice invertido da instalação"""
+        if not self.fulltext_index:
+            return
+            
+        start = time.perf_counter()
+        try:
+            index = FullTextIndex(FULLTEXT_INDEX_PATH, self.fulltext_max_segments)
+            counts = index.update(project_path.name, txt_files)
+            index.save()
+        except Exception as e:
+            self.logger.warning(f"Erro ao atualizar {FULLTEXT_INDEX_PATH}: {e}")
+            return
+        if counts['indexed'] or counts['removed']:
+            print(f"🔎 Índice de busca: {counts['indexed']} indexado(s), {counts['removed']} removido(s) "
+                  f"({time.perf_counter() - start:.2f}s)")
+            
+    def _prepare_topic_model(self, project_path: Path, txt_files: List[Path]) -> Optional[TopicModel]:
+        """
+        Modelo de tópicos ajustado sobre todas as transcrições do projeto
+        
+        Reaproveita .cache/topic_model.pkl enquanto a configuração for a mesma e
+        o corpus não crescer mais que topic_refit_growth: arquivos novos só
+        passam por transform() no TopicModelingAnalyzer.
+        """
+        if 'topic_modeling' not in self.analysis_orchestrator.analyzers:
+            return None
+            
+        settings = self.analysis_orchestrator.create_analyzer('topic_modeling').model_settings()
+        if settings['method'] not in TOPIC_METHODS:
+            return None
+            
+        # Mesmo recorte de falas que os analisadores recebem (speaker_scope)
+        orchestrator = self.analysis_orchestrator
+        scope = orchestrator.speaker_signature()
+        
+        model_path = project_path / ".cache" / "topic_model.pkl"
+        model = TopicModel.load(model_path) if self.use_cache else None
+        if (model is not None and model.fitted and model.scope == scope
+                and all(model.settings.get(key) == value for key, value in settings.items())
+                and not model.is_stale(txt_files, self.topic_refit_growth)):
+            print(f"🧠 Modelo de tópicos reaproveitado ({len(model.fitted_files)} arquivo(s), "
+                  f"{len(model.vocabulary)} termos)")
+            return model
+            
+        start = time.perf_counter()
+        try:
+            model = TopicModel(**settings)
+            model.scope = scope
+            model.fit(txt_files, select=orchestrator.scope_document)
+        except Exception as e:
+            print(f"⚠️  Erro ao ajustar modelo de tópicos do projeto: {e}")
+            return None
+        print(f"🧠 Modelo de tópicos ({settings['method']}) ajustado: {model.units} parágrafos, "
+              f"{len(model.vocabulary)} termos ({time.perf_counter() - start:.2f}s)")
+        
+        if self.use_cache:
+            model.save(model_path)
+        return model
+        
+    def _signatures(self):
+        """Assinaturas da análise (analisadores + modo de leitura) e da renderização"""
+        analysis_signature = signature(self.analysis_orchestrator.get_signature(),
+                                       self.stream, self.streaming_threshold_mb)
+        render_signature = signature(self.chart_orchestrator.get_signature(),
+                                     fingerprint_source(markdown_generator_module.__file__))
+        return analysis_signature, render_signature
+        
+    def _plan(self, txt_files: List[Path], manifest: Optional[ProjectManifest],
+              analysis_signature: str, render_signature: str) -> List[Dict]:
+        """Plano por arquivo: analisar? gerar relatório? gerar gráficos?"""
+        if manifest is None:
+            return [{'index': index, 'path': path, 'analyze': True, 'report': True, 'charts': True}
+                    for index, path in enumerate(txt_files)]
+                    
+        charts_per_file = self.chart_orchestrator.render_mode == 'single_page'
+        return manifest.plan(txt_files, analysis_signature, render_signature, charts_per_file)
+        
+    def _load_unchanged(self, plan: List[Dict], manifest: Optional[ProjectManifest]) -> Dict[int, Dict]:
+        """
+        Carrega resultados de arquivos inalterados e agenda as saídas desatualizadas
+        
+        Arquivos sem saídas a refazer e com resumo no manifesto não são
+        carregados: o resumo basta para gráficos, perfil e resumo final.
+        """
+        reused = {}
+        if manifest is None:
+            return reused
+            
+        for item in plan:
+            if item['analyze'] or not (item['charts'] or item['report'] or item['digest'] is None):
+                continue
+                
+            result = self._load_result(manifest, item)
+            if result is None:
+                item['analyze'] = True
+                continue
+                
+            reused[item['index']] = result
+            self.output_stage.submit(item['index'], result, item['charts'], item['report'])
+            
+        return reused
+        
+    @staticmethod
+    def _load_result(manifest: ProjectManifest, item: Dict) -> Optional[Dict]:
+        result = manifest.load_result(item['path'].name)
+        if result is not None:
+            result['_profile'] = dict(REUSED_PROFILE)
+        return result
+        
+    def _digest(self, result: Dict) -> Dict:
+        """Resumo guardado no manifesto: gráficos com dados e métricas do resumo final"""
+        metrics = result.get('global_metrics') or {}
+        return {
+            'charts': self.chart_orchestrator.charts_with_data(result),
+            'global_metrics': {key: metrics[key] for key in ('global_sentiment', 'thematic_coherence')
+                               if key in metrics}
+        }
+        
+    def _render_stale_charts(self, manifest: ProjectManifest, plan: List[Dict], ordered: List[Optional[Dict]],
+                             digests: List[Optional[Dict]], output_dir: Path) -> Dict[str, Dict]:
+        """
+        Agenda os gráficos cujo arquivo dono mudou; remove os que ficaram sem dono
+        
+        Os donos saem dos resumos; só o resultado de um dono não carregado cujo
+        gráfico precisa ser refeito é lido do disco.
+        """
+        chart_files = {name: mapping['filename']
+                       for name, mapping in self.chart_orchestrator.chart_mappings.items()}
+        charts_by_position = [digest['charts'] if digest else None for digest in digests]
+        owners = {chart: plan[position]
+                  for chart, position in self.chart_orchestrator.chart_owners(charts_by_position).items()}
+        
+        for chart in set(manifest.data.get('charts', {})) - set(owners):
+            orphan = output_dir / chart_files.get(chart, '')
+            if chart in chart_files and orphan.exists():
+                orphan.unlink()
+                print(f"🗑️  Removido: {orphan}")
+                
+        by_index = {}
+        for chart, item in manifest.stale_charts(owners, output_dir, chart_files).items():
+            by_index.setdefault(item['index'], set()).add(chart)
+        for index, charts in sorted(by_index.items()):
+            if ordered[index] is None:
+                ordered[index] = self._load_result(manifest, plan[index])
+            if ordered[index] is None:
+                # Ilegível: sem registro de dono, o gráfico é tentado de novo na próxima execução
+                for chart in charts:
+                    owners.pop(chart)
+                continue
+            self.output_stage.submit(index, ordered[index], charts=charts, report=False)
+            
+        return owners
+        
+    def _update_manifest(self, manifest: ProjectManifest, plan: List[Dict], analyzed: Dict[int, Dict],
+                         digests: List[Optional[Dict]], renders: List[Dict], chart_owners: Dict[str, Dict],
+                         output_dir: Path, analysis_signature: str, render_signature: str,
+                         skipped: List[str] = ()):
+        """Registra o que foi produzido e remove saídas de transcrições apagadas (não das puladas)"""
+        render_errors = {render['index'] for render in renders if render.get('error')}
+        manifest.record_charts(chart_owners, render_errors)
+        
+        for item in plan:
+            result = analyzed.get(item['index'])
+            if item['analyze'] and result is None:
+                continue  # falhou: tentar de novo na próxima execução
+                
+            report = output_dir / f"report_{item['path'].stem}.md"
+            manifest.record(item, analysis_signature, result,
+                            rendered=item['index'] not in render_errors, outputs=[str(report)],
+                            digest=digests[item['index']])
+            
+        for path in manifest.remove_missing([item['path'].name for item in plan] + list(skipped)):
+            print(f"🗑️  Removido: {path}")
+            
+        manifest.save([item['path'].name for item in plan], render_signature)
+        
+    def _analyze_files_sequential(self, plan: List[Dict]) -> List[Dict]:
+        """Analisa os arquivos um a um no processo atual"""
+        file_runs = []
+        
+        for item in plan:
+            index, file_path = item['index'], item['path']
+            print(f"\n🔍 Analisando: {file_path.name}")
+            start = time.perf_counter()
+            result, error = None, None
+            
+            try:
+                # Análise via orchestrator
+                result = self.analysis_orchestrator.analyze_transcript(file_path, streaming=self.stream)
+                if not result:
+                    error = "Nenhum resultado retornado"
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                
+            elapsed = time.perf_counter() - start
+            if result:
+                print(f"✅ {file_path.name} processado ({elapsed:.2f}s)")
+                self.output_stage.submit(index, result, item['charts'], item['report'])
+            else:
+                print(f"❌ Erro ao processar {file_path.name}: {error}")
+                
+            file_runs.append({
+                'index': index,
+                'file': file_path.name,
+                'result': result or None,
+                'error': error,
+                'elapsed': elapsed
+            })
+            
+        return file_runs
+        
+    def _analyze_files_parallel(self, plan: List[Dict]) -> List[Dict]:
+        """Analisa os arquivos em um pool de processos, mantendo a ordem original"""
+        workers = min(self.jobs, len(plan))
+        print(f"⚡ Processamento paralelo: {workers} processos")
+        
+        items = {item['index']: item for item in plan}
+        file_runs = {}
+        
+        cache_dir = self.result_cache.cache_dir if self.result_cache else None
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.streaming_threshold_mb, self.profile_memory,
+                                           self.cprofile_dir,
+                                           self.analysis_orchestrator.shared_inputs,
+                                           self.speaker_settings)) as executor:
+            futures = {
+                executor.submit(_analyze_file_worker, item['index'], item['path'],
+                                cache_dir, self.cache_max_mb, self.stream): (item['index'], item['path'])
+                for item in plan
+            }
+            
+            for future in as_completed(futures):
+                index, file_path = futures[future]
+                try:
+                    run = future.result()
+                except Exception as e:
+                    # Falha do próprio worker (ex: processo encerrado)
+                    run = {'index': index, 'file': file_path.name, 'result': None,
+                           'error': f"{type(e).__name__}: {e}", 'elapsed': 0.0, 'log': ''}
+                           
+                if run['result']:
+                    print(f"✅ {run['file']} processado ({run['elapsed']:.2f}s)")
+                else:
+                    print(f"❌ Erro ao processar {run['file']}: {run['error']}")
+                    if run.get('log'):
+                        print(run['log'])
+                        
+                run.pop('log', None)
+                file_runs[index] = run
+                
+                if run['result']:
+                    self.output_stage.submit(index, run['result'], items[index]['charts'],
+                                             items[index]['report'])
+                
+        return [file_runs[index] for index in sorted(file_runs)]
+        
     def _print_summary(self, results: List[Dict]):
         """Imprime resumo da análise"""
         print(f"\n🎯 RESUMO DA ANÁLISE")
@@ -97,7 +719,7 @@ class AnalysisRunner:
                 metrics = result['global_metrics']
                 sentiments.append(metrics.get('global_sentiment', 0))
                 coherences.append(metrics.get('thematic_coherence', 0))
-        
+                
         if sentiments:
             avg_sentiment = sum(sentiments) / len(sentiments)
             print(f"😊 Sentimento médio: {avg_sentiment:.2f}")
@@ -105,6 +727,38 @@ class AnalysisRunner:
         if coherences:
             avg_coherence = sum(coherences) / len(coherences)
             print(f"🎯 Coerência média: {avg_coherence:.2f}")
+            
+    def _print_timings(self, file_runs: List[Dict], renders: List[Dict] = None):
+        """Imprime tempo de processamento (análise e saídas) por arquivo"""
+        print(f"\n⏱️  TEMPO POR ARQUIVO")
+        print("-" * 50)
+        
+        render_times = {}
+        for render in renders or []:
+            render_times[render['index']] = render_times.get(render['index'], 0.0) + render['elapsed']
+        for run in file_runs:
+            status = "✅" if run['result'] else "❌"
+            render = render_times.get(run['index'])
+            outputs = f"   saídas {render:>6.2f}s" if render is not None else ""
+            print(f"{status} {run['file']:<40} {run['elapsed']:>7.2f}s{outputs}")
+            
+        failed = [run for run in file_runs if not run['result']]
+        if failed:
+            print(f"⚠️  {len(failed)} arquivo(s) com erro")
+            
+    def _print_profile(self, profile: Dict, limit: int = 5):
+        """Imprime os analisadores/gráficos mais custosos do projeto"""
+        print(f"\n🔬 PERFIL (output/profile.json)")
+        print("-" * 50)
+        
+        for section, icon in (('analyzers', '🔍'), ('charts', '🎨')):
+            for name, entry in list(profile['totals'][section].items())[:limit]:
+                if not entry['runs']:
+                    continue
+                peak_kb = entry['max_peak_memory_kb']
+                memory = f"{peak_kb / 1024:>7.1f} MB" if peak_kb is not None else ""
+                print(f"{icon} {name:<28} {entry['wall_time']:>7.3f}s "
+                      f"CPU {entry['cpu_time']:>7.3f}s {memory}")
 
 
 # Teste básico
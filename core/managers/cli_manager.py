@@ -24,7 +24,13 @@ class CLIManager:
 Exemplos de uso:
   %(prog)s --create-project meu_estudo
   %(prog)s --project meu_estudo
+  %(prog)s --project meu_estudo --jobs 4
+  %(prog)s --project call_center --stream
+  %(prog)s --project meu_estudo --watch
   %(prog)s --compare projeto1 projeto2 projeto3
+  %(prog)s --query "global_sentiment<0" "total_hesitations>50"
+  %(prog)s --aggregate global_metrics.thematic_coherence
+  %(prog)s --search "não sei" teste_auto_trio
   %(prog)s --list-projects
   %(prog)s --test-visuals
             """
@@ -52,6 +58,34 @@ Exemplos de uso:
             help='Comparar múltiplos projetos'
         )
         
+        action.add_argument(
+            '--query', '-q',
+            nargs='*',
+            metavar='FILTRO',
+            help='Consultar o banco de resultados: arquivos que atendem a todos os filtros '
+                 '(ex: "global_sentiment<0"); sem filtros, lista as métricas disponíveis'
+        )
+        
+        action.add_argument(
+            '--aggregate',
+            metavar='METRICA',
+            help='Média, mínimo e máximo de uma métrica por projeto (banco de resultados)'
+        )
+        
+        action.add_argument(
+            '--sql',
+            metavar='CONSULTA',
+            help='Consulta SQL somente leitura no banco de resultados'
+        )
+        
+        action.add_argument(
+            '--search', '-s',
+            nargs='+',
+            metavar=('CONSULTA', 'PROJ'),
+            help='Buscar termo ou frase em todas as transcrições indexadas (concordância KWIC); '
+                 'projetos opcionais restringem a busca'
+        )
+        
         action.add_argument(
             '--list-projects', '-l',
             action='store_true',
@@ -77,6 +111,54 @@ Exemplos de uso:
             help='Forçar execução sem confirmações'
         )
         
+        parser.add_argument(
+            '--jobs', '-j',
+            type=int,
+            metavar='N',
+            default=None,
+            help='Analisar N arquivos em paralelo (padrão: config/global_config.json)'
+        )
+        
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Ignorar o cache de resultados e reanalisar todos os arquivos'
+        )
+        
+        parser.add_argument(
+            '--watch', '-w',
+            action='store_true',
+            help='Com --project: observar arquivos/ e reanalisar transcrições novas/alteradas'
+        )
+        
+        parser.add_argument(
+            '--stream',
+            action='store_true',
+            help='Ler transcrições em blocos (memória limitada; só analisadores com streaming)'
+        )
+        
+        parser.add_argument(
+            '--limit',
+            type=int,
+            metavar='N',
+            default=None,
+            help='Máximo de linhas exibidas por --query / --search'
+        )
+        
+        parser.add_argument(
+            '--context',
+            type=int,
+            metavar='N',
+            default=40,
+            help='Caracteres de contexto de cada lado em --search (padrão: 40)'
+        )
+        
+        parser.add_argument(
+            '--profile',
+            action='store_true',
+            help='Gravar um dump cProfile por analisador/gráfico em output/profile/'
+        )
+        
         return parser
     
     def parse_args(self, args=None):
@@ -91,6 +173,26 @@ Exemplos de uso:
                 print("❌ Nome de projeto inválido. Use apenas letras, números e underscore.")
                 return False
                 
+        if args.jobs is not None and args.jobs < 1:
+            print("❌ --jobs deve ser pelo menos 1.")
+            return False
+            
+        if args.limit is not None and args.limit < 1:
+            print("❌ --limit deve ser pelo menos 1.")
+            return False
+            
+        if args.watch and not args.project:
+            print("❌ --watch requer --project.")
+            return False
+            
+        if args.watch and args.no_cache:
+            print("❌ --watch depende do cache de resultados (não use --no-cache).")
+            return False
+            
+        if args.context < 0:
+            print("❌ --context não pode ser negativo.")
+            return False
+            
         if args.compare and len(args.compare) < 2:
             print("❌ Comparação requer pelo menos 2 projetos.")
             return False
@@ -110,6 +212,14 @@ Exemplos de uso:
             return ('analyze', args.project)
         elif args.compare:
             return ('compare', args.compare)
+        elif args.query is not None:
+            return ('query', args.query)
+        elif args.aggregate:
+            return ('aggregate', args.aggregate)
+        elif args.sql:
+            return ('sql', args.sql)
+        elif args.search:
+            return ('search', args.search)
         elif args.list_projects:
             return ('list', None)
         elif args.test_visuals:
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Duplicate Index - Quase-duplicatas entre todos os projetos da instalação
+
+Registra uma assinatura MinHash por transcrição (.cache/near_duplicates.pkl,
+na raiz da instalação) em um índice LSH, para que cópias reexportadas ou
+levemente editadas de uma entrevista sejam encontradas sem comparar todos os
+pares. A assinatura só é recalculada quando tamanho/mtime do arquivo mudam.
+
+Cada entrada recebe um número de sequência na ordem de registro: em modo
+'skip' uma transcrição só é pulada quando casa com outra registrada antes
+(a primeira cópia continua sendo analisada).
+"""
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from engine.text.minhash import LSHIndex, MinHasher, estimate_jaccard
+from engine.text.tokenized_document import TokenizedDocument
+
+INDEX_VERSION = 1
+DUPLICATE_INDEX_PATH = Path(".cache/near_duplicates.pkl")
+DUPLICATE_MODES = ('off', 'flag', 'skip')
+
+
+class DuplicateIndex:
+    """🪞 Assinaturas MinHash + índice LSH de todas as transcrições registradas"""
+
+    def __init__(self, path: Path = DUPLICATE_INDEX_PATH, num_perm: int = 128, bands: int = 32):
+        self.path = Path(path)
+        self.settings = {'num_perm': num_perm, 'bands': bands}
+        self.hasher = MinHasher(num_perm)
+        self.entries: Dict[str, Dict] = {}
+        self.lsh = LSHIndex(num_perm, bands)
+        self.next_seq = 0
+        self._load()
+
+    def _load(self):
+        """Índice salvo (descartado se ilegível, de outra versão ou outros parâmetros)"""
+        try:
+            with open(self.path, 'rb') as f:
+                payload = pickle.load(f)
+        except Exception:
+            return
+        if (not isinstance(payload, dict) or payload.get('version') != INDEX_VERSION
+                or payload.get('settings') != self.settings):
+            return
+        self.entries = payload['entries']
+        self.lsh = payload['lsh']
+        self.next_seq = payload['next_seq']
+
+    @staticmethod
+    def key(project: str, path: Path) -> str:
+        return f"{project}/{Path(path).name}"
+
+    def lookup(self, project: str, path: Path) -> Optional[Dict]:
+        """
+        🔎 Entrada da transcrição sem registrá-la no índice
+
+        Reaproveita a entrada registrada se tamanho/mtime não mudaram; caso
+        contrário calcula a assinatura. None se o arquivo não tem palavras.
+        """
+        path = Path(path)
+        key = self.key(project, path)
+        stat = path.stat()
+        entry = self.entries.get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry
+
+        signature = self.hasher.signature(TokenizedDocument(path.read_text(encoding='utf-8')))
+        if len(signature) == 0:
+            return None
+
+        return {
+            'key': key,
+            'project': project,
+            'file': path.name,
+            'path': str(path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'signature': signature,
+            # Conteúdo alterado mantém a posição original na sequência
+            'seq': entry['seq'] if entry else self.next_seq
+        }
+
+    def register(self, project: str, path: Path) -> Optional[Dict]:
+        """
+        📝 Registra (ou atualiza) a transcrição e retorna sua entrada
+
+        None se o arquivo não tem palavras (nada a comparar).
+        """
+        key = self.key(project, path)
+        entry = self.lookup(project, path)
+        if entry is None:
+            self.remove(key)
+            return None
+
+        if self.entries.get(key) is not entry:
+            if key not in self.entries:
+                self._take_seq()
+            self.entries[key] = entry
+            self.lsh.add(key, entry['signature'])
+        return entry
+
+    def _take_seq(self) -> int:
+        seq = self.next_seq
+        self.next_seq += 1
+        return seq
+
+    def remove(self, key: str):
+        self.entries.pop(key, None)
+        self.lsh.remove(key)
+
+    def near_duplicates(self, entry: Dict, threshold: float = 0.85, limit: int = None,
+                        exclude_projects: tuple = ()) -> List[Dict]:
+        """
+        🔍 Transcrições registradas com Jaccard estimado >= threshold
+
+        Só os candidatos do LSH são verificados; entradas cujo arquivo não
+        existe mais são removidas do índice. Ordenadas da mais semelhante.
+        """
+        matches = []
+        for key in self.lsh.query(entry['signature']):
+            other = self.entries.get(key)
+            if key == entry['key'] or other is None or other['project'] in exclude_projects:
+                continue
+            if not Path(other['path']).exists():
+                self.remove(key)
+                continue
+            similarity = estimate_jaccard(entry['signature'], other['signature'])
+            if similarity >= threshold:
+                matches.append({'key': key, 'project': other['project'], 'file': other['file'],
+                                'similarity': round(similarity, 3), 'seq': other['seq']})
+
+        matches.sort(key=lambda match: (-match['similarity'], match['seq']))
+        return matches[:limit] if limit else matches
+
+    def save(self):
+        """💾 Gravação atômica do índice"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {'version': INDEX_VERSION, 'settings': self.settings, 'entries': self.entries,
+                   'lsh': self.lsh, 'next_seq': self.next_seq}
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Full-Text Index - Busca de termos e frases em todas as transcrições
+
+Índice invertido da instalação (.cache/fulltext/, na raiz), atualizado pelo
+AnalysisRunner a cada análise de projeto: só transcrições novas ou alteradas
+(tamanho/mtime) são tokenizadas e vão para um segmento novo; versões antigas
+e arquivos removidos do projeto são marcados como apagados e descartados na
+próxima fusão de segmentos (quando passam de max_segments).
+
+registry.json guarda os documentos (id, projeto, arquivo, caminho) e a lista
+de segmentos; as consultas devolvem ocorrências com sentença e offsets de
+caracteres, e concordance() monta as linhas KWIC lendo cada arquivo uma vez.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from engine.text.inverted_index import Segment, match_phrase, merge_segments, parse_query, write_segment
+from engine.text.tokenized_document import TokenizedDocument
+
+REGISTRY_VERSION = 1
+FULLTEXT_INDEX_PATH = Path(".cache/fulltext")
+
+
+class FullTextIndex:
+    """🔎 Índice invertido em segmentos de todas as transcrições analisadas"""
+
+    def __init__(self, path: Path = FULLTEXT_INDEX_PATH, max_segments: int = 8):
+        self.path = Path(path)
+        self.max_segments = max(1, max_segments)
+        self.documents: Dict[str, Dict] = {}
+        self.deleted: List[int] = []
+        self.segments: List[str] = []
+        self.next_doc = 0
+        self.next_segment = 0
+        self._open: Dict[str, Segment] = {}
+        self._load()
+
+    def _load(self):
+        """Registro salvo (ignorado se ilegível ou de outra versão)"""
+        try:
+            with open(self.path / "registry.json", 'r', encoding='utf-8') as f:
+                registry = json.load(f)
+        except (OSError, ValueError):
+            return
+        if registry.get('version') != REGISTRY_VERSION:
+            return
+        self.documents = registry['documents']
+        self.deleted = registry['deleted']
+        self.segments = registry['segments']
+        self.next_doc = registry['next_doc']
+        self.next_segment = registry['next_segment']
+
+    @staticmethod
+    def key(project: str, path: Path) -> str:
+        return f"{project}/{Path(path).name}"
+
+    def _segment(self, name: str) -> Segment:
+        segment = self._open.get(name)
+        if segment is None:
+            segment = self._open[name] = Segment(self.path / name)
+        return segment
+
+    def _live_mask(self) -> np.ndarray:
+        live = np.ones(self.next_doc, dtype=bool)
+        if self.deleted:
+            live[np.asarray(self.deleted, dtype=np.int64)] = False
+        return live
+
+    # ------------------------------------------------------------------
+    # Ingestão
+    # ------------------------------------------------------------------
+
+    def update(self, project: str, paths: Sequence[Path]) -> Dict[str, int]:
+        """
+        📝 Sincroniza as transcrições do projeto com o índice
+
+        Arquivos novos/alterados entram em um segmento novo; os que saíram do
+        projeto são apagados. Retorna quantos foram indexados/removidos.
+        """
+        current = {self.key(project, path): Path(path) for path in paths}
+        removed = [key for key, entry in self.documents.items()
+                   if entry['project'] == project and key not in current]
+        for key in removed:
+            self._delete(key)
+
+        batch = []
+        for key, path in current.items():
+            stat = path.stat()
+            entry = self.documents.get(key)
+            if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                continue
+            if entry:
+                self._delete(key)
+            doc_id = self.next_doc
+            self.next_doc += 1
+            self.documents[key] = {'id': doc_id, 'project': project, 'file': path.name, 'path': str(path),
+                                   'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+            batch.append((doc_id, TokenizedDocument(path.read_text(encoding='utf-8'))))
+
+        if batch:
+            name = f"segment_{self.next_segment:06d}"
+            self.next_segment += 1
+            self.path.mkdir(parents=True, exist_ok=True)
+            write_segment(self.path / name, batch)
+            self.segments.append(name)
+
+        if len(self.segments) > self.max_segments:
+            self.merge()
+        return {'indexed': len(batch), 'removed': len(removed)}
+
+    def _delete(self, key: str):
+        entry = self.documents.pop(key, None)
+        if entry is not None:
+            self.deleted.append(entry['id'])
+
+    def merge(self):
+        """🧩 Funde todos os segmentos em um, descartando documentos apagados"""
+        if not self.segments:
+            return
+        name = f"segment_{self.next_segment:06d}"
+        self.next_segment += 1
+        merge_segments(self.path / name, [self._segment(segment) for segment in self.segments],
+                       self._live_mask())
+        self.segments = [name]
+        self.deleted = []
+        self._open.clear()
+
+    def save(self):
+        """💾 Gravação atômica do registro; remove segmentos que não estão nele"""
+        self.path.mkdir(parents=True, exist_ok=True)
+        registry = {'version': REGISTRY_VERSION, 'documents': self.documents, 'deleted': self.deleted,
+                    'segments': self.segments, 'next_doc': self.next_doc,
+                    'next_segment': self.next_segment}
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(registry, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path / "registry.json")
+
+        for child in self.path.iterdir():
+            if child.is_dir() and child.name not in self.segments:
+                shutil.rmtree(child, ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, projects: Optional[Sequence[str]] = None,
+               limit: Optional[int] = None) -> List[Dict]:
+        """
+        🔍 Ocorrências de um termo ou frase ('não sei', 'tecnolog*')
+
+        Ordenadas por projeto, arquivo e posição; cada ocorrência traz a
+        sentença (índice no arquivo) e os offsets [start, end) no texto.
+        """
+        terms = parse_query(query)
+        if not terms or not self.segments:
+            return []
+
+        by_id = {entry['id']: entry for entry in self.documents.values()}
+        live = self._live_mask()
+        if projects:
+            allowed = set(projects)
+            for entry in by_id.values():
+                if entry['project'] not in allowed:
+                    live[entry['id']] = False
+
+        hits = []
+        for name in self.segments:
+            found = match_phrase(self._segment(name), terms, live)
+            hits.extend({'doc': doc, 'sentence': sentence, 'start': start, 'end': end}
+                        for doc, sentence, start, end in zip(found['doc'].tolist(), found['sentence'].tolist(),
+                                                             found['start'].tolist(), found['end'].tolist()))
+
+        for hit in hits:
+            entry = by_id[hit.pop('doc')]
+            hit.update(project=entry['project'], file=entry['file'], path=entry['path'])
+        hits.sort(key=lambda hit: (hit['project'], hit['file'], hit['start']))
+        return hits[:limit] if limit else hits
+
+    @staticmethod
+    def concordance(hits: List[Dict], width: int = 40) -> List[Dict]:
+        """
+        📜 Linhas KWIC: `width` caracteres de contexto de cada lado da ocorrência
+
+        Cada arquivo é lido uma única vez; ocorrências de arquivos que não
+        existem mais são omitidas.
+        """
+        texts: Dict[str, Optional[str]] = {}
+        lines = []
+        for hit in hits:
+            if hit['path'] not in texts:
+                try:
+                    texts[hit['path']] = Path(hit['path']).read_text(encoding='utf-8')
+                except OSError:
+                    texts[hit['path']] = None
+            text = texts[hit['path']]
+            if text is None:
+                continue
+            start, end = hit['start'], hit['end']
+            lines.append({
+                **hit,
+                'left': ' '.join(text[max(0, start - width):start].split()),
+                'match': ' '.join(text[start:end].split()),
+                'right': ' '.join(text[end:end + width].split())
+            })
+        return lines
+
+    @staticmethod
+    def print_concordance(lines: List[Dict], width: int = 40):
+        """Concordância alinhada pela ocorrência"""
+        for line in lines:
+            left = line['left'][-width:]
+            right = line['right'][:width]
+            print(f"{line['project']}/{line['file']}:{line['sentence'] + 1:<5} "
+                  f"{left:>{width}} [{line['match']}] {right}")
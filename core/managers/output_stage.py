@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Output Stage - Geração de gráficos e relatórios em paralelo à análise
+
+Produtor/consumidor: o AnalysisRunner entrega cada resultado assim que a
+análise do arquivo termina e um pool de processos renderiza gráficos e
+relatório enquanto os próximos arquivos são analisados. A fila é limitada
+(max_pending): quando cheia, submit() espera uma renderização terminar, então
+a memória não cresce com o número de arquivos.
+
+Com workers=None o pool é dimensionado a cada projeto: um processo por núcleo
+livre (além dos usados pela análise), limitado ao número de arquivos a
+renderizar menos um. Projetos de um arquivo ou máquinas de um núcleo
+renderizam em série, sem pagar a criação do pool.
+
+Cada arquivo renderiza seus gráficos num diretório temporário próprio; ao
+fechar o estágio os arquivos são movidos para output/ na ordem original dos
+arquivos, preservando o resultado da execução serial (o último arquivo define
+os gráficos por nome) sem escritas concorrentes no mesmo caminho.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.visuals.chart_orchestrator import ChartOrchestrator
+from core.generators.markdown_generator import MarkdownReportGenerator
+
+STAGING_DIR = ".render"
+
+# Geradores de cada processo worker (criados uma vez por processo)
+_worker_charts = None
+_worker_reports = None
+
+
+def _init_output_worker(render_mode: str = 'standalone', profile_memory: bool = False,
+                        cprofile_dir: Optional[Path] = None):
+    """Inicializa os geradores do processo worker (descoberta de charts uma única vez)"""
+    global _worker_charts, _worker_reports
+    # Ctrl+C é tratado pelo processo principal (que encerra o pool)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    with contextlib.redirect_stdout(io.StringIO()):
+        _worker_charts = ChartOrchestrator(render_mode=render_mode)
+        _worker_reports = MarkdownReportGenerator()
+    _worker_charts.profile_memory = profile_memory
+    _worker_charts.cprofile_dir = cprofile_dir
+
+
+def _chart_selection(charts) -> Optional[set]:
+    """charts=True → todos (None); coleção → apenas esses gráficos"""
+    return None if charts is True else set(charts)
+
+
+def _render_outputs_worker(index: int, result: Dict, output_dir: Path, staging_dir: Path,
+                           charts=True, report: bool = True) -> Dict:
+    """
+    Renderiza gráficos (em staging_dir) e/ou relatório (em output_dir) de um arquivo
+    
+    charts: True (todos), False (nenhum) ou conjunto de nomes de gráficos
+    """
+    log = io.StringIO()
+    start = time.perf_counter()
+    chart_profile, figures, error = {}, [], None
+    
+    try:
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        with contextlib.redirect_stdout(log):
+            if charts:
+                chart_profile = _worker_charts.analyze(result, str(staging_dir),
+                                                       _chart_selection(charts)).get('profile', {})
+            if report:
+                _worker_reports.generate_report(result, output_dir, result.get("filename", "arquivo.txt"))
+                
+        # Página única: figuras voltam ao processo principal
+        figures = _worker_charts.pending_figures
+        _worker_charts.pending_figures = []
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        
+    return {
+        'index': index,
+        'file': result.get('filename'),
+        'charts': chart_profile,
+        'figures': figures,
+        'error': error,
+        'elapsed': time.perf_counter() - start,
+        'log': log.getvalue()
+    }
+
+
+class OutputStage:
+    """Estágio de saída: gráficos + relatório por arquivo, em série ou num pool de processos"""
+    
+    def __init__(self, chart_orchestrator: ChartOrchestrator,
+                 markdown_generator: MarkdownReportGenerator,
+                 workers: Optional[int] = 0, max_pending: Optional[int] = None):
+        self.chart_orchestrator = chart_orchestrator
+        self.markdown_generator = markdown_generator
+        self.workers = None if workers is None else max(0, workers)
+        self.queue_size = max_pending
+        self.max_pending = 1
+        
+        # keep_alive: o pool sobrevive a close() e é reaproveitado no próximo start() (--watch)
+        self.keep_alive = False
+        
+        self.output_dir: Optional[Path] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = {}
+        self._queued = []
+        self._renders: List[Dict] = []
+        
+    def resolve_workers(self, renders: Optional[int] = None, busy: int = 1) -> int:
+        """Tamanho do pool: configurado ou, se None, núcleos livres × arquivos a renderizar"""
+        if self.workers is not None:
+            return self.workers
+        spare = (os.cpu_count() or 1) - max(1, busy)
+        if renders is not None:
+            spare = min(spare, renders - 1)
+        return max(0, spare)
+        
+    def start(self, output_dir: Path, renders: Optional[int] = None, busy: int = 1):
+        """
+        Prepara o estágio para um projeto
+        
+        renders: arquivos que serão renderizados; busy: processos ocupados
+        com a análise (ambos só dimensionam o pool quando workers=None)
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._pending = {}
+        self._queued = []
+        self._renders = []
+        
+        workers = self.resolve_workers(renders, busy)
+        self.max_pending = max(1, self.queue_size or 2 * workers)
+        
+        # Pool mantido vivo (keep_alive) é reaproveitado mesmo se o dimensionamento mudar
+        if workers and self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_output_worker,
+                initargs=(self.chart_orchestrator.render_mode,
+                          self.chart_orchestrator.profile_memory,
+                          self.chart_orchestrator.cprofile_dir))
+                          
+    def submit(self, index: int, result: Dict, charts=True, report: bool = True):
+        """
+        Entrega um resultado para renderização (bloqueia se a fila estiver cheia)
+        
+        charts: True (todos), False (nenhum) ou conjunto de nomes de gráficos
+        """
+        if not (charts or report):
+            return
+            
+        # Sem pool: renderização adiada para close(), na ordem dos arquivos
+        if not self._executor:
+            self._queued.append((index, result, charts, report))
+            return
+            
+        while len(self._pending) >= self.max_pending:
+            self._collect(wait(self._pending, return_when=FIRST_COMPLETED).done)
+            
+        future = self._executor.submit(_render_outputs_worker, index, result, self.output_dir,
+                                       self._staging_dir(index), charts, report)
+        self._pending[future] = (index, result, charts)
+        
+    def close(self) -> List[Dict]:
+        """Aguarda as renderizações, publica os gráficos em output/ e retorna os registros"""
+        if not self._executor:
+            for queued in sorted(self._queued, key=lambda queued: queued[0]):
+                self._render_inline(*queued)
+            self._queued = []
+        else:
+            try:
+                while self._pending:
+                    self._collect(wait(self._pending, return_when=FIRST_COMPLETED).done)
+            finally:
+                if not self.keep_alive:
+                    self.shutdown()
+            self._publish()
+            
+        return sorted(self._renders, key=lambda render: render['index'])
+        
+    def shutdown(self):
+        """Encerra o pool de processos (se houver)"""
+        if self._executor:
+            self._executor.shutdown()
+            self._executor = None
+        
+    def _render_inline(self, index: int, result: Dict, charts=True, report: bool = True):
+        """Renderização serial no processo atual (output_workers = 0, comportamento anterior)"""
+        start = time.perf_counter()
+        error = None
+        try:
+            if charts:
+                self.chart_orchestrator.analyze(result, str(self.output_dir), _chart_selection(charts))
+            if report:
+                self.markdown_generator.generate_report(result, self.output_dir,
+                                                        result.get("filename", "arquivo.txt"))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            print(f"❌ Erro ao gerar saídas de {result.get('filename')}: {error}")
+            
+        self._renders.append({'index': index, 'file': result.get('filename'),
+                              'error': error, 'elapsed': time.perf_counter() - start})
+                              
+    def _collect(self, futures):
+        """Incorpora renderizações concluídas (perfil dos gráficos volta ao resultado)"""
+        for future in futures:
+            index, result, charts = self._pending.pop(future)
+            try:
+                render = future.result()
+            except Exception as e:
+                # Falha do próprio worker (ex: processo encerrado)
+                render = {'index': index, 'file': result.get('filename'), 'charts': {},
+                          'figures': [], 'error': f"{type(e).__name__}: {e}",
+                          'elapsed': 0.0, 'log': ''}
+                          
+            chart_profile = render.pop('charts')
+            if charts:
+                result.setdefault('_profile', {})['charts'] = chart_profile
+                
+            if render['error']:
+                print(f"❌ Erro ao gerar saídas de {render['file']}: {render['error']}")
+                if render.get('log'):
+                    print(render['log'])
+            render.pop('log', None)
+            self._renders.append(render)
+            
+    def _publish(self):
+        """Move os gráficos renderizados para output/ na ordem dos arquivos"""
+        staging_root = self.output_dir / STAGING_DIR
+        
+        for render in sorted(self._renders, key=lambda render: render['index']):
+            self.chart_orchestrator.pending_figures.extend(render.pop('figures', []))
+            
+            staging_dir = self._staging_dir(render['index'])
+            if not staging_dir.exists():
+                continue
+            for path in sorted(staging_dir.iterdir()):
+                os.replace(path, self.output_dir / path.name)
+                
+        shutil.rmtree(staging_root, ignore_errors=True)
+        
+    def _staging_dir(self, index: int) -> Path:
+        return self.output_dir / STAGING_DIR / f"{index:05d}"
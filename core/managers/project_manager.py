@@ -39,7 +39,8 @@ class ProjectManager:
                     "word_frequency": {"min_frequency": 2},
                     "temporal_analysis": {"segments": 10},
                     "topic_modeling": {"n_topics": 5}
-                }
+                },
+                "output": {"save_raw_data": False}
             }
             
             config_path = project_dir / "config_analise.json"
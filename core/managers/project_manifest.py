@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Project Manifest - Reanálise incremental de projetos
+
+Registra por transcrição (projects/<nome>/.cache/manifest.json):
+- tamanho, mtime e hash do conteúdo
+- assinatura da análise (versões dos analisadores + configuração)
+- assinatura da renderização (gráficos, relatório, modo de renderização)
+- resultado da análise (pickle em .cache/files/) e saídas produzidas
+- resumo do resultado (gráficos com dados, métricas do resumo final), para
+  que arquivos sem saídas a refazer não precisem ter o pickle carregado
+
+Na execução seguinte só são analisados arquivos novos ou alterados, só são
+renderizadas saídas cujas entradas mudaram e as saídas de transcrições
+removidas são apagadas. O hash só é recalculado quando tamanho/mtime mudam.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+MANIFEST_VERSION = 1
+
+
+def hash_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """🔐 SHA-256 do conteúdo do arquivo, lido em blocos"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def signature(*parts: Any) -> str:
+    """🧬 Assinatura curta de valores serializáveis em JSON"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class ProjectManifest:
+    """📒 Estado da última execução de um projeto (arquivos → resultados e saídas)"""
+
+    def __init__(self, project_path: Path):
+        self.cache_dir = Path(project_path) / ".cache"
+        self.path = self.cache_dir / "manifest.json"
+        self.results_dir = self.cache_dir / "files"
+        self.data = self._load()
+
+    def _load(self) -> Dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                return data
+        except (OSError, ValueError):
+            pass
+        return {'version': MANIFEST_VERSION, 'files': {}, 'order': [], 'render_signature': None}
+
+    @property
+    def files(self) -> Dict[str, Dict]:
+        return self.data['files']
+
+    def plan(self, txt_files: List[Path], analysis_signature: str, render_signature: str,
+             charts_per_file: bool) -> List[Dict]:
+        """
+        🗺️ O que fazer com cada arquivo nesta execução
+
+        Retorna, na ordem dos arquivos, {'index', 'path', 'stat', 'sha256',
+        'analyze', 'report', 'charts', 'render_key', 'digest'}. charts_per_file indica que
+        todos os arquivos aparecem nos gráficos (página única); caso contrário os
+        gráficos são decididos depois da análise (ver stale_charts).
+        """
+        names = [path.name for path in txt_files]
+        order_changed = names != self.data.get('order')
+        signature_changed = render_signature != self.data.get('render_signature')
+        plan = []
+
+        for index, path in enumerate(txt_files):
+            stat = path.stat()
+            entry = self.files.get(path.name, {})
+
+            # Hash só quando tamanho/mtime mudaram
+            if entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+                sha256 = entry.get('sha256')
+            else:
+                sha256 = hash_file(path)
+
+            render_key = signature(sha256, analysis_signature, render_signature)
+            reusable = (entry.get('sha256') == sha256
+                        and entry.get('analysis_signature') == analysis_signature
+                        and self._result_path(path.name).exists())
+            report = entry.get('render_key') != render_key or not all(
+                Path(output).exists() for output in entry.get('outputs', []))
+
+            plan.append({
+                'index': index,
+                'path': path,
+                'stat': (stat.st_size, stat.st_mtime_ns),
+                'sha256': sha256,
+                'analyze': not reusable,
+                'report': report,
+                'charts': False,
+                'render_key': render_key,
+                'digest': entry.get('digest') if reusable else None
+            })
+
+        # Página única depende de todos os arquivos
+        if charts_per_file and (order_changed or signature_changed or any(item['report'] for item in plan)):
+            for item in plan:
+                item['charts'] = True
+
+        return plan
+
+    def stale_charts(self, owners: Dict[str, Dict], output_dir: Path,
+                     chart_files: Dict[str, str]) -> Dict[str, Dict]:
+        """
+        📊 Gráficos cujo arquivo dono mudou
+
+        owners: {chart: item do plano} — arquivo cujo resultado define o gráfico
+        em output/ (o último com dados para ele). Um gráfico é refeito quando o
+        dono ou o render_key do dono mudou, ou o HTML não existe.
+        """
+        previous = self.data.get('charts', {})
+        stale = {}
+        for chart, item in owners.items():
+            record = previous.get(chart, {})
+            if (record.get('file') != item['path'].name
+                    or record.get('render_key') != item['render_key']
+                    or not (Path(output_dir) / chart_files[chart]).exists()):
+                stale[chart] = item
+        return stale
+
+    def record_charts(self, owners: Dict[str, Dict], failed: set):
+        """📝 Registra o dono de cada gráfico (falhas ficam sem registro para nova tentativa)"""
+        self.data['charts'] = {
+            chart: {'file': item['path'].name, 'render_key': item['render_key']}
+            for chart, item in owners.items() if item['index'] not in failed
+        }
+
+    def load_result(self, filename: str) -> Optional[Dict]:
+        """♻️ Resultado armazenado de um arquivo inalterado (None se ilegível)"""
+        try:
+            with open(self._result_path(filename), 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def record(self, item: Dict, analysis_signature: str, result: Optional[Dict],
+               rendered: bool, outputs: List[str], digest: Optional[Dict] = None):
+        """📝 Atualiza a entrada de um arquivo após análise/renderização"""
+        filename = item['path'].name
+        if result is not None:
+            self._store_result(filename, result)
+
+        entry = self.files.setdefault(filename, {})
+        entry.update({
+            'size': item['stat'][0],
+            'mtime_ns': item['stat'][1],
+            'sha256': item['sha256'],
+            'analysis_signature': analysis_signature
+        })
+        if digest is not None:
+            entry['digest'] = digest
+        if rendered:
+            entry['render_key'] = item['render_key']
+            entry['outputs'] = outputs
+
+    def remove_missing(self, present: List[str]) -> List[str]:
+        """🧹 Apaga saídas e resultados de transcrições removidas; retorna o que foi apagado"""
+        removed = []
+        for filename in sorted(set(self.files) - set(present)):
+            entry = self.files.pop(filename)
+            for output in entry.get('outputs', []) + [str(self._result_path(filename))]:
+                try:
+                    os.remove(output)
+                    removed.append(output)
+                except OSError:
+                    pass
+        return removed
+
+    def save(self, order: List[str], render_signature: str):
+        """💾 Gravação atômica do manifesto"""
+        self.data['order'] = order
+        self.data['render_signature'] = render_signature
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
+
+    def _store_result(self, filename: str, result: Dict):
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.results_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._result_path(filename))
+
+    def _result_path(self, filename: str) -> Path:
+        return self.results_dir / f"{filename}.pkl"
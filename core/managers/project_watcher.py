@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Project Watcher - Reanálise contínua conforme transcrições chegam em arquivos/
+
+Consulta arquivos/ a cada `interval` segundos (os.scandir: só nomes, tamanhos
+e mtimes, sem ler conteúdo) e dispara AnalysisRunner.analyze_project quando
+o conjunto de .txt mudou e ficou estável por `debounce` segundos, para não
+pegar um arquivo ainda sendo gravado.
+
+O runner é o mesmo durante toda a sessão: analisadores e gráficos já estão
+importados e descobertos, o pool de renderização fica vivo entre ciclos e o
+manifesto do projeto (.cache/) faz cada ciclo analisar só os arquivos novos
+ou alterados, regenerar só as saídas afetadas e regravar no banco de
+resultados só as linhas desses arquivos; resultados inalterados não são
+carregados do disco.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from core.managers.analysis_runner import AnalysisRunner
+
+
+class ProjectWatcher:
+    """👀 Observa projects/<nome>/arquivos/ e reanalisa o que mudou"""
+
+    def __init__(self, runner: AnalysisRunner, project_path: Path,
+                 interval: float = 0.5, debounce: float = 1.0):
+        self.runner = runner
+        self.project_path = Path(project_path)
+        self.arquivos_dir = self.project_path / "arquivos"
+        self.interval = max(0.05, interval)
+        self.debounce = max(0.0, debounce)
+
+    def snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """Nome → (tamanho, mtime_ns) dos .txt de arquivos/"""
+        state = {}
+        try:
+            with os.scandir(self.arquivos_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.txt') and entry.is_file():
+                        stat = entry.stat()
+                        state[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            pass
+        return state
+
+    @staticmethod
+    def describe(before: Dict, after: Dict) -> str:
+        """Resumo das mudanças entre dois snapshots"""
+        added = sorted(set(after) - set(before))
+        removed = sorted(set(before) - set(after))
+        changed = sorted(name for name in set(before) & set(after) if before[name] != after[name])
+        parts = [f"{label}: {', '.join(names)}" for label, names in
+                 (('novos', added), ('alterados', changed), ('removidos', removed)) if names]
+        return "; ".join(parts)
+
+    def run(self, max_cycles: Optional[int] = None):
+        """
+        🔁 Análise inicial e depois um ciclo por mudança estável (Ctrl+C encerra)
+
+        max_cycles limita o número de reanálises (None = sem limite).
+        """
+        self.runner.output_stage.keep_alive = True
+        cycles = 0
+        try:
+            analyzed = self.snapshot()
+            self._analyze()
+            print(f"\n👀 Observando {self.arquivos_dir} (a cada {self.interval:g}s, "
+                  f"estável por {self.debounce:g}s) — Ctrl+C para sair")
+
+            seen, changed_at = analyzed, time.monotonic()
+            while max_cycles is None or cycles < max_cycles:
+                time.sleep(self.interval)
+                current = self.snapshot()
+                if current != seen:
+                    seen, changed_at = current, time.monotonic()
+                    continue
+                if current == analyzed or time.monotonic() - changed_at < self.debounce:
+                    continue
+
+                print(f"\n📥 {self.describe(analyzed, current)}")
+                analyzed = current
+                self._analyze()
+                cycles += 1
+                print(f"\n👀 Observando {self.arquivos_dir}...")
+        except KeyboardInterrupt:
+            print("\n👋 Observação encerrada")
+        finally:
+            self.runner.output_stage.shutdown()
+
+    def _analyze(self) -> bool:
+        start = time.perf_counter()
+        success = self.runner.analyze_project(self.project_path)
+        print(f"⏱️  Ciclo concluído em {time.perf_counter() - start:.2f}s")
+        return success
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Raw Export - Resultados brutos do projeto em colunas (NumPy)
+
+Com "save_raw_data" ligado na seção "output" de config_analise.json, a
+análise grava output/raw/ com uma tabela por tipo de dado, todos os arquivos
+do projeto juntos e cada coluna em um .npy tipado:
+
+- files: file (nome da transcrição); a posição é o file_id das demais tabelas
+- metrics: file_id, metric, value (uma linha por arquivo × métrica numérica)
+- segments: file_id, segment, sentiment, cognitive_load, hesitations, word_count
+- word_frequencies: file_id, word, count
+- concept_edges: file_id, word1, word2, weight, pmi, npmi
+
+Textos repetidos (palavras, nomes de métricas) são codificados como índices
+int32 em dicionários (vocabulary.npy, metric_names.npy). Um .npy por coluna
+(em vez de um .npz) permite abrir tudo com mmap: RawExport só lê do disco as
+colunas e linhas efetivamente acessadas. schema.json descreve as tabelas.
+"""
+
+import json
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from core.managers.result_store import flatten_metrics, result_filename
+
+EXPORT_VERSION = 1
+RAW_EXPORT_DIR = "raw"
+
+# Tabela → coluna → dtype (colunas com dicionário guardam índices int32)
+TABLES = {
+    'files': {'file': 'U'},
+    'metrics': {'file_id': 'int32', 'metric': 'int32', 'value': 'float64'},
+    'segments': {'file_id': 'int32', 'segment': 'int32', 'sentiment': 'float32',
+                 'cognitive_load': 'float32', 'hesitations': 'int32', 'word_count': 'int32'},
+    'word_frequencies': {'file_id': 'int32', 'word': 'int32', 'count': 'int32'},
+    'concept_edges': {'file_id': 'int32', 'word1': 'int32', 'word2': 'int32',
+                      'weight': 'float32', 'pmi': 'float32', 'npmi': 'float32'}
+}
+DICTIONARIES = {
+    ('metrics', 'metric'): 'metric_names',
+    ('word_frequencies', 'word'): 'vocabulary',
+    ('concept_edges', 'word1'): 'vocabulary',
+    ('concept_edges', 'word2'): 'vocabulary'
+}
+
+
+def _float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def _int(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
+
+
+class _Encoder:
+    """Texto → índice estável (ordem de primeira aparição)"""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+
+    def __call__(self, value) -> int:
+        value = str(value)
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.codes)
+        return code
+
+    def values(self) -> np.ndarray:
+        return np.array(list(self.codes), dtype=str) if self.codes else np.zeros(0, dtype='U1')
+
+
+def write_raw_export(results: List[Dict], output_dir: Path, signature: Optional[str] = None) -> Path:
+    """
+    💾 Grava output/raw/ a partir dos resultados do projeto
+
+    Só as entradas dos analisadores são lidas (as cópias no nível raiz do
+    resultado são ignoradas). A pasta é montada ao lado e trocada no fim,
+    então leitores nunca veem uma exportação pela metade. `signature` vai
+    para schema.json e permite pular a exportação quando nada mudou.
+    """
+    columns = {table: {column: [] for column in spec} for table, spec in TABLES.items()}
+    dictionaries = {'vocabulary': _Encoder(), 'metric_names': _Encoder()}
+    vocabulary, metric_names = dictionaries['vocabulary'], dictionaries['metric_names']
+
+    for file_id, result in enumerate(results):
+        columns['files']['file'].append(result_filename(result))
+
+        metrics = columns['metrics']
+        for analyzer, metric, value in flatten_metrics(result):
+            metrics['file_id'].append(file_id)
+            metrics['metric'].append(metric_names(f"{analyzer}.{metric}"))
+            metrics['value'].append(value)
+
+        segments = columns['segments']
+        for position, segment in enumerate(result.get('temporal_analysis') or []):
+            if not isinstance(segment, dict):
+                continue
+            segments['file_id'].append(file_id)
+            segments['segment'].append(_int(segment.get('segment', position + 1)))
+            for column in ('sentiment', 'cognitive_load'):
+                segments[column].append(_float(segment.get(column)))
+            for column in ('hesitations', 'word_count'):
+                segments[column].append(_int(segment.get(column)))
+
+        frequencies = columns['word_frequencies']
+        for word, count in ((result.get('word_frequency') or {}).get('word_frequencies') or {}).items():
+            frequencies['file_id'].append(file_id)
+            frequencies['word'].append(vocabulary(word))
+            frequencies['count'].append(_int(count))
+
+        edges = columns['concept_edges']
+        concept_network = result.get('concept_network')
+        for edge in concept_network if isinstance(concept_network, list) else []:
+            if not isinstance(edge, dict) or 'word1' not in edge or 'word2' not in edge:
+                continue
+            edges['file_id'].append(file_id)
+            edges['word1'].append(vocabulary(edge['word1']))
+            edges['word2'].append(vocabulary(edge['word2']))
+            for column in ('weight', 'pmi', 'npmi'):
+                edges[column].append(_float(edge.get(column)))
+
+    output_dir = Path(output_dir)
+    target = output_dir / RAW_EXPORT_DIR
+    staging = output_dir / f".{RAW_EXPORT_DIR}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+
+    schema = {'version': EXPORT_VERSION, 'signature': signature, 'tables': {}, 'dictionaries': {}}
+    for table, spec in TABLES.items():
+        for column, dtype in spec.items():
+            values = columns[table][column]
+            array = np.array(values, dtype=str) if dtype == 'U' else np.asarray(values, dtype=dtype)
+            np.save(staging / f"{table}.{column}.npy", array)
+        schema['tables'][table] = {
+            'rows': len(columns[table][next(iter(spec))]),
+            'columns': {column: {'dtype': dtype, 'dictionary': DICTIONARIES.get((table, column))}
+                        for column, dtype in spec.items()}
+        }
+    for name, encoder in dictionaries.items():
+        np.save(staging / f"{name}.npy", encoder.values())
+        schema['dictionaries'][name] = len(encoder.codes)
+
+    with open(staging / "schema.json", 'w', encoding='utf-8') as f:
+        json.dump(schema, f, ensure_ascii=False, indent=2)
+
+    shutil.rmtree(target, ignore_errors=True)
+    staging.rename(target)
+    return target
+
+
+class RawExport:
+    """📂 Leitura preguiçosa de output/raw/ (colunas abertas com mmap sob demanda)"""
+
+    def __init__(self, path: Path, mmap: bool = True):
+        self.path = Path(path)
+        self.mmap_mode = 'r' if mmap else None
+        with open(self.path / "schema.json", 'r', encoding='utf-8') as f:
+            self.schema = json.load(f)
+        if self.schema.get('version') != EXPORT_VERSION:
+            raise ValueError(f"Versão de exportação não suportada: {self.schema.get('version')}")
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    @property
+    def tables(self) -> List[str]:
+        return list(self.schema['tables'])
+
+    def _load(self, name: str) -> np.ndarray:
+        array = self._arrays.get(name)
+        if array is None:
+            array = self._arrays[name] = np.load(self.path / f"{name}.npy", mmap_mode=self.mmap_mode)
+        return array
+
+    def column(self, table: str, column: str, decode: bool = False) -> np.ndarray:
+        """Coluna tipada; decode=True troca índices de dicionário pelos textos"""
+        spec = self.schema['tables'][table]['columns'][column]
+        values = self._load(f"{table}.{column}")
+        if decode and spec['dictionary']:
+            return self.dictionary(spec['dictionary'])[values]
+        return values
+
+    def dictionary(self, name: str) -> np.ndarray:
+        return self._load(name)
+
+    def table(self, table: str, columns: Optional[List[str]] = None,
+              decode: bool = False) -> Dict[str, np.ndarray]:
+        """Colunas de uma tabela (todas por padrão)"""
+        names = columns or list(self.schema['tables'][table]['columns'])
+        return {name: self.column(table, name, decode) for name in names}
+
+    def frame(self, table: str, columns: Optional[List[str]] = None):
+        """DataFrame do pandas; colunas de dicionário viram Categorical (sem copiar textos)"""
+        import pandas as pd
+
+        data = {}
+        spec = self.schema['tables'][table]['columns']
+        for name in columns or list(spec):
+            values = self.column(table, name)
+            dictionary = spec[name]['dictionary']
+            if dictionary:
+                values = pd.Categorical.from_codes(values, categories=self.dictionary(dictionary))
+            data[name] = values
+        if 'file_id' in data:
+            data['file_id'] = pd.Categorical.from_codes(data['file_id'],
+                                                        categories=self.column('files', 'file'))
+            data['file'] = data.pop('file_id')
+        return pd.DataFrame(data)
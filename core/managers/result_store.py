@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Result Store - Resultados de todos os projetos em SQLite
+
+Cada análise de projeto grava seus resultados em projects/results.db
+(system.result_store) em uma única transação com inserções em lote; na
+reanálise incremental só as linhas dos arquivos novos, alterados ou
+removidos mudam:
+
+- files: uma linha por transcrição analisada
+- metrics: uma linha por arquivo × analisador × métrica numérica
+  (ex: global_metrics / global_sentiment, linguistic_patterns / total_hesitations)
+- word_frequencies, segments, contradictions, concept_edges: detalhes
+  tabulares (frequências, segmentos temporais, contradições, arestas da
+  rede de conceitos)
+
+As consultas (filtros por métrica, agregados por projeto, SQL livre em modo
+somente leitura) usam os índices, sem reanalisar nada.
+"""
+
+import json
+import numbers
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+SCHEMA_VERSION = 1
+RESULT_STORE_PATH = Path("projects/results.db")
+GLOBAL_CONFIG_PATH = Path("config/global_config.json")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    project TEXT NOT NULL,
+    file TEXT NOT NULL,
+    path TEXT,
+    analyzed_at TEXT,
+    stored_at TEXT NOT NULL,
+    UNIQUE (project, file)
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    analyzer TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (file_id, analyzer, metric)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_metrics_value ON metrics (analyzer, metric, value);
+CREATE TABLE IF NOT EXISTS word_frequencies (
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    word TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (file_id, word)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_word_frequencies_word ON word_frequencies (word, count);
+CREATE TABLE IF NOT EXISTS segments (
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    segment INTEGER NOT NULL,
+    position TEXT,
+    sentiment REAL,
+    cognitive_load REAL,
+    hesitations INTEGER,
+    word_count INTEGER,
+    PRIMARY KEY (file_id, segment)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS contradictions (
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    position INTEGER NOT NULL,
+    score REAL,
+    type TEXT,
+    text1 TEXT,
+    text2 TEXT,
+    timestamp1 REAL,
+    timestamp2 REAL,
+    PRIMARY KEY (file_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_contradictions_score ON contradictions (score);
+CREATE TABLE IF NOT EXISTS concept_edges (
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    word1 TEXT NOT NULL,
+    word2 TEXT NOT NULL,
+    weight REAL,
+    pmi REAL,
+    npmi REAL,
+    PRIMARY KEY (file_id, word1, word2)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_concept_edges_word1 ON concept_edges (word1);
+CREATE INDEX IF NOT EXISTS idx_concept_edges_word2 ON concept_edges (word2);
+"""
+
+DETAIL_TABLES = ('metrics', 'word_frequencies', 'segments', 'contradictions', 'concept_edges')
+
+# Subárvores que não viram métricas (tabelas próprias ou listas de palavras)
+SKIPPED_KEYS = {'calibration_used', 'word_frequencies', 'top_words'}
+MAX_METRIC_DEPTH = 4
+
+FILTER_PATTERN = re.compile(r'^\s*([\w.]+)\s*(<=|>=|!=|==|=|<|>)\s*(.+?)\s*$')
+
+
+def _numeric(value) -> Optional[float]:
+    """Valor escalar numérico (bool vira 0/1); None para o resto e NaN"""
+    if isinstance(value, numbers.Real):
+        value = float(value)
+        return value if value == value else None
+    return None
+
+
+def _integer(value) -> Optional[int]:
+    number = _numeric(value)
+    return None if number is None else int(number)
+
+
+def result_filename(result: Dict) -> str:
+    """Nome da transcrição de um resultado"""
+    return result.get('filename') or Path(result.get('file_path', '')).name
+
+
+def flatten_metrics(result: Dict, max_depth: int = MAX_METRIC_DEPTH) -> Iterator[Tuple[str, str, float]]:
+    """
+    (analisador, métrica, valor) de todos os escalares numéricos do resultado
+
+    Só as entradas de analisadores (dicts com 'analysis_type'); subníveis viram
+    nomes com ponto: speaker_statistics.speakers.Mãe.turns.
+    """
+    def walk(prefix: str, node: Dict, depth: int):
+        for key, value in node.items():
+            if key in SKIPPED_KEYS:
+                continue
+            name = f"{prefix}.{key}" if prefix else str(key)
+            if isinstance(value, dict):
+                if depth < max_depth:
+                    yield from walk(name, value, depth + 1)
+                continue
+            number = _numeric(value)
+            if number is not None:
+                yield name, number
+
+    for analyzer, entry in result.items():
+        if analyzer.startswith('_') or not isinstance(entry, dict) or 'analysis_type' not in entry:
+            continue
+        for metric, value in walk('', entry, 1):
+            yield analyzer, metric, value
+
+
+class ResultStore:
+    """🗄️ Banco SQLite com os resultados de todos os projetos analisados"""
+
+    def __init__(self, path: Path = RESULT_STORE_PATH, read_only: bool = False):
+        self.path = Path(path)
+        self.read_only = read_only
+        if read_only:
+            self.connection = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.connection = sqlite3.connect(str(self.path))
+            self._create_schema()
+
+    @classmethod
+    def configured_path(cls) -> Optional[Path]:
+        """system.result_store de config/global_config.json (None = desligado)"""
+        try:
+            with open(GLOBAL_CONFIG_PATH, 'r', encoding='utf-8') as f:
+                system = json.load(f).get('system', {})
+        except Exception:
+            return RESULT_STORE_PATH
+        path = system.get('result_store', str(RESULT_STORE_PATH))
+        return Path(path) if path else None
+
+    def _create_schema(self):
+        """Cria as tabelas; um esquema de outra versão é descartado (tudo é derivável)"""
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            for table in DETAIL_TABLES + ('files',):
+                self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+        self.connection.executescript(SCHEMA)
+        self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Gravação
+    # ------------------------------------------------------------------
+
+    def write_project(self, project: str, results: List[Dict]) -> Dict[str, int]:
+        """
+        💾 Substitui os resultados do projeto (uma transação, inserções em lote)
+
+        Transcrições que não estão em `results` (removidas ou com erro nesta
+        execução) deixam de constar no banco. Retorna linhas gravadas por tabela.
+        """
+        return self.write_files(project, results, [result_filename(result) for result in results])
+
+    def write_files(self, project: str, results: List[Dict], present: List[str]) -> Dict[str, int]:
+        """
+        💾 Regrava só os arquivos de `results` e apaga os que não estão em `present`
+
+        Usado na reanálise incremental: as linhas das transcrições inalteradas
+        ficam como estão. Retorna linhas gravadas por tabela, arquivos
+        regravados ('files') e removidos ('removed').
+        """
+        stored_at = datetime.now().isoformat(timespec='seconds')
+        rows = {table: [] for table in DETAIL_TABLES}
+        names = [result_filename(result) for result in results]
+        removed = set(self.project_files(project)) - set(present)
+
+        with self.connection:
+            self._delete_files(project, removed | set(names))
+            for name, result in zip(names, results):
+                file_id = self.connection.execute(
+                    "INSERT INTO files (project, file, path, analyzed_at, stored_at) VALUES (?, ?, ?, ?, ?)",
+                    (project, name, result.get('file_path'), result.get('analysis_timestamp'), stored_at)
+                ).lastrowid
+                self._collect_rows(file_id, result, rows)
+
+            self.connection.executemany("INSERT INTO metrics VALUES (?, ?, ?, ?)", rows['metrics'])
+            self.connection.executemany("INSERT INTO word_frequencies VALUES (?, ?, ?)",
+                                        rows['word_frequencies'])
+            self.connection.executemany("INSERT INTO segments VALUES (?, ?, ?, ?, ?, ?, ?)", rows['segments'])
+            self.connection.executemany("INSERT INTO contradictions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                        rows['contradictions'])
+            self.connection.executemany("INSERT OR REPLACE INTO concept_edges VALUES (?, ?, ?, ?, ?, ?)",
+                                        rows['concept_edges'])
+
+        counts = {table: len(table_rows) for table, table_rows in rows.items()}
+        counts['files'] = len(results)
+        counts['removed'] = len(removed)
+        return counts
+
+    def project_files(self, project: str) -> List[str]:
+        """Transcrições do projeto gravadas no banco"""
+        return [row[0] for row in self.connection.execute(
+            "SELECT file FROM files WHERE project = ? ORDER BY file", (project,))]
+
+    def _delete_files(self, project: str, names):
+        params = [(project, name) for name in names]
+        file_ids = "SELECT id FROM files WHERE project = ? AND file = ?"
+        for table in DETAIL_TABLES:
+            self.connection.executemany(f"DELETE FROM {table} WHERE file_id IN ({file_ids})", params)
+        self.connection.executemany("DELETE FROM files WHERE project = ? AND file = ?", params)
+
+    @staticmethod
+    def _collect_rows(file_id: int, result: Dict, rows: Dict[str, List[tuple]]):
+        """Linhas das tabelas de detalhe a partir de um resultado"""
+        rows['metrics'].extend((file_id, analyzer, metric, value)
+                               for analyzer, metric, value in flatten_metrics(result))
+
+        frequencies = (result.get('word_frequency') or {}).get('word_frequencies') or {}
+        rows['word_frequencies'].extend((file_id, str(word), int(count))
+                                        for word, count in frequencies.items())
+
+        segments = result.get('temporal_analysis')
+        if isinstance(segments, list):
+            rows['segments'].extend(
+                (file_id, int(segment.get('segment', position + 1)), segment.get('timestamp'),
+                 _numeric(segment.get('sentiment')), _numeric(segment.get('cognitive_load')),
+                 _integer(segment.get('hesitations')), _integer(segment.get('word_count')))
+                for position, segment in enumerate(segments) if isinstance(segment, dict))
+
+        contradictions = (result.get('contradiction_detection') or {}).get('contradictions') or []
+        rows['contradictions'].extend(
+            (file_id, position, _numeric(item.get('score')), item.get('type'), item.get('text1'),
+             item.get('text2'), _numeric(item.get('timestamp1')), _numeric(item.get('timestamp2')))
+            for position, item in enumerate(contradictions))
+
+        edges = result.get('concept_network')
+        if isinstance(edges, list):
+            rows['concept_edges'].extend(
+                (file_id, edge['word1'], edge['word2'], _numeric(edge.get('weight')),
+                 _numeric(edge.get('pmi')), _numeric(edge.get('npmi')))
+                for edge in edges if isinstance(edge, dict) and 'word1' in edge and 'word2' in edge)
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def metric_names(self) -> List[Tuple[str, str, int]]:
+        """(analisador, métrica, nº de arquivos) de todas as métricas gravadas"""
+        return self.connection.execute(
+            "SELECT analyzer, metric, COUNT(*) FROM metrics GROUP BY analyzer, metric ORDER BY analyzer, metric"
+        ).fetchall()
+
+    def resolve_metric(self, name: str) -> Tuple[str, str]:
+        """
+        'analisador.métrica' ou só 'métrica' → (analisador, métrica)
+
+        ValueError se o nome não existe ou é ambíguo entre analisadores.
+        """
+        candidates = []
+        if '.' in name:
+            analyzer, metric = name.split('.', 1)
+            candidates = self.connection.execute(
+                "SELECT DISTINCT analyzer, metric FROM metrics WHERE analyzer = ? AND metric = ?",
+                (analyzer, metric)).fetchall()
+        if not candidates:
+            candidates = self.connection.execute(
+                "SELECT DISTINCT analyzer, metric FROM metrics WHERE metric = ?", (name,)).fetchall()
+
+        if not candidates:
+            raise ValueError(f"Métrica desconhecida: {name}")
+        if len(candidates) > 1:
+            options = ", ".join(f"{analyzer}.{metric}" for analyzer, metric in candidates)
+            raise ValueError(f"Métrica ambígua: {name} ({options})")
+        return candidates[0]
+
+    def parse_filter(self, expression: str) -> Tuple[str, str, str, object]:
+        """'global_sentiment<0' → (analisador, métrica, operador, valor); project=nome também vale"""
+        match = FILTER_PATTERN.match(expression)
+        if not match:
+            raise ValueError(f"Filtro inválido: {expression} (ex: global_sentiment<0)")
+        name, operator, value = match.groups()
+        operator = '=' if operator == '==' else operator
+
+        if name == 'project':
+            if operator not in ('=', '!='):
+                raise ValueError(f"project só aceita = ou !=: {expression}")
+            return '', 'project', operator, value
+
+        try:
+            number = float(value)
+        except ValueError:
+            raise ValueError(f"Valor não numérico em {expression}")
+        analyzer, metric = self.resolve_metric(name)
+        return analyzer, metric, operator, number
+
+    def query(self, filters: List[str], limit: Optional[int] = None) -> Tuple[List[str], List[tuple]]:
+        """
+        🔍 Transcrições que atendem a todos os filtros
+
+        Cada filtro de métrica é uma junção com `metrics` resolvida pelo índice
+        (analisador, métrica, valor). Retorna (colunas, linhas): projeto,
+        arquivo e o valor de cada métrica filtrada.
+        """
+        columns = ['project', 'file']
+        joins, selected, where, params, join_params = [], [], [], [], []
+
+        for position, expression in enumerate(filters):
+            analyzer, metric, operator, value = self.parse_filter(expression)
+            if metric == 'project' and not analyzer:
+                where.append(f"f.project {operator} ?")
+                params.append(value)
+                continue
+            alias = f"m{position}"
+            joins.append(f"JOIN metrics {alias} ON {alias}.file_id = f.id AND {alias}.analyzer = ? "
+                         f"AND {alias}.metric = ? AND {alias}.value {operator} ?")
+            join_params.extend((analyzer, metric, value))
+            selected.append(f"{alias}.value")
+            columns.append(f"{analyzer}.{metric}")
+
+        sql = f"SELECT {', '.join(['f.project', 'f.file'] + selected)} FROM files f {' '.join(joins)}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY f.project, f.file"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return columns, self.connection.execute(sql, join_params + params).fetchall()
+
+    def aggregate(self, name: str) -> Tuple[List[str], List[tuple]]:
+        """📊 Arquivos, média, mínimo e máximo de uma métrica por projeto"""
+        analyzer, metric = self.resolve_metric(name)
+        rows = self.connection.execute(
+            "SELECT f.project, COUNT(*), AVG(m.value), MIN(m.value), MAX(m.value) "
+            "FROM metrics m JOIN files f ON f.id = m.file_id "
+            "WHERE m.analyzer = ? AND m.metric = ? GROUP BY f.project ORDER BY f.project",
+            (analyzer, metric)).fetchall()
+        return ['project', 'files', 'mean', 'min', 'max'], rows
+
+    def execute(self, sql: str) -> Tuple[List[str], List[tuple]]:
+        """SQL livre (use read_only=True para consultas vindas da CLI)"""
+        cursor = self.connection.execute(sql)
+        columns = [description[0] for description in cursor.description or []]
+        return columns, cursor.fetchall()
+
+
+def print_table(columns: List[str], rows: List[tuple], max_width: int = 40):
+    """Imprime linhas de consulta em colunas alinhadas"""
+    def cell(value) -> str:
+        if isinstance(value, float):
+            return f"{value:.3f}"
+        text = "" if value is None else str(value)
+        return text if len(text) <= max_width else text[:max_width - 1] + "…"
+
+    cells = [[cell(value) for value in row] for row in rows]
+    widths = [max([len(column)] + [len(row[i]) for row in cells]) for i, column in enumerate(columns)]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    print("  ".join("-" * width for width in widths))
+    for row in cells:
+        print("  ".join(value.ljust(width) for value, width in zip(row, widths)))
+    print(f"\n{len(rows)} linha(s)")
@@ -2,19 +2,50 @@
 Orquestrador de gráficos - coordena criação automática de todas as visualizações
 """
 from engine.analyzers import BaseAnalyzer
-from typing import Dict, List
+from core.engine.profiler import profiled_call
+from core.engine.discovery import discover_plugins, load_class
+from core.engine.result_cache import fingerprint_source
+from typing import Dict, List, Optional
 from pathlib import Path
+import html
+
+# Modos de renderização das figuras plotly
+# - standalone: cada HTML embute o plotly.js (~3 MB por gráfico)
+# - shared: HTMLs leves que referenciam um único plotly.min.js em output/
+# - single_page: uma página graficos.html com todas as figuras do projeto
+RENDER_MODES = ('standalone', 'shared', 'single_page')
+PLOTLY_BUNDLE = 'plotly.min.js'
+SINGLE_PAGE = 'graficos.html'
 
 class ChartOrchestrator(BaseAnalyzer):
     """
     Coordena criação automática de todos os gráficos baseado nos dados disponíveis
     """
     
-    def __init__(self, config_path: str = None):
+    def __init__(self, config_path: str = None, render_mode: str = 'standalone'):
         super().__init__(config_path)
-        # Importar sistema de charts
-        from visuals.charts import discover_charts
-        self.available_charts = discover_charts()
+        
+        if render_mode not in RENDER_MODES:
+            raise ValueError(f"Modo de renderização desconhecido: {render_mode} "
+                             f"(opções: {', '.join(RENDER_MODES)})")
+        self.render_mode = render_mode
+        
+        # Figuras aguardando a página única e instâncias reutilizadas entre arquivos
+        self.pending_figures: List[Dict] = []
+        self._chart_instances = {}
+        
+        # Instrumentação (ver core.engine.profiler)
+        self.profile_memory = False
+        self.cprofile_dir: Optional[Path] = None
+        
+        # Descoberta via manifesto: módulos de charts só são importados quando usados
+        import visuals.charts as charts_package
+        from visuals.charts import BaseChart
+        self.available_charts = discover_plugins(
+            "visuals.charts", Path(charts_package.__file__).parent,
+            predicate=lambda name, obj: (issubclass(obj, BaseChart) and obj is not BaseChart
+                                         and name.endswith("Chart"))
+        )
         
         # Mapeamento: que dados cada chart precisa
         self.chart_mappings = {
@@ -60,16 +91,20 @@ class ChartOrchestrator(BaseAnalyzer):
             }
         }
     
-    def analyze(self, analysis_result: Dict, output_dir: str) -> Dict:
-        """Cria todos os gráficos automaticamente baseado nos dados disponíveis"""
+    def analyze(self, analysis_result: Dict, output_dir: str, charts: Optional[set] = None) -> Dict:
+        """Cria todos os gráficos (ou só os indicados em charts) baseado nos dados disponíveis"""
         
         created_charts = []
         errors = []
+        chart_profile = {}
+        profile_label = Path(analysis_result.get('filename', 'analise')).stem
         
         print(f"🎨 ChartOrchestrator: Descobriu {len(self.available_charts)} charts")
         print(f"📊 Dados disponíveis: {list(analysis_result.keys())}")
         
-        for chart_name, chart_class in self.available_charts.items():
+        for chart_name in self.available_charts:
+            if charts is not None and chart_name not in charts:
+                continue
             try:
                 if chart_name in self.chart_mappings:
                     mapping = self.chart_mappings[chart_name]
@@ -79,8 +114,12 @@ class ChartOrchestrator(BaseAnalyzer):
                     if data_key in analysis_result and analysis_result[data_key]:
                         print(f"🎯 Criando {chart_name} com dados de '{data_key}'")
                         
-                        # Criar instância do chart
-                        chart_instance = chart_class()
+                        # Instância do chart (uma por classe, reconfigurada a cada arquivo)
+                        chart_instance = self._chart_instances.get(chart_name)
+                        if chart_instance is None:
+                            chart_class = load_class(self.available_charts[chart_name])
+                            chart_instance = self._chart_instances[chart_name] = chart_class()
+                        chart_instance.figure = None
                         
                         # Preparar dados
                         chart_data = {data_key: analysis_result[data_key]}
@@ -96,11 +135,31 @@ class ChartOrchestrator(BaseAnalyzer):
                         # Configurar chart
                         chart_instance.config.update({
                             'title': title,
-                            'output_path': output_path
+                            'output_path': output_path,
+                            **self._render_options()
                         })
                         
-                        # Criar gráfico
-                        result_path = chart_instance.create(chart_data, output_path)
+                        # Criar gráfico (instrumentado)
+                        cprofile_path = None
+                        if self.cprofile_dir:
+                            cprofile_path = str(Path(self.cprofile_dir) / f"{profile_label}.{chart_name}.prof")
+                        
+                        result_path, chart_profile[chart_name] = profiled_call(
+                            chart_instance.create, (chart_data, output_path),
+                            input_chars=len(str(chart_data[data_key])),
+                            track_memory=self.profile_memory,
+                            cprofile_path=cprofile_path
+                        )
+                        
+                        if self.render_mode == 'single_page' and chart_instance.figure is not None:
+                            self.pending_figures.append({
+                                'source': analysis_result.get('filename', 'Análise'),
+                                'chart': chart_name,
+                                'title': title,
+                                'figure': chart_instance.figure
+                            })
+                            result_path = str(Path(output_dir) / SINGLE_PAGE)
+                        chart_instance.figure = None
                         
                         created_charts.append({
                             'chart': chart_name,
@@ -124,15 +183,113 @@ class ChartOrchestrator(BaseAnalyzer):
                     'status': 'error'
                 })
         
+        # Medições anexadas ao resultado da análise (agregadas por projeto)
+        analysis_result.setdefault('_profile', {})['charts'] = chart_profile
+        
         return {
             'analysis_type': 'chart_orchestration',
             'charts_created': len(created_charts),
             'charts_available': len(self.available_charts),
             'created_charts': created_charts,
             'errors': errors,
+            'profile': chart_profile,
             'success_rate': len(created_charts) / len(self.chart_mappings) if self.chart_mappings else 0
         }
 
+    def charts_with_data(self, result: Dict) -> List[str]:
+        """📋 Gráficos para os quais o resultado tem dados"""
+        charts = []
+        for chart_name in self.available_charts:
+            mapping = self.chart_mappings.get(chart_name)
+            if mapping and result.get(mapping['data_key']):
+                charts.append(chart_name)
+        return charts
+    
+    def chart_owners(self, charts: List[Optional[List[str]]]) -> Dict[str, int]:
+        """
+        🗂️ Posição do resultado que define cada gráfico em output/
+        
+        Os HTMLs têm nome fixo por projeto: cada arquivo sobrescreve os gráficos
+        para os quais tem dados, então vale o último resultado com dados.
+        `charts` traz, por posição, os gráficos com dados (charts_with_data;
+        None para arquivos sem resultado).
+        """
+        owners = {}
+        for position, names in enumerate(charts):
+            for chart_name in names or ():
+                owners[chart_name] = position
+        return owners
+    
+    def _render_options(self) -> Dict:
+        """Opções repassadas ao BaseChart.save_figure conforme o modo"""
+        if self.render_mode == 'shared':
+            return {'include_plotlyjs': PLOTLY_BUNDLE, 'defer_write': False}
+        if self.render_mode == 'single_page':
+            return {'include_plotlyjs': False, 'defer_write': True}
+        return {'include_plotlyjs': True, 'defer_write': False}
+    
+    def finalize(self, output_dir: str) -> List[str]:
+        """
+        📦 Conclui a renderização do projeto (chamar após analyze() de todos os arquivos)
+        
+        Grava o plotly.js uma única vez (modos shared/single_page) e, no modo
+        single_page, a página com todas as figuras pendentes.
+        """
+        if self.render_mode == 'standalone':
+            return []
+            
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        written = [str(self._write_plotly_bundle(output_dir))]
+        
+        # Página única só é regravada quando há figuras novas (reanálise incremental)
+        if self.render_mode == 'single_page' and self.pending_figures:
+            written.append(str(self._write_single_page(output_dir)))
+            
+        return written
+    
+    @staticmethod
+    def _write_plotly_bundle(output_dir: Path) -> Path:
+        """Grava o plotly.js local (sem CDN); não regrava se já estiver igual"""
+        from plotly.offline import get_plotlyjs
+        
+        bundle = get_plotlyjs()
+        bundle_path = output_dir / PLOTLY_BUNDLE
+        if not bundle_path.exists() or bundle_path.stat().st_size != len(bundle.encode('utf-8')):
+            bundle_path.write_text(bundle, encoding='utf-8')
+        return bundle_path
+    
+    def _write_single_page(self, output_dir: Path) -> Path:
+        """Página única com as figuras agrupadas por arquivo analisado"""
+        sections = []
+        current_source = None
+        
+        for index, item in enumerate(self.pending_figures):
+            if item['source'] != current_source:
+                current_source = item['source']
+                sections.append(f"<h2>{html.escape(str(current_source))}</h2>")
+            div = item['figure'].to_html(full_html=False, include_plotlyjs=False,
+                                         div_id=f"grafico-{index}")
+            sections.append(f"<section>{div}</section>")
+            
+        page = (
+            "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+            "<title>Gráficos do projeto</title>\n"
+            f"<script src=\"{PLOTLY_BUNDLE}\"></script>\n</head>\n<body>\n"
+            + "\n".join(sections) +
+            "\n</body>\n</html>\n"
+        )
+        
+        page_path = output_dir / SINGLE_PAGE
+        page_path.write_text(page, encoding='utf-8')
+        self.pending_figures = []
+        return page_path
+    
+    def get_signature(self) -> str:
+        """🧬 Impressão digital da renderização: modo + código dos charts descobertos"""
+        sources = [info['file'] for _, info in sorted(self.available_charts.items())]
+        return f"{self.render_mode}:{fingerprint_source(__file__, *sources)}"
+    
     def get_available_charts(self) -> List[str]:
         """Retorna lista de charts disponíveis"""
         return list(self.available_charts.keys())
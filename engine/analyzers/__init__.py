@@ -28,6 +28,43 @@ class BaseAnalyzer(ABC):
         """Executa a análise principal"""
         pass
     
+    @staticmethod
+    def get_dependencies() -> Dict[str, Dict[str, str]]:
+        """
+        Declara resultados de outros analisadores consumidos por analyze()
+        
+        Formato: {'parametro_de_analyze': {'analyzer': 'chave_do_analisador',
+                                           'result_key': 'chave_no_resultado'}}
+        O orquestrador executa as dependências antes e injeta cada valor
+        como argumento nomeado, evitando reexecutar o analisador upstream.
+        Com {'analyzer': ..., 'instance': True} o argumento é o próprio
+        analisador upstream já configurado (também entregue a begin_stream).
+        """
+        return {}
+    
+    @staticmethod
+    def supports_streaming() -> bool:
+        """
+        Indica se o analisador consome segmentos incrementalmente
+        
+        Analisadores com streaming implementam begin_stream(), consume() e
+        end_stream(); o orquestrador os usa para arquivos grandes, lidos em
+        blocos por engine.text.stream_reader.TranscriptStream.
+        """
+        return False
+    
+    def begin_stream(self, text_length: int):
+        """Prepara os acumuladores (text_length = tamanho estimado do arquivo)"""
+        raise NotImplementedError(f"{self.__class__.__name__} não suporta streaming")
+    
+    def consume(self, segment, position: float = 0.0):
+        """Processa um segmento (TokenizedDocument); position = fração do arquivo lida"""
+        raise NotImplementedError(f"{self.__class__.__name__} não suporta streaming")
+    
+    def end_stream(self) -> Dict:
+        """Retorna o resultado no mesmo formato de analyze()"""
+        raise NotImplementedError(f"{self.__class__.__name__} não suporta streaming")
+    
     def get_calibration_params(self, text_length: int) -> Dict:
         """Retorna parâmetros calibrados baseado no tamanho do texto"""
         if text_length < 1000:  # Texto curto (~15min)
@@ -3,6 +3,7 @@ Template para criar novos analisadores
 Copie este arquivo e implemente os métodos abstratos
 """
 from . import BaseAnalyzer
+from engine.text.tokenized_document import TokenizedDocument
 from typing import Dict
 
 class TemplateAnalyzer(BaseAnalyzer):
@@ -14,20 +15,26 @@ class TemplateAnalyzer(BaseAnalyzer):
     2. Renomeie a classe: TemplateAnalyzer -> MeuAnalyzer  
     3. Implemente o método analyze()
     4. Crie arquivo de config em config/analysis_configs/
+    5. (Opcional) Declare em get_dependencies() os resultados de outros
+       analisadores que analyze() recebe como argumentos nomeados
     """
     
-    def analyze(self, text: str) -> Dict:
+    def analyze(self, text: str, document: TokenizedDocument = None) -> Dict:
         """
         Implementar análise principal aqui
         
         Args:
             text: Texto da transcrição para analisar
+            document: Tokenização compartilhada (fornecida pelo orquestrador)
             
         Returns:
             Dict com resultados da análise
         """
+        if document is None:
+            document = TokenizedDocument(text)
+        
         # Exemplo de implementação:
-        text_length = len(text)
+        text_length = len(document)
         calibration = self.get_calibration_params(text_length)
         
         # Sua lógica de análise aqui
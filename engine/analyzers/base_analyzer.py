@@ -22,6 +22,11 @@ class BaseAnalyzer(ABC):
         """Retorna o schema de configuração do analyzer"""
         pass
     
+    @staticmethod
+    def get_dependencies() -> Dict[str, Dict[str, str]]:
+        """Declara resultados de outros analyzers injetados em analyze() (ver engine.analyzers.BaseAnalyzer)"""
+        return {}
+    
     @classmethod
     def get_default_config(cls) -> Dict[str, Any]:
         """Retorna configuração padrão baseada no schema"""
@@ -3,7 +3,9 @@ Template para criar novos analisadores
 Copie este arquivo e implemente os métodos abstratos
 """
 from . import BaseAnalyzer
-from typing import Dict
+from engine.text.tokenized_document import TokenizedDocument
+from engine.text.cooccurrence import CooccurrenceMatrix
+from typing import Dict, Iterable
 
 class ConceptNetworkAnalyzer(BaseAnalyzer):
     """
@@ -15,14 +17,14 @@ class ConceptNetworkAnalyzer(BaseAnalyzer):
     3. Implemente o método analyze()
     4. Crie arquivo de config em config/analysis_configs/
     """
-
+    
     @staticmethod
     def get_config_schema():
         """Retorna o schema de configuração deste analyzer"""
         return {
             'max_words_for_network': {
                 'type': 'int',
-                'range': [10, 100],
+                'range': [10, 5000],
                 'default': 30,
                 'short_text': 20,
                 'long_text': 50,
@@ -30,7 +32,7 @@ class ConceptNetworkAnalyzer(BaseAnalyzer):
             },
             'cooccurrence_window': {
                 'type': 'str',
-                'options': ['sentence', 'paragraph', 'fixed_window'],
+                'options': ['sentence', 'paragraph', 'turn', 'fixed_window'],
                 'default': 'sentence',
                 'description': 'Janela para detectar coocorrência'
             },
@@ -50,12 +52,18 @@ class ConceptNetworkAnalyzer(BaseAnalyzer):
             },
             'max_connections': {
                 'type': 'int',
-                'range': [10, 200],
+                'range': [10, 2000],
                 'default': 20,
                 'short_text': 15,
                 'long_text': 50,
                 'description': 'Número máximo de conexões na rede'
             },
+            'edge_weighting': {
+                'type': 'str',
+                'options': ['count', 'pmi', 'npmi'],
+                'default': 'count',
+                'description': 'Peso usado para ordenar as conexões (contagem bruta ou PMI/NPMI)'
+            },
             'use_word_frequencies': {
                 'type': 'bool',
                 'default': True,
@@ -71,64 +79,79 @@ class ConceptNetworkAnalyzer(BaseAnalyzer):
                 'type': 'bool',
                 'default': False,
                 'description': 'Incluir conexões fracas (coocorrência = 1)'
+            },
+            'project_network': {
+                'type': 'bool',
+                'default': True,
+                'description': 'Gerar também a rede do projeto inteiro (output/concept_network_project.json)'
+            },
+            'project_max_connections': {
+                'type': 'int',
+                'range': [10, 5000],
+                'default': 200,
+                'description': 'Número máximo de conexões na rede do projeto'
             }
         }
-
-    
-    def analyze(self, text: str, word_frequencies: dict = None) -> Dict:
-        """Constrói rede de conceitos baseada em coocorrência"""
-        import re
-        from collections import defaultdict
         
-        # Se não receber word_frequencies, criar análise de frequência
-        if word_frequencies is None:
-            from .word_frequency import WordFrequencyAnalyzer
-            freq_analyzer = WordFrequencyAnalyzer()
-            freq_result = freq_analyzer.analyze(text)
-            word_frequencies = freq_result['word_frequencies']
         
+    def analyze(self, text: str, document: TokenizedDocument = None) -> Dict:
+        """Constrói rede de conceitos baseada em coocorrência"""
+        if document is None:
+            document = TokenizedDocument(text)
+            
         # Calibração
-        calibration = self.get_calibration_params(len(text))
+        calibration = self.get_calibration_params(len(document))
         
-        # Pegar top palavras mais frequentes (igual ao original)
-        top_words = list(word_frequencies.keys())[:30]
+        # Vocabulário: as max_words_for_network palavras mais frequentes do próprio
+        # texto (mesmo filtro do word_frequency, sem o corte em 50 do resultado dele)
+        matrix = self.build_matrix([document])
         
-        # Dividir em sentenças (igual ao original)
-        sentences = re.split(r'[.!?]+', text.lower())
+        # Criar lista de conexões mais fortes
+        connections = matrix.top_edges(
+            limit=self.config.get('max_connections', 20),
+            min_count=self.config.get('min_cooccurrence_count', 1),
+            weighting=self.config.get('edge_weighting', 'count')
+        )
         
-        # Contar coocorrências (igual ao original)
-        cooccurrence = defaultdict(int)
+        return {
+            'analysis_type': 'concept_network',
+            'concept_network': connections,
+            'total_pairs_analyzed': matrix.pair_count,
+            'significant_connections': len(connections),
+            'words_analyzed': len(matrix.vocabulary),
+            'calibration_used': calibration
+        }
         
-        for sentence in sentences:
-            words_in_sentence = [w for w in sentence.split() if w in top_words]
-            
-            # Para cada par de palavras na sentença (igual ao original)
-            for i, word1 in enumerate(words_in_sentence):
-                for word2 in words_in_sentence[i+1:]:
-                    if word1 != word2:
-                        # Ordenar para evitar duplicatas (a,b) e (b,a)
-                        pair = tuple(sorted([word1, word2]))
-                        cooccurrence[pair] += 1
+    def build_matrix(self, documents: Iterable[TokenizedDocument]) -> CooccurrenceMatrix:
+        """Coocorrência esparsa (janela × termo → X.T @ X) sobre o vocabulário dos documentos"""
+        from .word_frequency import WordFrequencyAnalyzer
         
-        # Criar lista de conexões (igual ao original)
-        connections = []
-        for (word1, word2), weight in sorted(cooccurrence.items(), key=lambda x: x[1], reverse=True)[:20]:
-            if weight >= 1:  # Apenas conexões significativas
-                connections.append({
-                    'word1': word1,
-                    'word2': word2,
-                    'weight': weight
-                })
+        return CooccurrenceMatrix.from_documents(
+            documents,
+            limit=self.config.get('max_words_for_network', 30),
+            window=self.config.get('cooccurrence_window', 'sentence'),
+            window_size=self.config.get('fixed_window_size', 10),
+            stopwords=WordFrequencyAnalyzer.STOPWORDS
+        )
         
+    def analyze_project(self, documents: Iterable[TokenizedDocument]) -> Dict:
+        """Rede de conceitos de vários documentos (uma única matriz, vocabulário do conjunto)"""
+        matrix = self.build_matrix(documents)
+        connections = matrix.top_edges(
+            limit=self.config.get('project_max_connections', 200),
+            min_count=self.config.get('min_cooccurrence_count', 1),
+            weighting=self.config.get('edge_weighting', 'count')
+        )
         return {
             'analysis_type': 'concept_network',
             'concept_network': connections,
-            'total_pairs_analyzed': len(cooccurrence),
+            'total_pairs_analyzed': matrix.pair_count,
             'significant_connections': len(connections),
-            'words_analyzed': len(top_words),
-            'calibration_used': calibration
+            'words_analyzed': len(matrix.vocabulary),
+            'documents': matrix.documents,
+            'term_counts': dict(zip(matrix.vocabulary, matrix.term_counts.tolist()))
         }
-    
+        
     def get_calibration_params(self, text_length: int) -> Dict:
         """Sobrescrever se precisar de calibração específica"""
         base_params = super().get_calibration_params(text_length)
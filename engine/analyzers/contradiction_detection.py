@@ -3,7 +3,10 @@ Template para criar novos analisadores
 Copie este arquivo e implemente os métodos abstratos
 """
 from . import BaseAnalyzer
-from typing import Dict
+from engine.text.tokenized_document import TokenizedDocument
+from collections import Counter, defaultdict
+from typing import Dict, List, Tuple
+import re
 
 class ContradictionDetectionAnalyzer(BaseAnalyzer):
     """
@@ -15,7 +18,29 @@ class ContradictionDetectionAnalyzer(BaseAnalyzer):
     3. Implemente o método analyze()
     4. Crie arquivo de config em config/analysis_configs/
     """
-
+    
+    # Padrões de contradição (igual ao original)
+    CONTRADICTION_PATTERNS = [
+        (r'não.*mas.*sim', 'negação seguida de afirmação'),
+        (r'nunca.*sempre', 'contradição temporal'),
+        (r'impossível.*possível', 'contradição de possibilidade'),
+        (r'certeza.*dúvida', 'contradição de certeza'),
+        (r'bom.*ruim', 'contradição de qualidade'),
+        (r'fácil.*difícil', 'contradição de dificuldade')
+    ]
+    
+    NEGATION_WORDS = ['não', 'nunca', 'jamais']
+    
+    # Palavras de conteúdo comparadas entre sentenças
+    CONTENT_WORD = re.compile(r'\b\w{4,}\b')
+    
+    @staticmethod
+    def get_dependencies():
+        """Resultados upstream injetados pelo orquestrador"""
+        return {
+            'temporal_data': {'analyzer': 'temporal_analysis', 'result_key': 'temporal_analysis'}
+        }
+        
     @staticmethod
     def get_config_schema():
         """Retorna o schema de configuração deste analyzer"""
@@ -49,6 +74,12 @@ class ContradictionDetectionAnalyzer(BaseAnalyzer):
                 'default': 3,
                 'description': 'Distância máxima entre sentenças para considerar contradição'
             },
+            'max_shared_term_sentences': {
+                'type': 'int',
+                'range': [10, 10000],
+                'default': 100,
+                'description': 'Termos em mais sentenças que isso não geram pares candidatos de longa distância'
+            },
             'min_contradiction_score': {
                 'type': 'float',
                 'range': [0.0, 1.0],
@@ -85,80 +116,81 @@ class ContradictionDetectionAnalyzer(BaseAnalyzer):
                 'description': 'Método para calcular score de contradição'
             }
         }
-
-    
-    def analyze(self, text: str, temporal_data: list = None) -> Dict:
+        
+        
+    def analyze(self, text: str, temporal_data: list = None,
+                document: TokenizedDocument = None) -> Dict:
         """Detecta possíveis contradições no texto"""
         import re
         
+        if document is None:
+            document = TokenizedDocument(text)
+            
         # Se não receber temporal_data, criar análise temporal
         if temporal_data is None:
             from .temporal_analysis import TemporalAnalysisAnalyzer
             temporal_analyzer = TemporalAnalysisAnalyzer()
-            temporal_result = temporal_analyzer.analyze(text)
+            temporal_result = temporal_analyzer.analyze(text, document=document)
             temporal_data = temporal_result['temporal_analysis']
-        
+            
         # Calibração
-        calibration = self.get_calibration_params(len(text))
+        calibration = self.get_calibration_params(len(document))
         
         contradictions = []
         
-        # Dividir em sentenças (igual ao original)
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        # Padrões de contradição (igual ao original)
-        contradiction_patterns = [
-            (r'não.*mas.*sim', 'negação seguida de afirmação'),
-            (r'nunca.*sempre', 'contradição temporal'),
-            (r'impossível.*possível', 'contradição de possibilidade'),
-            (r'certeza.*dúvida', 'contradição de certeza'),
-            (r'bom.*ruim', 'contradição de qualidade'),
-            (r'fácil.*difícil', 'contradição de dificuldade')
-        ]
-        
-        # Verificar padrões de contradição
-        for i, sent1 in enumerate(sentences):
-            for j, sent2 in enumerate(sentences[i+1:], i+1):
-                if abs(i - j) <= 3:  # Sentenças próximas
-                    combined = f"{sent1.lower()} {sent2.lower()}"
-                    
-                    for pattern, desc in contradiction_patterns:
-                        if re.search(pattern, combined):
-                            score = 0.8 + (len(combined.split()) * 0.01)  # Score variado
-                            contradictions.append({
-                                'score': round(score, 2),
-                                'text1': sent1.strip(),
-                                'text2': sent2.strip(),
-                                'type': desc,
-                                'topics': self._extract_keywords(combined),
-                                'timestamp1': i * 2.5,  # Estimativa temporal
-                                'timestamp2': j * 2.5
-                            })
-                            break
-                
-                # Verificar negações do mesmo conceito
-                words1 = set(re.findall(r'\b\w{4,}\b', sent1.lower()))
-                words2 = set(re.findall(r'\b\w{4,}\b', sent2.lower()))
-                common_words = words1.intersection(words2)
-                
-                if common_words and len(common_words) >= 2:
-                    # Verificar se há negação em uma e afirmação na outra
-                    has_negation1 = any(neg in sent1.lower() for neg in ['não', 'nunca', 'jamais'])
-                    has_negation2 = any(neg in sent2.lower() for neg in ['não', 'nunca', 'jamais'])
+        # Sentenças já delimitadas pelo documento compartilhado
+        sentences = list(document.sentences())
+        
+        # Atributos por sentença calculados uma única vez (não por par)
+        lowered = [sentence.lower() for sentence in sentences]
+        content_words = [set(self.CONTENT_WORD.findall(sentence)) for sentence in lowered]
+        negated = [any(neg in sentence for neg in self.NEGATION_WORDS) for sentence in lowered]
+        pattern_parts = [pattern.split('.*') for pattern, _ in self.CONTRADICTION_PATTERNS]
+        progress = [[self._pattern_progress(sentence, parts) for parts in pattern_parts]
+                    for sentence in lowered]
                     
-                    if has_negation1 != has_negation2:  # Uma tem negação, outra não
-                        score = 0.6 + (len(common_words) * 0.1)
+        proximity = self.config.get('sentence_proximity', 3)
+        
+        # Verificar apenas pares candidatos (janela deslizante + índice invertido)
+        for i, j in self._candidate_pairs(content_words, negated, proximity):
+            sent1, sent2 = sentences[i], sentences[j]
+            
+            if j - i <= proximity:  # Sentenças próximas
+                for p, (pattern, desc) in enumerate(self.CONTRADICTION_PATTERNS):
+                    # Pré-filtro: partes do padrão precisam aparecer em ordem nas duas sentenças
+                    if progress[j][p][progress[i][p][0]] < len(pattern_parts[p]):
+                        continue
+                        
+                    combined = f"{lowered[i]} {lowered[j]}"
+                    if re.search(pattern, combined):
+                        score = 0.8 + (len(combined.split()) * 0.01)  # Score variado
                         contradictions.append({
                             'score': round(score, 2),
                             'text1': sent1.strip(),
                             'text2': sent2.strip(),
-                            'type': 'negação conceitual',
-                            'topics': list(common_words)[:5],
-                            'timestamp1': i * 2.5,
+                            'type': desc,
+                            'topics': self._extract_keywords(combined),
+                            'timestamp1': i * 2.5,  # Estimativa temporal
                             'timestamp2': j * 2.5
                         })
-        
+                        break
+                        
+            # Verificar negações do mesmo conceito
+            common_words = content_words[i] & content_words[j]
+            
+            if len(common_words) >= 2 and negated[i] != negated[j]:
+                # Uma tem negação, outra não
+                score = 0.6 + (len(common_words) * 0.1)
+                contradictions.append({
+                    'score': round(score, 2),
+                    'text1': sent1.strip(),
+                    'text2': sent2.strip(),
+                    'type': 'negação conceitual',
+                    'topics': list(common_words)[:5],
+                    'timestamp1': i * 2.5,
+                    'timestamp2': j * 2.5
+                })
+                
         # Detectar mudanças de sentimento extremas (igual ao original)
         if temporal_data and len(temporal_data) > 1:
             for i in range(len(temporal_data) - 1):
@@ -177,7 +209,7 @@ class ContradictionDetectionAnalyzer(BaseAnalyzer):
                         'timestamp1': current.get('timestamp', f"{i}%"),
                         'timestamp2': next_seg.get('timestamp', f"{i+1}%")
                     })
-        
+                    
         # Ordenar por score e retornar top contradições
         contradictions.sort(key=lambda x: x['score'], reverse=True)
         
@@ -188,13 +220,68 @@ class ContradictionDetectionAnalyzer(BaseAnalyzer):
             'sentences_analyzed': len(sentences),
             'calibration_used': calibration
         }
-
+        
+    def _candidate_pairs(self, content_words: List[set], negated: List[bool],
+                         proximity: int) -> List[Tuple[int, int]]:
+        """
+        Pares (i, j), i < j, que podem gerar contradição, em ordem.
+        
+        - Janela deslizante: sentenças a até `proximity` posições (padrões regex)
+        - Índice invertido: pares com >= 2 palavras de conteúdo em comum e
+          negação em apenas uma delas, a qualquer distância
+          
+        Termos presentes em mais de `max_shared_term_sentences` sentenças não
+        geram candidatos pelo índice, mantendo o custo linear em transcrições longas.
+        """
+        n = len(content_words)
+        pairs = {(i, j) for i in range(n) for j in range(i + 1, min(n, i + proximity + 1))}
+        
+        # Índice invertido: palavra → sentenças (separadas por presença de negação)
+        postings = defaultdict(lambda: ([], []))
+        for index, words in enumerate(content_words):
+            for word in words:
+                postings[word][negated[index]].append(index)
+                
+        max_postings = self.config.get('max_shared_term_sentences', 100)
+        shared = Counter()
+        for affirmative, negative in postings.values():
+            if not affirmative or not negative:
+                continue
+            if len(affirmative) + len(negative) > max_postings:
+                continue
+            for a in affirmative:
+                for b in negative:
+                    shared[(a, b) if a < b else (b, a)] += 1
+                    
+        pairs.update(pair for pair, count in shared.items() if count >= 2)
+        return sorted(pairs)
+        
+    @staticmethod
+    def _pattern_progress(sentence: str, parts: List[str]) -> List[int]:
+        """
+        Para cada k, quantas partes de um padrão 'a.*b.*c' a sentença completa
+        (em ordem) partindo da parte k. Um par casa se progress2[progress1[0]]
+        alcança todas as partes.
+        """
+        progress = []
+        for k in range(len(parts) + 1):
+            position = 0
+            matched = k
+            while matched < len(parts):
+                found = sentence.find(parts[matched], position)
+                if found < 0:
+                    break
+                position = found + len(parts[matched])
+                matched += 1
+            progress.append(matched)
+        return progress
+        
     def _extract_keywords(self, text: str) -> list:
         """Extrai palavras-chave de um texto"""
         import re
         words = re.findall(r'\b\w{4,}\b', text.lower())
         return list(set(words))[:5]
-    
+        
     def get_calibration_params(self, text_length: int) -> Dict:
         """Sobrescrever se precisar de calibração específica"""
         base_params = super().get_calibration_params(text_length)
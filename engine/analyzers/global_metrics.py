@@ -3,7 +3,11 @@ Template para criar novos analisadores
 Copie este arquivo e implemente os métodos abstratos
 """
 from . import BaseAnalyzer
+from engine.text.tokenized_document import TokenizedDocument
+from engine.text.pattern_matcher import get_matcher
+from engine.text.sentiment import weighted_mean
 from typing import Dict, List
+import numpy as np
 
 class GlobalMetricsAnalyzer(BaseAnalyzer):
     """
@@ -16,22 +20,42 @@ class GlobalMetricsAnalyzer(BaseAnalyzer):
     4. Crie arquivo de config em config/analysis_configs/
     """
     
-    def analyze(self, text: str, temporal_data: List = None) -> Dict:
+    # Hesitações contabilizadas no total (palavras inteiras)
+    HESITATION_WORDS = ['né', 'tipo', 'assim', 'então']
+    
+    @staticmethod
+    def get_dependencies():
+        """Resultados upstream injetados pelo orquestrador"""
+        return {
+            'temporal_data': {'analyzer': 'temporal_analysis', 'result_key': 'temporal_analysis'},
+            'sentence_scores': {'analyzer': 'sentiment_analysis', 'result_key': 'sentence_scores'},
+            'sentiment_analyzer': {'analyzer': 'sentiment_analysis', 'instance': True}
+        }
+
+    def analyze(self, text: str, temporal_data: List = None,
+                document: TokenizedDocument = None, sentence_scores: np.ndarray = None,
+                sentiment_analyzer=None) -> Dict:
         """Calcula métricas globais do texto"""
-        from typing import List
+        if document is None:
+            document = TokenizedDocument(text)
         
         # Se não receber temporal_data, criar análise temporal básica
         if temporal_data is None:
             from .temporal_analysis import TemporalAnalysisAnalyzer
             temporal_analyzer = TemporalAnalysisAnalyzer()
-            temporal_result = temporal_analyzer.analyze(text)
+            temporal_result = temporal_analyzer.analyze(text, document=document)
             temporal_data = temporal_result['temporal_analysis']
         
-        # Sentimento global (média dos segmentos)
-        sentiments = [d['sentiment'] for d in temporal_data] if temporal_data else [0]
-        global_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0
+        # Sentimento global: média das sentenças do sentiment_analysis, ponderada pelos tokens
+        if sentence_scores is None or len(sentence_scores) != document.sentence_count:
+            if sentiment_analyzer is None:
+                from .sentiment_analysis import SentimentAnalysisAnalyzer
+                sentiment_analyzer = SentimentAnalysisAnalyzer()
+            sentence_scores = sentiment_analyzer.score_sentences(document)
+        global_sentiment = weighted_mean(sentence_scores, document.sentence_lengths())
         
-        # Variância do sentimento (abertura emocional)
+        # Variância do sentimento entre segmentos (abertura emocional)
+        sentiments = [d['sentiment'] for d in temporal_data] if temporal_data else [0]
         if len(sentiments) > 1:
             mean = sum(sentiments) / len(sentiments)
             variance = sum((s - mean) ** 2 for s in sentiments) / len(sentiments)
@@ -40,21 +64,21 @@ class GlobalMetricsAnalyzer(BaseAnalyzer):
             sentiment_variance = 0.1
         
         # Hesitações totais
-        total_hesitations = text.lower().count('né') + text.lower().count('tipo') + \
-                        text.lower().count('assim') + text.lower().count('então')
+        matches = get_matcher({'hesitation': self.HESITATION_WORDS}).scan(document)
+        total_hesitations = matches.count('hesitation')
         
         # Coerência temática (baseada em repetição de palavras-chave)
-        words = text.lower().split()
+        words = document.tokens
         unique_words = len(set(words))
         total_words = len(words)
         coherence = 1 - (unique_words / total_words) if total_words > 0 else 0.5
         
         # Calibração
-        calibration = self.get_calibration_params(len(text))
+        calibration = self.get_calibration_params(len(document))
         
         return {
         'analysis_type': 'global_metrics',
-        'global_sentiment': round(global_sentiment, 3),
+        'global_sentiment': round(global_sentiment, 3) + 0.0,  # sem '-0.0'
         'emotional_openness': round(sentiment_variance, 3),  # ← MUDAR AQUI
         'thematic_coherence': round(coherence, 3),
         'total_hesitations': total_hesitations,
@@ -3,7 +3,10 @@ Template para criar novos analisadores
 Copie este arquivo e implemente os métodos abstratos
 """
 from . import BaseAnalyzer
-from typing import Dict
+from engine.text.tokenized_document import TokenizedDocument
+from engine.text.pattern_matcher import get_matcher
+from engine.text.lexicons import RESOURCE_LEXICONS, resource_lexicons
+from typing import Dict, List
 
 class LinguisticPatternsAnalyzer(BaseAnalyzer):
     """
@@ -15,6 +18,23 @@ class LinguisticPatternsAnalyzer(BaseAnalyzer):
     3. Implemente o método analyze()
     4. Crie arquivo de config em config/analysis_configs/
     """
+    
+    # Marcadores de certeza (igual ao original)
+    CERTAINTY_PHRASES = [
+        'com certeza', 'obviamente', 'claramente', 'sem dúvida', 
+        'definitivamente', 'certamente', 'claro que', 'evidente',
+        'tenho certeza', 'absolutamente', 'seguramente'
+    ]
+    
+    # Marcadores de incerteza (igual ao original)
+    UNCERTAINTY_PHRASES = [
+        'talvez', 'acho que', 'não sei', 'pode ser', 'provavelmente',
+        'me parece', 'acredito que', 'suponho', 'imagino que',
+        'não tenho certeza', 'possivelmente', 'quem sabe'
+    ]
+    
+    # Hesitações (igual ao original)
+    HESITATION_WORDS = ['né', 'tipo', 'assim', 'então', 'eh', 'ah', 'uhm', 'ahn']
 
     @staticmethod
     def get_config_schema():
@@ -75,76 +95,116 @@ class LinguisticPatternsAnalyzer(BaseAnalyzer):
         }
 
     
-    def analyze(self, text: str) -> Dict:
+    def analyze(self, text: str, document: TokenizedDocument = None) -> Dict:
         """Detecta padrões linguísticos reais no texto"""
-        import re
-        import numpy as np
+        if document is None:
+            document = TokenizedDocument(text)
         
-        text_lower = text.lower()
-        words = text_lower.split()
+        # Documento inteiro = um único segmento
+        self.begin_stream(len(document))
+        self.consume(document)
+        return self.end_stream()
+    
+    @staticmethod
+    def supports_streaming() -> bool:
+        return True
+    
+    def begin_stream(self, text_length: int):
+        """Zera acumuladores de marcadores e de complexidade"""
+        from collections import Counter
         
-        # Calibração
-        calibration = self.get_calibration_params(len(text))
+        self._text_length = text_length
+        self._matcher = get_matcher(self._lexicons())
+        self._total_words = 0
+        self._pattern_counts = {category: Counter() for category in self._matcher.categories}
+        self._sentence_count = 0
+        self._sentence_length_sum = 0.0
+        self._sentence_length_sq_sum = 0.0
+    
+    def consume(self, segment: TokenizedDocument, position: float = 0.0):
+        """Marcadores + léxicos de resources/ em uma única passada pelos tokens do segmento"""
+        matches = self._matcher.scan(segment)
+        self._total_words += segment.token_count
         
-        # Marcadores de certeza (igual ao original)
-        certainty_phrases = [
-            'com certeza', 'obviamente', 'claramente', 'sem dúvida', 
-            'definitivamente', 'certamente', 'claro que', 'evidente',
-            'tenho certeza', 'absolutamente', 'seguramente'
-        ]
+        for category, counts in self._pattern_counts.items():
+            counts.update(matches.by_pattern(category))
         
-        # Marcadores de incerteza (igual ao original)
-        uncertainty_phrases = [
-            'talvez', 'acho que', 'não sei', 'pode ser', 'provavelmente',
-            'me parece', 'acredito que', 'suponho', 'imagino que',
-            'não tenho certeza', 'possivelmente', 'quem sabe'
-        ]
+        # Complexidade das frases: somas para média/desvio sem guardar as sentenças
+        sentence_lengths = segment.sentence_lengths()
+        self._sentence_count += segment.sentence_count
+        self._sentence_length_sum += float(sentence_lengths.sum())
+        self._sentence_length_sq_sum += float((sentence_lengths.astype(float) ** 2).sum())
+    
+    def end_stream(self) -> Dict:
+        """Monta o resultado a partir dos acumuladores"""
+        import math
         
-        # Hesitações (igual ao original)
-        hesitation_words = ['né', 'tipo', 'assim', 'então', 'eh', 'ah', 'uhm', 'ahn']
+        # Calibração
+        calibration = self.get_calibration_params(self._text_length)
         
-        # Contar ocorrências (igual ao original)
-        certainty_count = sum(1 for phrase in certainty_phrases if phrase in text_lower)
-        uncertainty_count = sum(1 for phrase in uncertainty_phrases if phrase in text_lower)
+        certainty_found = self._present('certainty')
+        uncertainty_found = self._present('uncertainty')
+        certainty_count = len(certainty_found)
+        uncertainty_count = len(uncertainty_found)
         
-        # Hesitações por palavra (igual ao original)
+        # Hesitações por palavra (apenas palavras inteiras)
         hesitations_by_word = {}
         total_hesitations = 0
         
-        for word in hesitation_words:
-            count = text_lower.count(word)
-            if count > 0:
-                hesitations_by_word[word] = {
-                    'count': count,
-                    'percentage': (count / len(words)) * 100 if words else 0
-                }
-                total_hesitations += count
+        for word in self._present('hesitation'):
+            count = self._pattern_counts['hesitation'][word]
+            hesitations_by_word[word] = {
+                'count': count,
+                'percentage': (count / self._total_words) * 100 if self._total_words else 0
+            }
+            total_hesitations += count
         
         # Complexidade das frases (igual ao original)
-        sentences = re.split(r'[.!?]+', text)
-        sentence_lengths = [len(s.split()) for s in sentences if s.strip()]
-        avg_sentence_length = sum(sentence_lengths) / len(sentence_lengths) if sentence_lengths else 0
+        sentence_count = self._sentence_count
+        avg_sentence_length = self._sentence_length_sum / sentence_count if sentence_count else 0
+        variance = self._sentence_length_sq_sum / sentence_count - avg_sentence_length ** 2 if sentence_count else 0
         
         return {
             'analysis_type': 'linguistic_patterns',
             'certainty_markers': {
                 'count': certainty_count,
-                'examples': [p for p in certainty_phrases if p in text_lower][:5],
-                'percentage': (certainty_count / len(sentences)) * 100 if sentences else 0
+                'occurrences': sum(self._pattern_counts['certainty'].values()),
+                'examples': certainty_found[:5],
+                'percentage': (certainty_count / sentence_count) * 100 if sentence_count else 0
             },
             'uncertainty_markers': {
                 'count': uncertainty_count,
-                'examples': [p for p in uncertainty_phrases if p in text_lower][:5],
-                'percentage': (uncertainty_count / len(sentences)) * 100 if sentences else 0
+                'occurrences': sum(self._pattern_counts['uncertainty'].values()),
+                'examples': uncertainty_found[:5],
+                'percentage': (uncertainty_count / sentence_count) * 100 if sentence_count else 0
             },
             'hesitation_phrases': hesitations_by_word,
             'total_hesitations': total_hesitations,
+            'lexicon_counts': {category: sum(self._pattern_counts[f'lexicon:{category}'].values())
+                               for category in RESOURCE_LEXICONS},
             'avg_sentence_length': round(avg_sentence_length, 1),
-            'sentence_length_std': round(np.std(sentence_lengths), 1) if len(sentence_lengths) > 1 else 0,
+            'sentence_length_std': round(math.sqrt(max(variance, 0.0)), 1) if sentence_count > 1 else 0,
             'complexity_by_topic': {},  # TODO: implementar quando tivermos tópicos
             'calibration_used': calibration
         }
     
+    def _present(self, category: str) -> List[str]:
+        """Entradas da categoria encontradas, na ordem do léxico"""
+        counts = self._pattern_counts[category]
+        return [self._matcher.patterns[pid] for pid in self._matcher.category_patterns[category]
+                if counts[self._matcher.patterns[pid]]]
+    
+    def _lexicons(self) -> Dict:
+        """Categorias do autômato: marcadores deste analyzer + léxicos de resources/"""
+        lexicons = {
+            'certainty': self.CERTAINTY_PHRASES,
+            'uncertainty': self.UNCERTAINTY_PHRASES,
+            'hesitation': self.HESITATION_WORDS
+        }
+        for category, entries in resource_lexicons().items():
+            lexicons[f'lexicon:{category}'] = entries
+        return lexicons
+    
     def get_calibration_params(self, text_length: int) -> Dict:
         """Sobrescrever se precisar de calibração específica"""
         base_params = super().get_calibration_params(text_length)
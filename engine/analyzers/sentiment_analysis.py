@@ -3,7 +3,10 @@ Template para criar novos analisadores
 Copie este arquivo e implemente os métodos abstratos
 """
 from . import BaseAnalyzer
+from engine.text.tokenized_document import TokenizedDocument
+from engine.text.sentiment import SENTIMENT_METHODS, SentimentScorer, compile_lexicon, weighted_mean
 from typing import Dict
+import numpy as np
 
 class SentimentAnalysisAnalyzer(BaseAnalyzer):
     """
@@ -76,31 +79,81 @@ class SentimentAnalysisAnalyzer(BaseAnalyzer):
         }
 
     
-    def analyze(self, text: str) -> Dict:
-        """
-        Implementar análise principal aqui
+    def analyze(self, text: str, document: TokenizedDocument = None) -> Dict:
+        """Sentimento por sentença (léxico compilado + negação e intensidade)"""
+        if document is None:
+            document = TokenizedDocument(text)
         
-        Args:
-            text: Texto da transcrição para analisar
-            
-        Returns:
-            Dict com resultados da análise
-        """
-        # Exemplo de implementação:
-        text_length = len(text)
-        calibration = self.get_calibration_params(text_length)
+        calibration = self.get_calibration_params(len(document))
         
-        # Sua lógica de análise aqui
-        results = {
-            "analysis_type": self.get_name(),
-            "text_length": text_length,
-            "calibration_used": calibration,
-            "results": {
-                # Seus resultados aqui
-            }
+        return self._build_result(self.score_sentences(document), document.sentence_lengths(),
+                                  calibration)
+    
+    def _build_result(self, scores: np.ndarray, lengths: np.ndarray, calibration: Dict) -> Dict:
+        """Resultado a partir dos escores por sentença (média ponderada pelos tokens)"""
+        threshold = self._setting('neutral_threshold')
+        
+        return {
+            'analysis_type': 'sentiment_analysis',
+            'sentiment_method': self._setting('sentiment_method'),
+            'sentence_scores': scores,
+            'overall_sentiment': round(weighted_mean(scores, lengths), 3) + 0.0,  # sem '-0.0'
+            'sentiment_distribution': {
+                'positive': int(np.count_nonzero(scores > threshold)),
+                'negative': int(np.count_nonzero(scores < -threshold)),
+                'neutral': int(np.count_nonzero(np.abs(scores) <= threshold))
+            },
+            'calibration_used': calibration
         }
+    
+    def score_sentences(self, document: TokenizedDocument) -> np.ndarray:
+        """Escores por sentença (float32, alinhados a document.sentence_spans)"""
+        return self.get_scorer().sentence_scores(document)
+    
+    def get_scorer(self) -> SentimentScorer:
+        """Pontuador com léxico e regras da configuração"""
+        method = self._setting('sentiment_method')
+        if method not in SENTIMENT_METHODS:
+            raise ValueError(f"Método de sentimento desconhecido: {method} "
+                             f"(opções: {', '.join(SENTIMENT_METHODS)})")
         
-        return results
+        # 'lexicon': só polaridade; 'rule_based': + negação/intensidade;
+        # 'hybrid': regras + léxico básico do discurso oral
+        rules = method != 'lexicon'
+        lexicon = compile_lexicon(self._setting('positive_lexicon'),
+                                  self._setting('negative_lexicon'),
+                                  include_base=method == 'hybrid')
+        return SentimentScorer(lexicon,
+                               negation_words=self._setting('negation_words'),
+                               intensity_modifiers=self._setting('intensity_modifiers'),
+                               context_window=self._setting('context_window'),
+                               negation=rules and self._setting('compound_phrases'),
+                               intensity=rules)
+    
+    def _setting(self, name: str):
+        """Valor configurado ou padrão do schema"""
+        return self.config.get(name, self.get_config_schema()[name]['default'])
+    
+    @staticmethod
+    def supports_streaming() -> bool:
+        return True
+    
+    def begin_stream(self, text_length: int):
+        """Escores das sentenças de cada segmento são concatenados"""
+        self._calibration = self.get_calibration_params(text_length)
+        self._stream_scorer = self.get_scorer()
+        self._stream_scores = []
+        self._stream_lengths = []
+    
+    def consume(self, segment: TokenizedDocument, position: float = 0.0):
+        self._stream_scores.append(self._stream_scorer.sentence_scores(segment))
+        self._stream_lengths.append(segment.sentence_lengths())
+    
+    def end_stream(self) -> Dict:
+        """Mesmo formato de analyze()"""
+        scores = np.concatenate(self._stream_scores or [np.zeros(0, dtype=np.float32)])
+        lengths = np.concatenate(self._stream_lengths or [np.zeros(0, dtype=np.int64)])
+        return self._build_result(scores, lengths, self._calibration)
     
     def get_calibration_params(self, text_length: int) -> Dict:
         """Sobrescrever se precisar de calibração específica"""
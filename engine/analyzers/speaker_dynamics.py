@@ -0,0 +1,84 @@
+"""
+Dinâmica de falantes: tempo de fala, alternância de turnos e perfil por falante
+"""
+from . import BaseAnalyzer
+from engine.text.tokenized_document import TokenizedDocument
+from engine.text.speaker_turns import SpeakerTurns
+from typing import Dict
+
+class SpeakerDynamicsAnalyzer(BaseAnalyzer):
+    """
+    Análise por falante
+    
+    Usa os turnos identificados pelo orquestrador (engine/text/speaker_turns.py):
+    estatísticas de tempo de fala/alternância e, para cada falante, frequência
+    de palavras e sentimento calculados sobre um recorte do documento (view por
+    offsets, sem copiar texto).
+    """
+    
+    @staticmethod
+    def get_dependencies():
+        """Analisadores de frequência e de sentimento configurados pelo orquestrador"""
+        return {
+            'frequency_analyzer': {'analyzer': 'word_frequency', 'instance': True},
+            'sentiment_analyzer': {'analyzer': 'sentiment_analysis', 'instance': True}
+        }
+    
+    @staticmethod
+    def get_config_schema():
+        """Retorna o schema de configuração deste analyzer"""
+        return {
+            'top_words': {
+                'type': 'int',
+                'range': [1, 50],
+                'default': 10,
+                'description': 'Palavras mais frequentes no perfil de cada falante'
+            }
+        }
+    
+    def analyze(self, text: str, document: TokenizedDocument = None,
+                turns: SpeakerTurns = None, frequency_analyzer=None,
+                sentiment_analyzer=None) -> Dict:
+        """Estatísticas de turnos e perfil de cada falante"""
+        if turns is None:
+            # document pode ser um recorte (speaker_scope): turnos vêm do documento inteiro
+            source = getattr(document, 'source', document) or TokenizedDocument(text)
+            turns = SpeakerTurns.parse(source)
+        
+        calibration = self.get_calibration_params(len(turns.document))
+        top_words = self.config.get('top_words', 10)
+        
+        if frequency_analyzer is None:
+            from .word_frequency import WordFrequencyAnalyzer
+            frequency_analyzer = WordFrequencyAnalyzer()
+        if sentiment_analyzer is None:
+            from .sentiment_analysis import SentimentAnalysisAnalyzer
+            sentiment_analyzer = SentimentAnalysisAnalyzer()
+        
+        profiles = {}
+        for speaker in turns.speakers:
+            view = turns.select(speaker=speaker)
+            frequencies = frequency_analyzer.analyze(text, document=view)['word_frequencies']
+            sentiment = sentiment_analyzer.analyze(text, document=view)['overall_sentiment']
+            profiles[speaker] = {
+                'top_words': dict(list(frequencies.items())[:top_words]),
+                'sentiment': sentiment
+            }
+        
+        return {
+            'analysis_type': 'speaker_dynamics',
+            'speaker_statistics': turns.statistics(),
+            'speaker_profiles': profiles,
+            'calibration_used': calibration
+        }
+    
+    def get_calibration_params(self, text_length: int) -> Dict:
+        """Sobrescrever se precisar de calibração específica"""
+        base_params = super().get_calibration_params(text_length)
+        
+        # Adicionar parâmetros específicos da sua análise
+        specific_params = {
+            "my_parameter": "valor_baseado_no_tamanho"
+        }
+        
+        return {**base_params, **specific_params}
@@ -3,7 +3,11 @@ Template para criar novos analisadores
 Copie este arquivo e implemente os métodos abstratos
 """
 from . import BaseAnalyzer
+from engine.text.tokenized_document import TokenizedDocument
+from engine.text.segments import LONG_WORD_CHARS, SegmentScorer, segment_bounds
+from .sentiment_analysis import SentimentAnalysisAnalyzer
 from typing import Dict
+import numpy as np
 
 class TemporalAnalysisAnalyzer(BaseAnalyzer):
     """
@@ -15,6 +19,16 @@ class TemporalAnalysisAnalyzer(BaseAnalyzer):
     3. Implemente o método analyze()
     4. Crie arquivo de config em config/analysis_configs/
     """
+    
+    HESITATION_WORDS = ['hmm', 'ahh', 'então', 'né', 'tipo', 'assim']
+    
+    @staticmethod
+    def get_dependencies():
+        """Resultados upstream injetados pelo orquestrador"""
+        return {
+            'sentence_scores': {'analyzer': 'sentiment_analysis', 'result_key': 'sentence_scores'},
+            'sentiment_analyzer': {'analyzer': 'sentiment_analysis', 'instance': True}
+        }
 
     @staticmethod
     def get_config_schema():
@@ -60,112 +74,141 @@ class TemporalAnalysisAnalyzer(BaseAnalyzer):
         }
 
     
-    def analyze(self, text: str) -> Dict:
+    def analyze(self, text: str, document: TokenizedDocument = None,
+                sentence_scores: np.ndarray = None,
+                sentiment_analyzer: SentimentAnalysisAnalyzer = None) -> Dict:
         """Analisa evolução temporal do texto em segmentos"""
-        import re
+        if document is None:
+            document = TokenizedDocument(text)
+        
+        # Sentimento por sentença do sentiment_analysis (calculado aqui se não injetado)
+        if sentence_scores is None or len(sentence_scores) != document.sentence_count:
+            sentence_scores = (sentiment_analyzer or SentimentAnalysisAnalyzer()).score_sentences(document)
         
         # Calibração baseada no tamanho
-        calibration = self.get_calibration_params(len(text))
+        calibration = self.get_calibration_params(len(document))
         max_segments = calibration.get('segments', 10)
         
-        # Dividir em parágrafos OU por sentenças se for texto corrido
-        paragraphs = []
-        current_block = ""
-
-        # Primeiro tentar por quebras de linha
-        for line in text.split('\n'):
-            line = line.strip()
-            if line:
-                current_block += line + " "
-            else:
-                if current_block:
-                    paragraphs.append(current_block.strip())
-                    current_block = ""
-
-        if current_block:
-            paragraphs.append(current_block.strip())
-
-        # Se só tem 1 parágrafo (texto corrido), dividir por sentenças
-        if len(paragraphs) == 1 and len(paragraphs[0]) > 1000:
-            import re
-            sentences = re.split(r'[.!?]+', paragraphs[0])
-            sentences = [s.strip() for s in sentences if s.strip()]
-            
-            # Agrupar sentenças em blocos de ~500-1000 caracteres
-            paragraphs = []
-            current_block = ""
-            
-            for sentence in sentences:
-                if len(current_block + sentence) > 800:  # Limite por bloco
-                    if current_block:
-                        paragraphs.append(current_block.strip())
-                        current_block = sentence + ". "
-                    else:
-                        current_block += sentence + ". "
-                else:
-                    current_block += sentence + ". "
-            
-            if current_block:
-                paragraphs.append(current_block.strip())
-        
-        # Limitar segmentos baseado na calibração
-        if len(paragraphs) > max_segments:
-            step = len(paragraphs) // max_segments
-            temp = []
-            for i in range(0, len(paragraphs), step):
-                temp.append(' '.join(paragraphs[i:i+step]))
-            paragraphs = temp[:max_segments]
-        
-        # Analisar cada segmento
+        # Limites dos segmentos a partir dos offsets dos tokens (sem montar texto)
+        bounds = segment_bounds(document,
+                                method=self._setting('segment_method'),
+                                max_segments=max_segments,
+                                min_segment_size=self._setting('min_segment_size'))
+        
+        # Todos os segmentos pontuados de uma vez (uma varredura do documento)
+        scores = self._scorer().score(document, bounds)
+        sentiments = self._segment_sentiments(document, bounds, sentence_scores)
+        
         temporal_data = []
-        for i, paragraph in enumerate(paragraphs):
-            if not paragraph:
+        for i in range(len(bounds)):
+            temporal_data.append(self._segment_entry(
+                i, max_segments,
+                words=int(scores['tokens'][i]),
+                long_words=int(scores['long_tokens'][i]),
+                hesitations=int(scores['hesitation'][i]),
+                sentiment=float(sentiments[i])
+            ))
+        
+        return {
+            'analysis_type': 'temporal_analysis',
+            'total_segments': len(temporal_data),
+            'temporal_analysis': temporal_data,
+            'calibration_used': calibration
+        }
+    
+    def _setting(self, name: str):
+        """Valor configurado ou padrão do schema"""
+        return self.config.get(name, self.get_config_schema()[name]['default'])
+    
+    def _scorer(self) -> SegmentScorer:
+        return SegmentScorer({'hesitation': self.HESITATION_WORDS})
+    
+    @staticmethod
+    def _segment_sentiments(document: TokenizedDocument, bounds: np.ndarray,
+                            sentence_scores: np.ndarray) -> np.ndarray:
+        """Média dos escores das sentenças de cada segmento, ponderada pelos tokens"""
+        sentiments = np.zeros(len(bounds))
+        if len(bounds) == 0 or len(sentence_scores) == 0:
+            return sentiments
+        
+        # Sentença pertence ao segmento onde começa
+        lengths = document.sentence_lengths()
+        segment_ids = np.searchsorted(bounds[:, 0], document.sentence_token_bounds[:, 0], side='right') - 1
+        inside = segment_ids >= 0
+        weighted = np.bincount(segment_ids[inside], weights=(sentence_scores * lengths)[inside],
+                               minlength=len(bounds))
+        tokens = np.bincount(segment_ids[inside], weights=lengths[inside], minlength=len(bounds))
+        return np.divide(weighted, tokens, out=sentiments, where=tokens > 0)
+    
+    @staticmethod
+    def _segment_entry(index: int, max_segments: int, words: int, long_words: int,
+                       hesitations: int, sentiment: float) -> Dict:
+        """Métricas de um segmento"""
+        return {
+            'segment': index + 1,
+            'timestamp': f"{index * 100 // max_segments}%",
+            'sentiment': round(sentiment, 3) + 0.0,  # + 0.0: sem '-0.0'
+            'cognitive_load': round(long_words / words, 3) if words else 0,
+            'hesitations': hesitations,
+            'word_count': words
+        }
+    
+    @staticmethod
+    def supports_streaming() -> bool:
+        return True
+    
+    def begin_stream(self, text_length: int, sentiment_analyzer: SentimentAnalysisAnalyzer = None):
+        """Segmentos temporais = faixas fixas da posição no arquivo"""
+        self._calibration = self.get_calibration_params(text_length)
+        self._max_segments = self._calibration.get('segments', 10)
+        self._stream_scorer = self._scorer()
+        self._sentiment_scorer = (sentiment_analyzer or SentimentAnalysisAnalyzer()).get_scorer()
+        self._buckets = {}
+    
+    def consume(self, segment: TokenizedDocument, position: float = 0.0):
+        """Acumula o segmento na faixa temporal correspondente à sua posição"""
+        index = min(self._max_segments - 1, int(position * self._max_segments))
+        bucket = self._buckets.setdefault(index, {
+            'words': 0, 'long_words': 0, 'hesitations': 0,
+            'sentiment_sum': 0.0, 'sentence_tokens': 0
+        })
+        
+        lengths = segment.token_ends - segment.token_starts
+        hits = self._stream_scorer.hits(segment)
+        sentence_lengths = segment.sentence_lengths()
+        sentence_scores = self._sentiment_scorer.sentence_scores(segment)
+        
+        bucket['words'] += segment.token_count
+        bucket['long_words'] += int(np.count_nonzero(lengths > LONG_WORD_CHARS))
+        bucket['hesitations'] += len(hits['hesitation'][0])
+        bucket['sentiment_sum'] += float(np.dot(sentence_scores, sentence_lengths))
+        bucket['sentence_tokens'] += int(sentence_lengths.sum())
+    
+    def end_stream(self) -> Dict:
+        """Converte as faixas acumuladas no formato de analyze()"""
+        temporal_data = []
+        for i in sorted(self._buckets):
+            bucket = self._buckets[i]
+            if not bucket['words']:
                 continue
-                
-            words = paragraph.split()
-            paragraph_lower = paragraph.lower()
-            
-            # Análise de sentimento básica
-            positive_words = ['bom', 'ótimo', 'excelente', 'feliz', 'satisfeito', 'gosto', 
-                            'adoro', 'maravilh', 'incrível', 'positiv', 'melhor', 'sucesso',
-                            'consegui', 'aprendi', 'entendi', 'legal', 'bacana', 'top']
-            
-            negative_words = ['ruim', 'péssimo', 'triste', 'difícil', 'problema', 'erro',
-                            'não', 'nunca', 'medo', 'preocup', 'frustr', 'chato', 'cansado',
-                            'complicado', 'confuso', 'dúvida']
             
-            # Contar sentimentos
-            positive_count = sum(1 for word in positive_words if word in paragraph_lower)
-            negative_count = sum(1 for word in negative_words if word in paragraph_lower)
-            
-            # Calcular sentimento normalizado
-            total_sentiment_words = positive_count + negative_count
-            if total_sentiment_words > 0:
-                sentiment = (positive_count - negative_count) / len(words)
-            else:
-                sentiment = 0.0
-            
-            # Detectar hesitações
-            hesitation_words = ['hmm', 'ahh', 'então', 'né', 'tipo', 'assim']
-            hesitations = sum(paragraph_lower.count(word) for word in hesitation_words)
-            
-            # Calcular carga cognitiva (aproximação)
-            cognitive_load = len([w for w in words if len(w) > 7]) / len(words) if words else 0
-            
-            temporal_data.append({
-                'segment': i + 1,
-                'timestamp': f"{i * 100 // max_segments}%",
-                'sentiment': round(sentiment, 3),
-                'cognitive_load': round(cognitive_load, 3),
-                'hesitations': hesitations,
-                'word_count': len(words)
-            })
+            # Mesmo cálculo de analyze() (média ponderada das sentenças da faixa)
+            sentiment = 0.0
+            if bucket['sentence_tokens']:
+                sentiment = bucket['sentiment_sum'] / bucket['sentence_tokens']
+            temporal_data.append(self._segment_entry(
+                i, self._max_segments,
+                words=bucket['words'],
+                long_words=bucket['long_words'],
+                hesitations=bucket['hesitations'],
+                sentiment=sentiment
+            ))
         
         return {
             'analysis_type': 'temporal_analysis',
             'total_segments': len(temporal_data),
             'temporal_analysis': temporal_data,
-            'calibration_used': calibration
+            'calibration_used': self._calibration
         }
     
     def get_calibration_params(self, text_length: int) -> Dict:
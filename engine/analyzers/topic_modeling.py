@@ -3,7 +3,11 @@ Template para criar novos analisadores
 Copie este arquivo e implemente os métodos abstratos
 """
 from . import BaseAnalyzer
-from typing import Dict
+from engine.text.tokenized_document import TokenizedDocument
+from engine.text.pattern_matcher import get_matcher
+from engine.text.topic_model import TOPIC_METHODS, TopicModel
+from typing import Dict, List
+import numpy as np
 
 class TopicModelingAnalyzer(BaseAnalyzer):
     """
@@ -16,6 +20,13 @@ class TopicModelingAnalyzer(BaseAnalyzer):
     4. Crie arquivo de config em config/analysis_configs/
     """
 
+    @staticmethod
+    def get_dependencies():
+        """Resultados upstream injetados pelo orquestrador"""
+        return {
+            'word_frequencies': {'analyzer': 'word_frequency', 'result_key': 'word_frequencies'}
+        }
+
     @staticmethod
     def get_config_schema():
         """Retorna o schema de configuração deste analyzer"""
@@ -31,9 +42,9 @@ class TopicModelingAnalyzer(BaseAnalyzer):
             },
             'modeling_method': {
                 'type': 'str',
-                'options': ['keyword_based', 'lda', 'nmf', 'lsa'],
-                'default': 'keyword_based',
-                'description': 'Método de modelagem de tópicos'
+                'options': ['keyword_based', 'lda', 'nmf'],
+                'default': 'lda',
+                'description': 'Método de modelagem de tópicos (lda/nmf: modelo do projeto inteiro)'
             },
             'topic_keywords': {
                 'type': 'dict',
@@ -83,18 +94,34 @@ class TopicModelingAnalyzer(BaseAnalyzer):
         }
 
     
-    def analyze(self, text: str, word_frequencies: dict = None) -> Dict:
-        """Extrai tópicos simples baseados em agrupamento de palavras"""
+    def analyze(self, text: str, word_frequencies: dict = None,
+                document: TokenizedDocument = None, topic_model: TopicModel = None) -> Dict:
+        """
+        Extrai tópicos do texto
+        
+        lda/nmf: distribuição do arquivo no modelo do projeto (topic_model,
+        ajustado pelo AnalysisRunner sobre todas as transcrições; só transform
+        aqui). keyword_based: categorias fixas de palavras-chave — também usado
+        quando não há modelo do projeto compatível, já que ajustar um LDA por
+        arquivo custa ordens de grandeza mais que a análise inteira.
+        """
+        
+        if document is None:
+            document = TokenizedDocument(text)
+        
+        settings = self.model_settings()
+        if settings['method'] in TOPIC_METHODS and self._usable_model(topic_model, settings):
+            return self._analyze_with_model(text, document, topic_model)
         
         # Se não receber word_frequencies, criar análise de frequência
         if word_frequencies is None:
             from .word_frequency import WordFrequencyAnalyzer
             freq_analyzer = WordFrequencyAnalyzer()
-            freq_result = freq_analyzer.analyze(text)
+            freq_result = freq_analyzer.analyze(text, document=document)
             word_frequencies = freq_result['word_frequencies']
         
         # Calibração
-        calibration = self.get_calibration_params(len(text))
+        calibration = self.get_calibration_params(len(document))
         
         # Agrupar palavras por categorias temáticas simples (igual ao original)
         topic_keywords = {
@@ -106,17 +133,21 @@ class TopicModelingAnalyzer(BaseAnalyzer):
         }
         
         # Contar palavras por tópico (igual ao original)
+        # Palavras-chave como radicais ('projeto*' casa 'projetos'), uma única passada
+        matches = get_matcher({
+            topic: [f'{keyword}*' for keyword in keywords]
+            for topic, keywords in topic_keywords.items()
+        }).scan(document)
         topic_scores = {}
-        text_lower = text.lower()
         
-        for topic, keywords in topic_keywords.items():
-            score = sum(text_lower.count(keyword) for keyword in keywords)
+        for topic in topic_keywords:
+            score = matches.count(topic)
             if score > 0:
                 topic_scores[topic] = score
         
         # Se nenhum tópico específico, usar genérico
         if not topic_scores:
-            topic_scores['Geral'] = len(text.split())
+            topic_scores['Geral'] = document.token_count
         
         # Normalizar para distribuição
         total = sum(topic_scores.values())
@@ -142,7 +173,77 @@ class TopicModelingAnalyzer(BaseAnalyzer):
                 'label': topic_name
             })
         
-        # Criar hierarquia simples (igual ao original)
+        return {
+            'analysis_type': 'topic_modeling',
+            'topics': topics,
+            'topic_distribution': topic_distribution,
+            'topic_hierarchy': self._hierarchy(topics),
+            'calibration_used': calibration
+        }
+    
+    def model_settings(self) -> Dict:
+        """Parâmetros do TopicModel a partir da configuração"""
+        return {
+            'n_topics': self._setting('n_topics'),
+            'method': self._setting('modeling_method'),
+            'min_word_length': self._setting('min_word_length')
+        }
+    
+    def _setting(self, name: str):
+        """Valor configurado ou padrão do schema"""
+        return self.config.get(name, self.get_config_schema()[name]['default'])
+    
+    @staticmethod
+    def _usable_model(topic_model: TopicModel, settings: Dict) -> bool:
+        """Modelo do projeto só vale se ajustado com a mesma configuração"""
+        return (topic_model is not None and topic_model.fitted
+                and all(topic_model.settings.get(key) == value for key, value in settings.items()))
+    
+    def _analyze_with_model(self, text: str, document: TokenizedDocument,
+                            topic_model: TopicModel) -> Dict:
+        """Tópicos via modelo LDA/NMF do projeto"""
+        calibration = self.get_calibration_params(len(document))
+        
+        distribution = topic_model.transform(document)
+        min_weight = 1.0 / (10 * max(1, len(distribution)))
+        words_per_topic = self._setting('max_words_per_topic')
+        
+        # Ids do modelo preservados: 'topic_3' é o mesmo tópico em todos os arquivos
+        topics = []
+        for topic_id in np.argsort(-distribution, kind='stable'):
+            weight = float(distribution[topic_id])
+            if weight < min_weight:
+                continue
+            words = topic_model.top_terms(topic_id, words_per_topic)
+            topics.append({
+                'id': f'topic_{topic_id}',
+                'words': words,
+                'weight': round(weight, 4),
+                'label': ', '.join(words[:3])
+            })
+        
+        if not topics:
+            topics.append({'id': 'topic_geral', 'words': [], 'weight': 1.0, 'label': 'Geral'})
+        
+        return {
+            'analysis_type': 'topic_modeling',
+            'topics': topics,
+            'topic_distribution': [topic['weight'] for topic in topics],
+            'topic_hierarchy': self._hierarchy(topics),
+            'distinctive_terms': topic_model.distinctive_terms(document, words_per_topic),
+            'topic_model': {
+                'method': topic_model.method,
+                'scope': 'project',
+                'signature': topic_model.signature,
+                'paragraphs': topic_model.units,
+                'vocabulary_size': len(topic_model.vocabulary)
+            },
+            'calibration_used': calibration
+        }
+    
+    @staticmethod
+    def _hierarchy(topics: List[Dict]) -> Dict:
+        """Hierarquia central → tópicos (consumida pelo gráfico de tópicos)"""
         topic_hierarchy = {
             'central_theme': 'TEMAS PRINCIPAIS',
             'nodes': [{'id': 'central', 'label': 'TEMAS PRINCIPAIS', 'level': 0, 'size': 50}],
@@ -162,13 +263,7 @@ class TopicModelingAnalyzer(BaseAnalyzer):
                 'weight': topic['weight']
             })
         
-        return {
-            'analysis_type': 'topic_modeling',
-            'topics': topics,
-            'topic_distribution': topic_distribution,
-            'topic_hierarchy': topic_hierarchy,
-            'calibration_used': calibration
-        }
+        return topic_hierarchy
     
     def get_calibration_params(self, text_length: int) -> Dict:
         """Sobrescrever se precisar de calibração específica"""
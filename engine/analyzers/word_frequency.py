@@ -3,6 +3,7 @@ Template para criar novos analisadores
 Copie este arquivo e implemente os métodos abstratos
 """
 from . import BaseAnalyzer
+from engine.text.tokenized_document import TokenizedDocument
 from typing import Dict
 
 class WordFrequencyAnalyzer(BaseAnalyzer):
@@ -15,6 +16,10 @@ class WordFrequencyAnalyzer(BaseAnalyzer):
     3. Implemente o método analyze()
     4. Crie arquivo de config em config/analysis_configs/
     """
+    
+    # Stopwords básicas
+    STOPWORDS = {'que', 'para', 'com', 'uma', 'por', 'mas', 'das', 'dos', 'como', 'isso', 'então', 'muito', 'mais', 'também'}
+    
     @staticmethod
     def get_config_schema():
         """Retorna o schema de configuração deste analyzer"""
@@ -48,33 +53,49 @@ class WordFrequencyAnalyzer(BaseAnalyzer):
                 'description': 'Arquivo de stopwords a usar'
             }
         }
-    def analyze(self, text: str) -> Dict:
+    def analyze(self, text: str, document: TokenizedDocument = None) -> Dict:
         """Analisa frequência de palavras no texto"""
-        from collections import Counter
-        import re
+        if document is None:
+            document = TokenizedDocument(text)
         
-        # Calibração baseada no tamanho
-        calibration = self.get_calibration_params(len(text))
-        min_frequency = calibration.get('min_frequency', 3)
-        
-        # Processar texto (copiado do analyzer_core.py)
-        text_lower = text.lower()
-        words = re.findall(r'\b[a-záàâãéèêíïóôõöúçñ]{3,}\b', text_lower)
+        # Documento inteiro = um único segmento
+        self.begin_stream(len(document))
+        self.consume(document)
+        return self.end_stream()
+    
+    @staticmethod
+    def supports_streaming() -> bool:
+        return True
+    
+    def begin_stream(self, text_length: int):
+        """Zera contadores"""
+        from collections import Counter
         
-        # Filtrar stopwords básicas
-        stopwords = {'que', 'para', 'com', 'uma', 'por', 'mas', 'das', 'dos', 'como', 'isso', 'então', 'muito', 'mais', 'também'}
-        filtered_words = [w for w in words if w not in stopwords]
+        self._text_length = text_length
+        self._total_words = 0
+        self._word_counts = Counter()
+    
+    def consume(self, segment: TokenizedDocument, position: float = 0.0):
+        """Acumula as palavras do segmento"""
+        # Palavras alfabéticas com 3+ letras (tokenização compartilhada)
+        words = segment.words(min_length=3, alpha_only=True)
+        self._total_words += len(words)
         
-        # Contar palavras (igual ao original)
-        word_counts = Counter(filtered_words)
+        # Filtrar stopwords básicas e contar (igual ao original)
+        self._word_counts.update(w for w in words if w not in self.STOPWORDS)
+    
+    def end_stream(self) -> Dict:
+        """Top palavras acumuladas"""
+        # Calibração baseada no tamanho
+        calibration = self.get_calibration_params(self._text_length)
         
         # Retornar top 50 
-        top_words = dict(word_counts.most_common(50))
+        top_words = dict(self._word_counts.most_common(50))
         
         return {
             'analysis_type': 'word_frequency',
-            'total_words': len(words),
-            'unique_words': len(word_counts),
+            'total_words': self._total_words,
+            'unique_words': len(self._word_counts),
             'word_frequencies': top_words,  # Nome igual ao original
             'calibration_used': calibration
         }
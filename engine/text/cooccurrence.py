@@ -0,0 +1,240 @@
+"""
+Matriz esparsa de coocorrência
+
+Em vez de laços aninhados por sentença, os tokens de cada janela viram uma
+matriz esparsa janela × termo (X) e a coocorrência é X.T @ X. Funciona com
+vocabulários de milhares de termos e pode somar vários documentos (projeto
+inteiro) na mesma matriz. from_documents() escolhe o vocabulário pelos termos
+mais frequentes dos próprios documentos, tokenizando cada um uma única vez.
+
+Janelas suportadas:
+- 'sentence' / 'paragraph': spans do TokenizedDocument
+- 'turn': turnos de fala ("Nome: ..." no início da linha)
+- 'fixed_window': pares de tokens a menos de k posições de distância
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+
+from engine.text.tokenized_document import SPEAKER_LABEL, TokenizedDocument
+
+WINDOW_TYPES = ('sentence', 'paragraph', 'turn', 'fixed_window')
+
+
+def turn_token_bounds(document: TokenizedDocument) -> np.ndarray:
+    """Limites de tokens [início, fim) de cada turno de fala (parágrafos se não houver rótulos)"""
+    label_starts = [m.start() for m in SPEAKER_LABEL.finditer(document.text)]
+    if len(label_starts) < 2:
+        return document.paragraph_token_bounds
+        
+    starts = np.searchsorted(document.token_starts, np.asarray(label_starts, dtype=np.int64))
+    ends = np.append(starts[1:], document.token_count)
+    bounds = np.column_stack([starts, ends])
+    return bounds[bounds[:, 1] > bounds[:, 0]]
+
+
+class CooccurrenceMatrix:
+    """Coocorrência termo × termo (simétrica, diagonal zerada) sobre um vocabulário fixo"""
+    
+    def __init__(self, vocabulary: Sequence[str], window: str = 'sentence', window_size: int = 10):
+        if window not in WINDOW_TYPES:
+            raise ValueError(f"Janela desconhecida: {window} (opções: {', '.join(WINDOW_TYPES)})")
+            
+        self.vocabulary = list(vocabulary)
+        self.index = {term: i for i, term in enumerate(self.vocabulary)}
+        self.window = window
+        self.window_size = max(2, window_size)
+        
+        size = len(self.vocabulary)
+        self.counts = sparse.csr_matrix((size, size), dtype=np.int64)
+        self.term_counts = np.zeros(size, dtype=np.int64)
+        self.documents = 0
+        
+    @classmethod
+    def from_documents(cls, documents: Iterable[TokenizedDocument], limit: int,
+                       window: str = 'sentence', window_size: int = 10, min_length: int = 3,
+                       stopwords: Iterable[str] = ()) -> 'CooccurrenceMatrix':
+        """
+        Matriz sobre os `limit` termos mais frequentes dos documentos
+        
+        Termos elegíveis: só letras, `min_length`+ caracteres, fora de
+        `stopwords`; empates pela ordem de primeira aparição (como
+        Counter.most_common). Cada documento é tokenizado uma vez: guarda-se só
+        o id de cada token num vocabulário provisório e os limites das janelas.
+        """
+        matrix = cls([], window, window_size)
+        stopwords = frozenset(stopwords)
+        provisional: Dict[str, int] = {}
+        
+        encoded: List[Tuple[np.ndarray, Optional[np.ndarray]]] = []
+        for document in documents:
+            # Filtro aplicado uma vez por forma distinta (dict.fromkeys mantém a ordem)
+            lookup = {}
+            for token in dict.fromkeys(document.tokens):
+                if len(token) < min_length or token in stopwords or not token.isalpha():
+                    lookup[token] = -1
+                else:
+                    lookup[token] = provisional.setdefault(token, len(provisional))
+            ids = np.fromiter(map(lookup.__getitem__, document.tokens),
+                              dtype=np.int64, count=document.token_count)
+            bounds = None if window == 'fixed_window' else matrix._window_bounds(document)
+            encoded.append((ids, bounds))
+            
+        totals = np.zeros(len(provisional), dtype=np.int64)
+        for ids, _ in encoded:
+            totals += np.bincount(ids[ids >= 0], minlength=len(provisional))
+            
+        # Mais frequentes primeiro; argsort estável mantém a ordem de aparição nos empates
+        top = np.argsort(-totals, kind='stable')[:max(0, limit)]
+        terms = list(provisional)
+        matrix = cls([terms[i] for i in top], window, window_size)
+        remap = np.full(len(provisional) + 1, -1, dtype=np.int64)
+        remap[top] = np.arange(len(top))
+        
+        # remap[-1] = -1: tokens fora do vocabulário continuam fora
+        for ids, bounds in encoded:
+            matrix._accumulate(remap[ids], bounds)
+        return matrix
+        
+    def add(self, documents: Union[TokenizedDocument, Iterable[TokenizedDocument]]) -> 'CooccurrenceMatrix':
+        """Acumula a coocorrência de um ou mais documentos"""
+        if isinstance(documents, TokenizedDocument):
+            documents = [documents]
+            
+        for document in documents:
+            bounds = None if self.window == 'fixed_window' else self._window_bounds(document)
+            self._accumulate(self._term_ids(document), bounds)
+            
+        return self
+        
+    def _accumulate(self, term_ids: np.ndarray, bounds: Optional[np.ndarray]):
+        """Soma um documento já convertido em ids do vocabulário (-1 = fora)"""
+        if bounds is None:
+            counts = self._sliding_counts(term_ids)
+        else:
+            counts = self._window_counts(term_ids, bounds)
+            
+        self.counts = (self.counts + counts).tocsr()
+        known = term_ids[term_ids >= 0]
+        self.term_counts += np.bincount(known, minlength=len(self.vocabulary))
+        self.documents += 1
+        
+    def _term_ids(self, document: TokenizedDocument) -> np.ndarray:
+        """Índice no vocabulário de cada token (-1 fora do vocabulário)"""
+        index = self.index
+        return np.fromiter((index.get(token, -1) for token in document.tokens),
+                           dtype=np.int64, count=document.token_count)
+                           
+    def _window_bounds(self, document: TokenizedDocument) -> np.ndarray:
+        if self.window == 'paragraph':
+            return document.paragraph_token_bounds
+        if self.window == 'turn':
+            return turn_token_bounds(document)
+        return document.sentence_token_bounds
+        
+    def _window_counts(self, term_ids: np.ndarray, bounds: np.ndarray) -> sparse.csr_matrix:
+        """X.T @ X com X = janela × termo (contagens); cada ocorrência conta"""
+        size = len(self.vocabulary)
+        if len(bounds) == 0:
+            return sparse.csr_matrix((size, size), dtype=np.int64)
+            
+        # Janela de cada token (spans ordenados e disjuntos)
+        positions = np.arange(len(term_ids))
+        window_ids = np.searchsorted(bounds[:, 0], positions, side='right') - 1
+        inside = (window_ids >= 0) & (positions < bounds[np.maximum(window_ids, 0), 1])
+        known = inside & (term_ids >= 0)
+        window_ids, ids = window_ids[known], term_ids[known]
+        
+        X = sparse.csr_matrix(
+            (np.ones(len(ids), dtype=np.int64), (window_ids, ids)),
+            shape=(len(bounds), size)
+        )
+        
+        cooccurrence = (X.T @ X).tocsr()
+        cooccurrence.setdiag(0)
+        cooccurrence.eliminate_zeros()
+        return cooccurrence
+        
+    def _sliding_counts(self, term_ids: np.ndarray) -> sparse.csr_matrix:
+        """Pares de tokens a distância 1..k-1 (janela deslizante de k tokens)"""
+        size = len(self.vocabulary)
+        rows, cols = [], []
+        for distance in range(1, self.window_size):
+            left, right = term_ids[:-distance], term_ids[distance:]
+            keep = (left >= 0) & (right >= 0) & (left != right)
+            rows.append(left[keep])
+            cols.append(right[keep])
+            
+        if not rows:
+            return sparse.csr_matrix((size, size), dtype=np.int64)
+            
+        rows, cols = np.concatenate(rows), np.concatenate(cols)
+        upper = sparse.coo_matrix((np.ones(len(rows), dtype=np.int64), (rows, cols)),
+                                  shape=(size, size)).tocsr()
+        return (upper + upper.T).tocsr()
+        
+    def _pmi(self, rows: np.ndarray, cols: np.ndarray, values: np.ndarray):
+        """
+        PMI e NPMI dos pares (rows, cols) com contagens `values`.
+        
+        Probabilidades derivadas da própria matriz: p(a,b) = C_ab / ΣC e
+        p(a) = Σ_b C_ab / ΣC.
+        """
+        total = self.counts.sum()
+        if total == 0:
+            return np.zeros(len(values)), np.zeros(len(values))
+            
+        marginals = np.asarray(self.counts.sum(axis=1)).ravel() / total
+        joint = values / total
+        pmi = np.log(joint / (marginals[rows] * marginals[cols]))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            npmi = np.where(joint < 1, pmi / -np.log(joint), 1.0)
+        return pmi, npmi
+        
+    def association(self, weighting: str = 'count') -> sparse.csr_matrix:
+        """Matriz de pesos das arestas: 'count', 'pmi' ou 'npmi'"""
+        if weighting not in ('count', 'pmi', 'npmi'):
+            raise ValueError(f"Ponderação desconhecida: {weighting}")
+        if weighting == 'count':
+            return self.counts.astype(np.float64)
+            
+        coo = sparse.triu(self.counts, k=1).tocoo()
+        pmi, npmi = self._pmi(coo.row, coo.col, coo.data)
+        values = pmi if weighting == 'pmi' else npmi
+        upper = sparse.coo_matrix((values, (coo.row, coo.col)), shape=self.counts.shape)
+        return (upper + upper.T).tocsr()
+        
+    def top_edges(self, limit: int = 20, min_count: int = 1, weighting: str = 'count') -> List[Dict]:
+        """Arestas mais fortes (uma por par), ordenadas pelo peso escolhido"""
+        if weighting not in ('count', 'pmi', 'npmi'):
+            raise ValueError(f"Ponderação desconhecida: {weighting}")
+            
+        counts = sparse.triu(self.counts, k=1).tocoo()
+        keep = counts.data >= min_count
+        rows, cols, values = counts.row[keep], counts.col[keep], counts.data[keep]
+        if len(values) == 0:
+            return []
+            
+        pmi, npmi = self._pmi(rows, cols, values)
+        scores = {'count': values, 'pmi': pmi, 'npmi': npmi}[weighting]
+        
+        # Maior peso primeiro; empates pela ordem do vocabulário
+        order = np.lexsort((cols, rows, -scores))[:limit]
+        edges = []
+        for k in order:
+            # Par em ordem alfabética, como (a, b) e (b, a) são a mesma aresta
+            word1, word2 = sorted((self.vocabulary[rows[k]], self.vocabulary[cols[k]]))
+            edges.append({
+                'word1': word1,
+                'word2': word2,
+                'weight': int(values[k]),
+                'pmi': round(float(pmi[k]), 4),
+                'npmi': round(float(npmi[k]), 4)
+            })
+        return edges
+        
+    @property
+    def pair_count(self) -> int:
+        """Número de pares distintos com coocorrência"""
+        return int(sparse.triu(self.counts, k=1).nnz)
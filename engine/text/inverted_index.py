@@ -0,0 +1,191 @@
+"""
+Índice invertido em disco
+
+Postings (termo → documento, posição do token, sentença, offsets de
+caracteres) guardados em segmentos imutáveis: cada ingestão grava um
+segmento novo com os documentos novos/alterados, e segmentos antigos são
+fundidos de tempos em tempos. Cada segmento é uma pasta de .npy:
+
+- terms.npy: termos em ordem lexicográfica
+- offsets.npy: início dos postings de cada termo (len(terms) + 1)
+- doc.npy, position.npy, sentence.npy, start.npy, end.npy: colunas dos
+  postings, ordenadas por (termo, documento, posição)
+
+Tudo é aberto com mmap: uma consulta faz uma busca binária em terms.npy e lê
+só a fatia de postings do termo (termos com '*' no fim ocupam uma faixa
+contígua). Frases são resolvidas intersectando chaves (documento, posição - i)
+dos postings de cada termo.
+"""
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engine.text.tokenized_document import TOKEN_PATTERN, TokenizedDocument
+
+POSTING_COLUMNS = {'doc': np.int32, 'position': np.int32, 'sentence': np.int32,
+                   'start': np.int64, 'end': np.int64}
+
+# Tokens maiores (URLs, lixo de OCR) não são indexados: os termos ficam em um
+# array de largura fixa e um termo gigante multiplicaria o tamanho de terms.npy
+MAX_TERM_LENGTH = 40
+
+
+def parse_query(query: str) -> List[Tuple[str, bool]]:
+    """'não sei*' → [('não', False), ('sei', True)] (termo, é prefixo?)"""
+    terms = []
+    for part in query.lower().split():
+        prefix = part.endswith('*')
+        tokens = TOKEN_PATTERN.findall(part)
+        for i, token in enumerate(tokens):
+            terms.append((token, prefix and i == len(tokens) - 1))
+    return terms
+
+
+def document_postings(doc_id: int, document: TokenizedDocument) -> Tuple[List[str], Dict[str, np.ndarray]]:
+    """Tokens indexáveis do documento e suas colunas de postings"""
+    lengths = document.token_ends - document.token_starts
+    keep = np.flatnonzero(lengths <= MAX_TERM_LENGTH)
+    starts = document.token_starts[keep]
+    sentences = np.searchsorted(document.sentence_spans[:, 0], starts, side='right') - 1
+    tokens = document.tokens
+    return [tokens[i] for i in keep.tolist()], {
+        'doc': np.full(len(keep), doc_id, dtype=np.int32),
+        'position': keep.astype(np.int32),
+        'sentence': np.maximum(sentences, 0).astype(np.int32),
+        'start': starts,
+        'end': document.token_ends[keep]
+    }
+
+
+def _write(path: Path, terms: np.ndarray, offsets: np.ndarray, columns: Dict[str, np.ndarray]):
+    """Grava o segmento em uma pasta temporária e a renomeia (segmentos são imutáveis)"""
+    staging = path.with_name(path.name + '.tmp')
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    np.save(staging / "terms.npy", terms)
+    np.save(staging / "offsets.npy", offsets.astype(np.int64))
+    for name, dtype in POSTING_COLUMNS.items():
+        np.save(staging / f"{name}.npy", np.ascontiguousarray(columns[name], dtype=dtype))
+    staging.rename(path)
+
+
+def _sorted_by_term(term_ids: np.ndarray, term_count: int,
+                    columns: Dict[str, np.ndarray]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Ordena os postings por termo (estável: mantém a ordem documento/posição)"""
+    order = np.argsort(term_ids, kind='stable')
+    offsets = np.zeros(term_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(term_ids, minlength=term_count), out=offsets[1:])
+    return offsets, {name: values[order] for name, values in columns.items()}
+
+
+def write_segment(path: Path, documents: Sequence[Tuple[int, TokenizedDocument]]):
+    """Segmento com os documentos (doc_id, documento), em ordem crescente de doc_id"""
+    tokens, parts = [], []
+    for doc_id, document in documents:
+        doc_tokens, columns = document_postings(doc_id, document)
+        tokens.extend(doc_tokens)
+        parts.append(columns)
+        
+    terms, term_ids = np.unique(np.array(tokens, dtype=str), return_inverse=True)
+    columns = {name: np.concatenate([part[name] for part in parts]) if parts else np.zeros(0, dtype)
+               for name, dtype in POSTING_COLUMNS.items()}
+    offsets, columns = _sorted_by_term(term_ids.ravel(), len(terms), columns)
+    _write(Path(path), terms, offsets, columns)
+
+
+def merge_segments(path: Path, segments: Sequence['Segment'], live: np.ndarray):
+    """
+    Funde segmentos (do mais antigo ao mais novo) descartando documentos
+    apagados; `live` é a máscara bool indexada por doc_id
+    """
+    terms = np.unique(np.concatenate([segment.terms for segment in segments]))
+    term_ids, columns = [], {name: [] for name in POSTING_COLUMNS}
+    for segment in segments:
+        mapped = np.searchsorted(terms, segment.terms)
+        ids = np.repeat(mapped, np.diff(segment.offsets))
+        doc = np.asarray(segment.columns['doc'])
+        keep = live[doc] if len(doc) else np.zeros(0, dtype=bool)
+        term_ids.append(ids[keep])
+        for name in POSTING_COLUMNS:
+            columns[name].append(np.asarray(segment.columns[name])[keep])
+            
+    term_ids = np.concatenate(term_ids)
+    columns = {name: np.concatenate(parts) for name, parts in columns.items()}
+    
+    # Termos que só existiam em documentos apagados saem do vocabulário
+    used = np.zeros(len(terms), dtype=bool)
+    used[term_ids] = True
+    remap = np.cumsum(used) - 1
+    offsets, columns = _sorted_by_term(remap[term_ids], int(used.sum()), columns)
+    _write(Path(path), terms[used], offsets, columns)
+
+
+class Segment:
+    """Segmento aberto com mmap"""
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.terms = np.load(self.path / "terms.npy", mmap_mode='r')
+        self.offsets = np.load(self.path / "offsets.npy", mmap_mode='r')
+        self.columns = {name: np.load(self.path / f"{name}.npy", mmap_mode='r')
+                        for name in POSTING_COLUMNS}
+                        
+    @property
+    def posting_count(self) -> int:
+        return int(self.offsets[-1]) if len(self.offsets) else 0
+        
+    def term_range(self, term: str, prefix: bool = False) -> Tuple[int, int]:
+        """Faixa [início, fim) de ids de termo (busca binária)"""
+        first = int(np.searchsorted(self.terms, term, side='left'))
+        if prefix:
+            return first, int(np.searchsorted(self.terms, term + '\U0010ffff', side='left'))
+        if first < len(self.terms) and self.terms[first] == term:
+            return first, first + 1
+        return first, first
+        
+    def postings(self, term: str, prefix: bool = False,
+                 columns: Sequence[str] = tuple(POSTING_COLUMNS)) -> Dict[str, np.ndarray]:
+        """Colunas dos postings do termo (fatias do mmap, sem cópia)"""
+        first, last = self.term_range(term, prefix)
+        low, high = int(self.offsets[first]), int(self.offsets[last])
+        postings = {name: self.columns[name][low:high] for name in columns}
+        if prefix and last - first > 1:
+            # Vários termos: reordenar por (documento, posição)
+            order = np.lexsort((postings['position'], postings['doc']))
+            postings = {name: values[order] for name, values in postings.items()}
+        return postings
+
+
+def match_phrase(segment: Segment, terms: List[Tuple[str, bool]],
+                 live: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    Ocorrências da frase no segmento: doc, sentence, start (primeiro termo) e
+    end (último termo), ordenadas por documento e posição
+    """
+    empty = {name: np.zeros(0, dtype=POSTING_COLUMNS[name]) for name in ('doc', 'sentence', 'start', 'end')}
+    if not terms:
+        return empty
+        
+    first = segment.postings(*terms[0])
+    keys = (first['doc'].astype(np.int64) << 32) | first['position'].astype(np.int64)
+    index = np.arange(len(keys))
+    end = first['end']
+    
+    for offset, (term, prefix) in enumerate(terms[1:], start=1):
+        if len(keys) == 0:
+            break
+        following = segment.postings(term, prefix, columns=('doc', 'position', 'end'))
+        shifted = ((following['doc'].astype(np.int64) << 32)
+                   | (following['position'].astype(np.int64) - offset))
+        keys, mine, theirs = np.intersect1d(keys, shifted, assume_unique=True, return_indices=True)
+        index = index[mine]
+        end = following['end'][theirs]
+        
+    hits = {'doc': first['doc'][index], 'sentence': first['sentence'][index],
+            'start': first['start'][index], 'end': np.asarray(end)}
+    if live is not None and len(hits['doc']):
+        keep = live[hits['doc']]
+        hits = {name: values[keep] for name, values in hits.items()}
+    return hits
@@ -0,0 +1,47 @@
+"""
+Léxicos de resources/ carregados uma única vez por processo
+"""
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Categoria → arquivo de léxico
+RESOURCE_LEXICONS = {
+    'certeza': 'resources/modalizadores_certeza.txt',
+    'hesitacao': 'resources/hesitacao_termos.txt',
+    'positivo': 'resources/emocionais_positivos.txt',
+    'negativo': 'resources/emocionais_negativos.txt',
+    'conectores': 'resources/conectores_discursivos.txt',
+}
+
+
+def resolve_resource(path: str) -> Path:
+    """Resolve caminho relativo ao diretório atual ou à raiz do projeto"""
+    candidate = Path(path)
+    if candidate.is_absolute() or candidate.exists():
+        return candidate
+    return PROJECT_ROOT / candidate
+
+
+@lru_cache(maxsize=None)
+def load_lexicon(path: str) -> Tuple[str, ...]:
+    """Carrega um léxico (uma entrada por linha, '#' para comentários)"""
+    file_path = resolve_resource(path)
+    if not file_path.exists():
+        print(f"⚠️ Léxico não encontrado: {path}")
+        return ()
+        
+    entries = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            entry = line.strip().lower()
+            if entry and not entry.startswith('#'):
+                entries.append(entry)
+    return tuple(entries)
+
+
+def resource_lexicons() -> Dict[str, Tuple[str, ...]]:
+    """Todos os léxicos de resources/ por categoria"""
+    return {category: load_lexicon(path) for category, path in RESOURCE_LEXICONS.items()}
@@ -0,0 +1,125 @@
+"""
+MinHash + LSH para quase-duplicatas
+
+Cada transcrição vira um conjunto de shingles (sequências de SHINGLE_SIZE
+palavras, sem rótulos de falante) resumido em uma assinatura MinHash de
+`num_perm` valores: a fração de posições iguais entre duas assinaturas estima
+a similaridade de Jaccard dos conjuntos.
+
+O índice LSH divide a assinatura em `bands` faixas; documentos que coincidem
+em pelo menos uma faixa são candidatos. A consulta só olha os baldes da
+assinatura consultada (custo independente do número de documentos indexados)
+e os candidatos são confirmados pela similaridade estimada.
+"""
+import zlib
+from typing import Dict, Hashable, List, Set
+
+import numpy as np
+
+from engine.text.tokenized_document import TokenizedDocument
+
+SHINGLE_SIZE = 5
+
+# Permutações h(x) = (a·x + b) mod p sobre hashes de 32 bits (a·x + b cabe em 64 bits)
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+_SHINGLE_MULTIPLIER = np.uint64(1099511628211)
+_CHUNK = 4096
+
+
+def shingle_hashes(document: TokenizedDocument, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """Hashes (32 bits, distintos) dos shingles de `size` palavras do documento"""
+    mask = document.speaker_label_mask()
+    tokens = [token for token, label in zip(document.tokens, mask.tolist()) if not label]
+    if not tokens:
+        return np.zeros(0, dtype=np.uint64)
+        
+    # crc32 é estável entre processos (hash() do Python não é)
+    token_hashes = np.fromiter((zlib.crc32(token.encode('utf-8')) for token in tokens),
+                               dtype=np.uint64, count=len(tokens))
+    size = min(size, len(tokens))
+    count = len(tokens) - size + 1
+    combined = np.zeros(count, dtype=np.uint64)
+    for offset in range(size):
+        combined = combined * _SHINGLE_MULTIPLIER + token_hashes[offset:offset + count]
+    return np.unique((combined ^ (combined >> np.uint64(32))) & MAX_HASH)
+
+
+class MinHasher:
+    """Assinaturas MinHash com permutações fixas (mesma semente → assinaturas comparáveis)"""
+    
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        self.num_perm = num_perm
+        self.seed = seed
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+        
+    def signature(self, document: TokenizedDocument) -> np.ndarray:
+        """Assinatura (num_perm valores uint64); vazia se o documento não tem palavras"""
+        hashes = shingle_hashes(document)
+        if len(hashes) == 0:
+            return np.zeros(0, dtype=np.uint64)
+            
+        signature = np.full(self.num_perm, MERSENNE_PRIME, dtype=np.uint64)
+        a, b = self._a[:, None], self._b[:, None]
+        for start in range(0, len(hashes), _CHUNK):
+            values = (a * hashes[None, start:start + _CHUNK] + b) % MERSENNE_PRIME
+            np.minimum(signature, values.min(axis=1), out=signature)
+        return signature
+
+
+def estimate_jaccard(first: np.ndarray, second: np.ndarray) -> float:
+    """Jaccard estimado: fração de posições iguais das assinaturas"""
+    if len(first) == 0 or len(first) != len(second):
+        return 0.0
+    return float(np.mean(first == second))
+
+
+class LSHIndex:
+    """Baldes por faixa da assinatura → chaves dos documentos"""
+    
+    def __init__(self, num_perm: int = 128, bands: int = 32):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) deve ser múltiplo de bands ({bands})")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[bytes, Set[Hashable]]] = [{} for _ in range(bands)]
+        self._keys: Dict[Hashable, List[bytes]] = {}
+        
+    def __len__(self) -> int:
+        return len(self._keys)
+        
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._keys
+        
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes()
+                for band in range(self.bands)]
+                
+    def add(self, key: Hashable, signature: np.ndarray):
+        """Indexa (ou reindexa) a assinatura sob `key`"""
+        self.remove(key)
+        band_keys = self._band_keys(signature)
+        for buckets, band_key in zip(self._buckets, band_keys):
+            buckets.setdefault(band_key, set()).add(key)
+        self._keys[key] = band_keys
+        
+    def remove(self, key: Hashable):
+        band_keys = self._keys.pop(key, None)
+        if band_keys is None:
+            return
+        for buckets, band_key in zip(self._buckets, band_keys):
+            members = buckets.get(band_key)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del buckets[band_key]
+                    
+    def query(self, signature: np.ndarray) -> Set[Hashable]:
+        """Chaves que coincidem com a assinatura em pelo menos uma faixa"""
+        candidates = set()
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(buckets.get(band_key, ()))
+        return candidates
@@ -0,0 +1,219 @@
+"""
+Casamento multi-padrão (Aho–Corasick) sobre tokens
+
+Substitui os laços `text.count(frase)` / `frase in text` dos analisadores, que
+varrem o texto inteiro uma vez por entrada de léxico. O autômato é construído
+uma vez e encontra todas as ocorrências de todas as categorias em uma única
+passada pelos tokens.
+
+O alfabeto do autômato são tokens (mesma tokenização do TokenizedDocument),
+então os casamentos respeitam fronteiras de palavra: 'tipo' não casa dentro de
+'protótipo'. Entradas terminadas em '*' são radicais de uma palavra
+('preocup*' casa 'preocupado', 'preocupação').
+"""
+from collections import Counter, deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from engine.text.tokenized_document import TOKEN_PATTERN, TokenizedDocument
+
+
+class MatchResult:
+    """Ocorrências encontradas por categoria (contagens e offsets)"""
+    
+    def __init__(self, matcher: 'PatternMatcher', hits: List[Tuple[int, int, int]]):
+        self._matcher = matcher
+        # (id do padrão, offset inicial, offset final) na ordem do texto
+        self._hits = hits
+        self._by_category = None
+        
+    def _group(self) -> Dict[str, List[Tuple[int, int, int]]]:
+        if self._by_category is None:
+            grouped = {category: [] for category in self._matcher.categories}
+            for hit in self._hits:
+                for category in self._matcher.pattern_categories[hit[0]]:
+                    grouped[category].append(hit)
+            self._by_category = grouped
+        return self._by_category
+        
+    def count(self, category: str) -> int:
+        """Total de ocorrências da categoria"""
+        return len(self._group().get(category, []))
+        
+    def counts(self) -> Dict[str, int]:
+        """Total de ocorrências de todas as categorias"""
+        return {category: len(hits) for category, hits in self._group().items()}
+        
+    def by_pattern(self, category: str) -> Dict[str, int]:
+        """Ocorrências por entrada do léxico (na ordem do léxico, só as encontradas)"""
+        found = Counter(hit[0] for hit in self._group().get(category, []))
+        return {self._matcher.patterns[pid]: found[pid]
+                for pid in self._matcher.category_patterns.get(category, []) if found[pid]}
+                
+    def present(self, category: str) -> List[str]:
+        """Entradas do léxico que ocorrem pelo menos uma vez"""
+        return list(self.by_pattern(category).keys())
+        
+    def offsets(self, category: str) -> np.ndarray:
+        """Array (n, 2) com início/fim (chars) de cada ocorrência"""
+        hits = self._group().get(category, [])
+        if not hits:
+            return np.zeros((0, 2), dtype=np.int64)
+        return np.asarray([(start, end) for _, start, end in hits], dtype=np.int64)
+        
+    def pattern_ids(self, category: str) -> np.ndarray:
+        """Id do padrão (índice em PatternMatcher.patterns) de cada ocorrência, alinhado a offsets()"""
+        return np.asarray([pid for pid, _, _ in self._group().get(category, [])], dtype=np.int64)
+
+
+class PatternMatcher:
+    """Autômato Aho–Corasick sobre sequências de tokens"""
+    
+    def __init__(self, lexicons: Dict[str, Iterable[str]] = None):
+        self.categories: List[str] = []
+        self.patterns: List[str] = []
+        self.pattern_categories: List[List[str]] = []
+        self.category_patterns: Dict[str, List[int]] = {}
+        self._pattern_ids: Dict[str, int] = {}
+        
+        # Trie: transições por token, link de falha e saídas (id, nº de tokens)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, int]]] = [[]]
+        self._prefixes: List[Tuple[str, int]] = []
+        self._prefix_cache: Dict[str, Tuple[int, ...]] = {}
+        self._built = False
+        
+        for category, entries in (lexicons or {}).items():
+            self.add(category, entries)
+            
+    def add(self, category: str, entries: Iterable[str]):
+        """Adiciona entradas a uma categoria (o mesmo padrão pode estar em várias)"""
+        if category not in self.category_patterns:
+            self.categories.append(category)
+            self.category_patterns[category] = []
+            
+        for entry in entries:
+            entry = entry.strip().lower()
+            if not entry:
+                continue
+                
+            pid = self._pattern_ids.get(entry)
+            if pid is None:
+                pid = len(self.patterns)
+                self._pattern_ids[entry] = pid
+                self.patterns.append(entry)
+                self.pattern_categories.append([])
+                self._insert(entry, pid)
+                
+            if category not in self.pattern_categories[pid]:
+                self.pattern_categories[pid].append(category)
+                self.category_patterns[category].append(pid)
+                
+        self._built = False
+        
+    def _insert(self, entry: str, pid: int):
+        """Insere o padrão na trie (ou na lista de radicais)"""
+        is_prefix = entry.endswith('*')
+        tokens = TOKEN_PATTERN.findall(entry.rstrip('*'))
+        if not tokens:
+            return
+            
+        if is_prefix and len(tokens) == 1:
+            self._prefixes.append((tokens[0], pid))
+            return
+            
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][token] = next_state
+            state = next_state
+        self._output[state].append((pid, len(tokens)))
+        
+    def _build(self):
+        """Calcula links de falha (BFS) e propaga saídas"""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+            
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+                
+        self._prefix_cache = {}
+        self._built = True
+        
+    def _prefix_matches(self, token: str) -> Tuple[int, ...]:
+        """Radicais que casam com o token (memorizado por token distinto)"""
+        cached = self._prefix_cache.get(token)
+        if cached is None:
+            cached = tuple(pid for stem, pid in self._prefixes if token.startswith(stem))
+            self._prefix_cache[token] = cached
+        return cached
+        
+    def scan(self, source: Union[str, TokenizedDocument]) -> MatchResult:
+        """Encontra todas as ocorrências em uma única passada pelos tokens"""
+        if not self._built:
+            self._build()
+            
+        if isinstance(source, TokenizedDocument):
+            tokens = source.tokens
+            starts = source.token_starts
+            ends = source.token_ends
+        else:
+            matches = list(TOKEN_PATTERN.finditer(source.lower()))
+            tokens = [m.group() for m in matches]
+            starts = [m.start() for m in matches]
+            ends = [m.end() for m in matches]
+            
+        goto, fail, output = self._goto, self._fail, self._output
+        root = goto[0]
+        has_prefixes = bool(self._prefixes)
+        hits = []
+        state = 0
+        
+        for i, token in enumerate(tokens):
+            if state:
+                while state and token not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(token, 0)
+            else:
+                state = root.get(token, 0)
+                
+            if state:
+                for pid, length in output[state]:
+                    hits.append((pid, int(starts[i - length + 1]), int(ends[i])))
+                    
+            if has_prefixes:
+                for pid in self._prefix_matches(token):
+                    hits.append((pid, int(starts[i]), int(ends[i])))
+                    
+        return MatchResult(self, hits)
+
+
+@lru_cache(maxsize=64)
+def _cached_matcher(frozen: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> PatternMatcher:
+    matcher = PatternMatcher(dict(frozen))
+    matcher._build()
+    return matcher
+
+
+def get_matcher(lexicons: Dict[str, Iterable[str]]) -> PatternMatcher:
+    """Autômato compilado para os léxicos dados (reaproveitado entre chamadas)"""
+    frozen = tuple((category, tuple(entries)) for category, entries in lexicons.items())
+    return _cached_matcher(frozen)
@@ -0,0 +1,169 @@
+"""
+Segmentação temporal vetorizada
+
+Os segmentos são intervalos [início, fim) de índices de token calculados a
+partir dos offsets do TokenizedDocument, sem montar o texto de cada segmento.
+O documento é varrido uma única vez pelo PatternMatcher; cada ocorrência vira
+um índice de token e as somas por segmento saem de np.add.reduceat, então o
+custo não cresce com o número de segmentos.
+
+Métodos de segmentação:
+- 'fixed': `segments` faixas com o mesmo número de tokens
+- 'dynamic': parágrafos; texto corrido (um único parágrafo longo) é dividido
+  em blocos de sentenças de até DYNAMIC_BLOCK_CHARS caracteres
+- 'paragraph': parágrafos, agrupando os menores que `min_segment_size` chars
+- 'sentence': sentenças agrupadas até atingir `min_segment_size` chars
+"""
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from engine.text.pattern_matcher import get_matcher
+from engine.text.tokenized_document import TokenizedDocument
+
+SEGMENT_METHODS = ('fixed', 'dynamic', 'paragraph', 'sentence')
+
+# Texto corrido: parágrafo único acima deste tamanho é dividido por sentenças
+DYNAMIC_SINGLE_PARAGRAPH_CHARS = 1000
+DYNAMIC_BLOCK_CHARS = 800
+
+# Tokens acima deste tamanho contam para a carga cognitiva
+LONG_WORD_CHARS = 7
+
+
+def segment_bounds(document: TokenizedDocument, method: str = 'dynamic',
+                   max_segments: int = 10, min_segment_size: int = 100) -> np.ndarray:
+    """
+    Limites de tokens [início, fim) de cada segmento, array (n, 2)
+    
+    Segmentos além de max_segments são unidos em max_segments grupos
+    consecutivos de tamanho parecido (o texto inteiro continua coberto).
+    """
+    if method not in SEGMENT_METHODS:
+        raise ValueError(f"Método de segmentação desconhecido: {method} "
+                         f"(opções: {', '.join(SEGMENT_METHODS)})")
+                         
+    max_segments = max(1, int(max_segments))
+    if document.token_count == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+        
+    if method == 'fixed':
+        edges = np.linspace(0, document.token_count, min(max_segments, document.token_count) + 1)
+        edges = np.round(edges).astype(np.int64)
+        return np.column_stack([edges[:-1], edges[1:]])
+        
+    if method == 'sentence':
+        spans = _group_spans(document.sentence_spans, minimum=min_segment_size)
+    elif method == 'paragraph':
+        spans = _group_spans(document.paragraph_spans, minimum=min_segment_size)
+    else:
+        spans = document.paragraph_spans
+        if len(spans) == 1 and spans[0, 1] - spans[0, 0] > DYNAMIC_SINGLE_PARAGRAPH_CHARS:
+            spans = _group_spans(document.sentence_spans, maximum=DYNAMIC_BLOCK_CHARS)
+            
+    bounds = _token_bounds(document, spans)
+    return _limit_segments(bounds, max_segments)
+
+
+def _group_spans(spans: np.ndarray, minimum: int = None, maximum: int = None) -> np.ndarray:
+    """
+    Agrupa spans consecutivos de forma gulosa, medindo cada grupo pelos offsets
+    
+    minimum: o grupo fecha assim que atinge `minimum` caracteres
+    maximum: o grupo fecha antes de passar de `maximum` caracteres (um span
+             maior que o limite forma um grupo sozinho)
+    """
+    if len(spans) == 0:
+        return spans
+        
+    starts, ends = spans[:, 0], spans[:, 1]
+    groups = []
+    first = 0
+    while first < len(spans):
+        if minimum is not None:
+            last = int(np.searchsorted(ends, starts[first] + minimum, side='left')) + 1
+        else:
+            last = int(np.searchsorted(ends, starts[first] + maximum, side='right'))
+        last = min(len(spans), max(first + 1, last))
+        groups.append((starts[first], ends[last - 1]))
+        first = last
+        
+    return np.asarray(groups, dtype=np.int64).reshape(-1, 2)
+
+
+def _token_bounds(document: TokenizedDocument, spans: np.ndarray) -> np.ndarray:
+    """Spans de caracteres → intervalos de tokens (spans sem tokens são descartados)"""
+    if len(spans) == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    first = np.searchsorted(document.token_starts, spans[:, 0], side='left')
+    last = np.searchsorted(document.token_starts, spans[:, 1], side='left')
+    bounds = np.column_stack([first, last])
+    return bounds[bounds[:, 1] > bounds[:, 0]]
+
+
+def _limit_segments(bounds: np.ndarray, max_segments: int) -> np.ndarray:
+    """Une segmentos consecutivos em no máximo max_segments grupos"""
+    if len(bounds) <= max_segments:
+        return bounds
+    edges = np.linspace(0, len(bounds), max_segments + 1).astype(np.int64)
+    return np.column_stack([bounds[edges[:-1], 0], bounds[edges[1:] - 1, 1]])
+
+
+def segment_sums(values: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+    """Soma de `values` (um valor por token) dentro de cada segmento [início, fim)"""
+    if len(bounds) == 0:
+        return np.zeros(0, dtype=values.dtype)
+        
+    # reduceat sobre pares (início, fim) intercalados; o sentinela permite fim == len(values)
+    padded = np.append(values, 0)
+    sums = np.add.reduceat(padded, bounds.ravel())[::2]
+    return np.where(bounds[:, 1] > bounds[:, 0], sums, 0)
+
+
+class SegmentScorer:
+    """Contagens de léxico e de tokens de todos os segmentos de um documento de uma vez"""
+    
+    def __init__(self, lexicons: Dict[str, Iterable[str]]):
+        self.categories = list(lexicons)
+        self.matcher = get_matcher(lexicons)
+        
+    def hits(self, document: TokenizedDocument) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Por categoria: (índice do token inicial, id do padrão) de cada ocorrência"""
+        matches = self.matcher.scan(document)
+        hits = {}
+        for category in self.categories:
+            offsets = matches.offsets(category)
+            token_ids = np.searchsorted(document.token_starts, offsets[:, 0], side='left')
+            hits[category] = (token_ids, matches.pattern_ids(category))
+        return hits
+        
+    def score(self, document: TokenizedDocument, bounds: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Arrays alinhados a `bounds`:
+        - 'tokens' / 'long_tokens': total de tokens e de tokens longos
+        - '<categoria>': ocorrências da categoria
+        - '<categoria>_distinct': entradas distintas do léxico presentes
+        """
+        token_count = document.token_count
+        lengths = document.token_ends - document.token_starts
+        scores = {
+            'tokens': bounds[:, 1] - bounds[:, 0],
+            'long_tokens': segment_sums((lengths > LONG_WORD_CHARS).astype(np.int64), bounds)
+        }
+        if len(bounds) == 0:
+            for category in self.categories:
+                scores[category] = scores[f"{category}_distinct"] = np.zeros(0, dtype=np.int64)
+            return scores
+            
+        pattern_total = max(1, len(self.matcher.patterns))
+        for category, (token_ids, pattern_ids) in self.hits(document).items():
+            per_token = np.bincount(token_ids, minlength=token_count).astype(np.int64)
+            scores[category] = segment_sums(per_token, bounds)
+            
+            # Segmento de cada ocorrência (segmentos ordenados e disjuntos)
+            segments = np.searchsorted(bounds[:, 0], token_ids, side='right') - 1
+            inside = (segments >= 0) & (token_ids < bounds[np.maximum(segments, 0), 1])
+            distinct = np.unique(segments[inside] * pattern_total + pattern_ids[inside])
+            scores[f"{category}_distinct"] = np.bincount(distinct // pattern_total,
+                                                         minlength=len(bounds))
+        return scores
@@ -0,0 +1,155 @@
+"""
+Pontuação de sentimento por léxico compilado
+
+Os léxicos (resources/emocionais_*.txt + léxico básico do discurso) são
+compilados uma vez por processo em uma tabela token → polaridade; radicais
+('preocup*') são resolvidos uma vez por token distinto. A pontuação percorre
+os tokens do TokenizedDocument uma única vez, aplicando negação ("não é
+ruim") e intensidade ("muito bom") dentro da janela de contexto, sem
+atravessar fronteiras de sentença.
+
+Escores por sentença: soma das polaridades / nº de palavras do léxico na
+sentença (média das ocorrências, não diluída pelas palavras neutras), limitada
+a [-1, 1], em um array float32 alinhado a document.sentence_spans; sentença
+sem ocorrências = 0.
+"""
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from engine.text.lexicons import load_lexicon
+from engine.text.segments import segment_sums
+from engine.text.tokenized_document import TOKEN_PATTERN, TokenizedDocument
+
+# Léxico básico de avaliação do discurso oral ('*' = radical)
+BASE_POSITIVE = ('bom', 'ótimo', 'excelente', 'feliz', 'satisfeito', 'gosto',
+                 'adoro', 'maravilh*', 'incrível', 'positiv*', 'melhor', 'sucesso',
+                 'consegui', 'aprendi', 'entendi', 'legal', 'bacana', 'top')
+
+BASE_NEGATIVE = ('ruim', 'péssimo', 'triste', 'difícil', 'problema', 'erro',
+                 'medo', 'preocup*', 'frustr*', 'chato', 'cansado',
+                 'complicado', 'confuso', 'dúvida')
+
+SENTIMENT_METHODS = ('lexicon', 'rule_based', 'hybrid')
+
+
+class SentimentLexicon:
+    """Tabela token → polaridade (+1 / -1) com radicais memorizados por token"""
+    
+    def __init__(self, positive: Iterable[str], negative: Iterable[str]):
+        self.polarity: Dict[str, float] = {}
+        self._stems = []
+        self._stem_cache: Dict[str, float] = {}
+        
+        for entries, polarity in ((positive, 1.0), (negative, -1.0)):
+            for entry in entries:
+                entry = entry.strip().lower()
+                tokens = TOKEN_PATTERN.findall(entry.rstrip('*'))
+                # Uma entrada = uma palavra (ou radical); expressões não entram na tabela
+                if len(tokens) != 1:
+                    continue
+                if entry.endswith('*'):
+                    self._stems.append((tokens[0], polarity))
+                else:
+                    self.polarity.setdefault(tokens[0], polarity)
+                    
+    def __len__(self) -> int:
+        return len(self.polarity) + len(self._stems)
+        
+    def lookup(self, token: str) -> float:
+        """Polaridade do token (0.0 fora do léxico)"""
+        polarity = self.polarity.get(token)
+        if polarity is not None:
+            return polarity
+        if not self._stems:
+            return 0.0
+            
+        polarity = self._stem_cache.get(token)
+        if polarity is None:
+            polarity = next((value for stem, value in self._stems if token.startswith(stem)), 0.0)
+            self._stem_cache[token] = polarity
+        return polarity
+
+
+@lru_cache(maxsize=16)
+def compile_lexicon(positive_path: str, negative_path: str, include_base: bool = True) -> SentimentLexicon:
+    """Léxico compilado (arquivos de resources/ + léxico básico), reaproveitado entre chamadas"""
+    positive = load_lexicon(positive_path)
+    negative = load_lexicon(negative_path)
+    if include_base:
+        positive = positive + BASE_POSITIVE
+        negative = negative + BASE_NEGATIVE
+    return SentimentLexicon(positive, negative)
+
+
+class SentimentScorer:
+    """Escores por token e por sentença em uma passada linear pelos tokens"""
+    
+    def __init__(self, lexicon: SentimentLexicon, negation_words: Iterable[str] = (),
+                 intensity_modifiers: Optional[Dict[str, float]] = None,
+                 context_window: int = 2, negation: bool = True, intensity: bool = True):
+        self.lexicon = lexicon
+        self.negation_words = frozenset(word.lower() for word in negation_words) if negation else frozenset()
+        self.intensity_modifiers = ({word.lower(): float(weight) for word, weight in intensity_modifiers.items()}
+                                    if intensity and intensity_modifiers else {})
+        self.context_window = max(1, int(context_window))
+        
+    def token_scores(self, document: TokenizedDocument) -> np.ndarray:
+        """Polaridade de cada token após negação e intensidade (0 fora do léxico)"""
+        scores = np.zeros(document.token_count, dtype=np.float32)
+        if not document.token_count:
+            return scores
+            
+        # Início de sentença: negação/intensidade não atravessam a fronteira
+        sentence_start = np.zeros(document.token_count, dtype=bool)
+        starts = document.sentence_token_bounds[:, 0]
+        sentence_start[starts[starts < document.token_count]] = True
+        
+        lookup = self.lexicon.lookup
+        negations = self.negation_words
+        modifiers = self.intensity_modifiers
+        window = self.context_window
+        last_negation = last_modifier = -window - 1
+        modifier_weight = 1.0
+        
+        for i, (token, new_sentence) in enumerate(zip(document.tokens, sentence_start.tolist())):
+            if new_sentence:
+                last_negation = last_modifier = -window - 1
+                
+            if token in negations:
+                last_negation = i
+                continue
+            weight = modifiers.get(token)
+            if weight is not None:
+                last_modifier, modifier_weight = i, weight
+                continue
+                
+            polarity = lookup(token)
+            if not polarity:
+                continue
+            if i - last_negation <= window:
+                polarity = -polarity
+            if i - last_modifier <= window:
+                polarity *= modifier_weight
+            scores[i] = polarity
+            
+        return scores
+        
+    def sentence_scores(self, document: TokenizedDocument,
+                        token_scores: np.ndarray = None) -> np.ndarray:
+        """Escore de cada sentença (soma / nº de ocorrências do léxico, em [-1, 1]), float32"""
+        if token_scores is None:
+            token_scores = self.token_scores(document)
+        bounds = document.sentence_token_bounds
+        sums = segment_sums(token_scores, bounds)
+        hits = segment_sums((token_scores != 0).astype(np.float32), bounds)
+        scores = np.divide(sums, hits, out=np.zeros(len(bounds), dtype=np.float32),
+                           where=hits > 0)
+        return np.clip(scores, -1.0, 1.0).astype(np.float32)
+
+
+def weighted_mean(scores: np.ndarray, weights: np.ndarray) -> float:
+    """Média dos escores ponderada (ex: pelo nº de tokens de cada sentença)"""
+    total = float(np.sum(weights))
+    return float(np.dot(scores, weights) / total) if total else 0.0
@@ -0,0 +1,129 @@
+"""
+Similaridade entre transcrições em lote
+
+Todas as transcrições são vetorizadas uma única vez em uma matriz esparsa
+arquivo × termo (vocabulário comum); as similaridades de todos os pares saem
+de produtos esparsos em blocos de linhas, em vez de comparar par a par
+(SequenceMatcher e um TfidfVectorizer novo por par, como no protótipo).
+
+Só o triângulo superior é calculado (a matriz é simétrica) e cada bloco de
+`block_rows` linhas limita a memória do produto intermediário; o resultado
+N × N é denso (float32).
+"""
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+
+from engine.text.tokenized_document import TokenizedDocument
+from engine.text.topic_model import topic_stopwords
+
+DEFAULT_BLOCK_ROWS = 1024
+
+
+def term_counts(sources: Iterable[Union[Path, TokenizedDocument]], min_word_length: int = 3,
+                stopwords: frozenset = None) -> Tuple[sparse.csr_matrix, List[str]]:
+    """
+    Matriz de contagens arquivo × termo e o vocabulário (ordem de aparição)
+    
+    Cada transcrição é lida, tokenizada e descartada antes da próxima; rótulos
+    de falante, stopwords e tokens não alfabéticos ficam de fora.
+    """
+    stopwords = topic_stopwords() if stopwords is None else stopwords
+    vocabulary: Dict[str, int] = {}
+    rows, cols = [], []
+    total = 0
+    
+    for row, source in enumerate(sources):
+        document = source if isinstance(source, TokenizedDocument) else \
+            TokenizedDocument(Path(source).read_text(encoding='utf-8'))
+        in_label = document.speaker_label_mask().tolist()
+        for token, label in zip(document.tokens, in_label):
+            if len(token) < min_word_length or label or token in stopwords or not token.isalpha():
+                continue
+            column = vocabulary.get(token)
+            if column is None:
+                column = vocabulary[token] = len(vocabulary)
+            rows.append(row)
+            cols.append(column)
+        total = row + 1
+        
+    data = np.ones(len(rows), dtype=np.float32)
+    counts = sparse.coo_matrix((data, (rows, cols)), shape=(total, len(vocabulary))).tocsr()
+    counts.sum_duplicates()
+    return counts, sorted(vocabulary, key=vocabulary.get)
+
+
+def tfidf(counts: sparse.csr_matrix) -> sparse.csr_matrix:
+    """TF-IDF (tf sublinear, idf suavizado) com linhas normalizadas (L2)"""
+    documents = counts.shape[0]
+    document_frequency = np.bincount(counts.indices, minlength=counts.shape[1])
+    idf = (np.log((1 + documents) / (1 + document_frequency)) + 1.0).astype(np.float32)
+    
+    weighted = counts.astype(np.float32, copy=True)
+    weighted.data = 1.0 + np.log(weighted.data)
+    weighted = sparse.csr_matrix(weighted.multiply(idf))
+    
+    norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.csr_matrix(sparse.diags((1.0 / norms).astype(np.float32)) @ weighted)
+
+
+def _blocked_products(matrix: sparse.csr_matrix, block_rows: int):
+    """Gera (início, fim, bloco @ linhas[início:].T) cobrindo o triângulo superior"""
+    n = matrix.shape[0]
+    block_rows = max(1, int(block_rows))
+    for start in range(0, n, block_rows):
+        end = min(n, start + block_rows)
+        yield start, end, (matrix[start:end] @ matrix[start:].T).toarray()
+
+
+def cosine_matrix(vectors: sparse.csr_matrix, block_rows: int = DEFAULT_BLOCK_ROWS) -> np.ndarray:
+    """Cosseno de todos os pares de linhas (linhas já normalizadas), N × N"""
+    n = vectors.shape[0]
+    result = np.zeros((n, n), dtype=np.float32)
+    for start, end, block in _blocked_products(vectors, block_rows):
+        result[start:end, start:] = block
+        result[start:, start:end] = block.T
+    return np.clip(result, 0.0, 1.0)
+
+
+def jaccard_matrix(counts: sparse.csr_matrix, block_rows: int = DEFAULT_BLOCK_ROWS) -> np.ndarray:
+    """Jaccard dos conjuntos de termos de todos os pares de linhas, N × N"""
+    n = counts.shape[0]
+    present = sparse.csr_matrix((np.ones(counts.nnz, dtype=np.float32), counts.indices, counts.indptr),
+                                shape=counts.shape)
+    sizes = np.diff(present.indptr).astype(np.float32)
+    result = np.zeros((n, n), dtype=np.float32)
+    
+    for start, end, shared in _blocked_products(present, block_rows):
+        union = sizes[start:end, None] + sizes[None, start:] - shared
+        block = np.divide(shared, union, out=np.zeros_like(shared), where=union > 0)
+        result[start:end, start:] = block
+        result[start:, start:end] = block.T
+    return result
+
+
+def group_means(matrix: np.ndarray, groups: np.ndarray, group_count: int) -> np.ndarray:
+    """
+    Média da similaridade entre grupos (ex: projetos), G × G
+    
+    Na diagonal, só pares de arquivos distintos do mesmo grupo (NaN se o
+    grupo tiver um único arquivo).
+    """
+    membership = np.zeros((len(groups), group_count), dtype=np.float64)
+    membership[np.arange(len(groups)), groups] = 1.0
+    sizes = membership.sum(axis=0)
+    
+    sums = membership.T @ matrix.astype(np.float64) @ membership
+    pairs = np.outer(sizes, sizes)
+    
+    # Diagonal: descarta a similaridade de cada arquivo consigo mesmo
+    self_sums = np.bincount(groups, weights=np.diag(matrix), minlength=group_count)
+    np.fill_diagonal(sums, np.diag(sums) - self_sums)
+    np.fill_diagonal(pairs, sizes * (sizes - 1))
+    
+    means = np.full((group_count, group_count), np.nan)
+    np.divide(sums, pairs, out=means, where=pairs > 0)
+    return means
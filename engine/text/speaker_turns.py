@@ -0,0 +1,238 @@
+"""
+Turnos de fala em colunas
+
+As transcrições são diálogos "Entrevistador: ... / Mãe: ...". Os turnos são
+identificados uma única vez por documento e guardados como arrays paralelos
+(id do falante, offsets do conteúdo de cada turno, intervalos de tokens), de
+modo que qualquer analisador pode rodar só sobre um falante ou só sobre os
+respondentes via TokenizedDocument.select(), sem copiar texto. Estatísticas de
+tempo de fala e alternância de turnos saem de bincount sobre essas colunas.
+
+Um rótulo ("Nome:" no início da linha, até MAX_LABEL_WORDS palavras) só conta
+como falante se for um rótulo de entrevistador, se aparecer mais de uma vez
+ou se vier logo após uma fala do entrevistador; assim frases como "O problema
+é: ..." no meio de uma resposta não abrem um turno. Texto antes do primeiro
+rótulo (título, cabeçalho) não pertence a nenhum turno.
+
+Na leitura em streaming cada segmento é um documento à parte: StreamScope
+carrega entre segmentos os falantes já aceitos e o papel do turno em aberto,
+para que uma fala que continua no próximo parágrafo mantenha seu falante.
+"""
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from engine.text.tokenized_document import SPEAKER_LABEL, DocumentView, TokenizedDocument
+
+INTERVIEWER_LABELS = ('entrevistador', 'entrevistadora', 'pesquisador', 'pesquisadora',
+                      'moderador', 'moderadora', 'interviewer')
+SPEAKER_SCOPES = ('all', 'respondent')
+MAX_LABEL_WORDS = 3
+
+
+def _normalize(label: str) -> str:
+    return ' '.join(label.lower().split())
+
+
+class SpeakerTurns:
+    """
+    Turnos de um documento em colunas
+    
+    Atributos:
+        document: documento completo (referência)
+        speakers: nomes dos falantes, na ordem em que aparecem
+        interviewer: array bool por falante (rótulo de entrevistador)
+        speaker_ids: id do falante de cada turno
+        turn_spans: array (n, 2) com início/fim (chars) do conteúdo de cada turno
+        token_bounds: array (n, 2) com o intervalo [início, fim) de tokens de cada turno
+    """
+    
+    def __init__(self, document: TokenizedDocument, speakers: List[str], interviewer: np.ndarray,
+                 speaker_ids: np.ndarray, turn_spans: np.ndarray):
+        self.document = document
+        self.speakers = speakers
+        self.interviewer = interviewer
+        self.speaker_ids = speaker_ids
+        self.turn_spans = turn_spans
+        self.token_bounds = document._token_bounds(turn_spans)
+        
+    @classmethod
+    def parse(cls, document: TokenizedDocument,
+              interviewer_labels: Iterable[str] = INTERVIEWER_LABELS,
+              known: Iterable[str] = (), after_interviewer: bool = False) -> 'SpeakerTurns':
+        """
+        Identifica os turnos (uma passada da regex de rótulos sobre o texto)
+        
+        known / after_interviewer: contexto de segmentos anteriores (streaming) —
+        falantes já aceitos e se o texto começa dentro de uma fala do entrevistador
+        """
+        interviewer_labels = {_normalize(label) for label in interviewer_labels}
+        known = {_normalize(label) for label in known}
+        text = document.text
+        
+        candidates = []
+        for match in SPEAKER_LABEL.finditer(text):
+            name = text[match.start():match.end() - 1].strip()
+            if len(name.split()) <= MAX_LABEL_WORDS:
+                candidates.append((match.start(), match.end(), name, _normalize(name)))
+                
+        counts: Dict[str, int] = {}
+        for _, _, _, key in candidates:
+            counts[key] = counts.get(key, 0) + 1
+            
+        def is_interviewer(key: str) -> bool:
+            return key in interviewer_labels or key.split()[0] in interviewer_labels
+            
+        labels = []
+        for start, end, name, key in candidates:
+            follows_interviewer = is_interviewer(labels[-1][3]) if labels else after_interviewer
+            if is_interviewer(key) or counts[key] > 1 or key in known or follows_interviewer:
+                labels.append((start, end, name, key))
+                
+        speakers, keys, interviewer = [], {}, []
+        speaker_ids, spans = [], []
+        for i, (start, end, name, key) in enumerate(labels):
+            if key not in keys:
+                keys[key] = len(speakers)
+                speakers.append(name)
+                interviewer.append(is_interviewer(key))
+                
+            content_end = labels[i + 1][0] if i + 1 < len(labels) else len(text)
+            while end < content_end and text[end].isspace():
+                end += 1
+            while content_end > end and text[content_end - 1].isspace():
+                content_end -= 1
+            speaker_ids.append(keys[key])
+            spans.append((end, content_end))
+            
+        return cls(document, speakers, np.asarray(interviewer, dtype=bool),
+                   np.asarray(speaker_ids, dtype=np.int64),
+                   np.asarray(spans, dtype=np.int64).reshape(-1, 2))
+                   
+    # ------------------------------------------------------------------
+    # Seleção
+    # ------------------------------------------------------------------
+    
+    @property
+    def turn_count(self) -> int:
+        return len(self.speaker_ids)
+        
+    @property
+    def has_roles(self) -> bool:
+        """Há falas de entrevistador e de respondente?"""
+        roles = self.interviewer[self.speaker_ids]
+        return bool(roles.any() and not roles.all())
+        
+    def turn_mask(self, speaker: Optional[str] = None, role: Optional[str] = None) -> np.ndarray:
+        """Turnos de um falante (nome) e/ou papel ('interviewer' / 'respondent')"""
+        mask = np.ones(self.turn_count, dtype=bool)
+        if speaker is not None:
+            speaker_id = self.speakers.index(speaker) if speaker in self.speakers else -1
+            mask &= self.speaker_ids == speaker_id
+        if role is not None:
+            roles = self.interviewer[self.speaker_ids]
+            mask &= roles if role == 'interviewer' else ~roles
+        return mask
+        
+    def token_ranges(self, speaker: Optional[str] = None, role: Optional[str] = None) -> np.ndarray:
+        """Intervalos de tokens dos turnos selecionados (ordem do texto)"""
+        return self.token_bounds[self.turn_mask(speaker, role)]
+        
+    def select(self, speaker: Optional[str] = None, role: Optional[str] = None) -> DocumentView:
+        """Documento restrito aos turnos selecionados (offsets do original, sem cópia de texto)"""
+        return self.document.select(self.token_ranges(speaker, role))
+        
+    # ------------------------------------------------------------------
+    # Estatísticas
+    # ------------------------------------------------------------------
+    
+    def statistics(self) -> Dict:
+        """Tempo de fala (tokens/caracteres) por falante e alternância de turnos"""
+        speaker_count = len(self.speakers)
+        ids = self.speaker_ids
+        turn_tokens = self.token_bounds[:, 1] - self.token_bounds[:, 0]
+        turn_chars = self.turn_spans[:, 1] - self.turn_spans[:, 0]
+        
+        turns = np.bincount(ids, minlength=speaker_count)
+        tokens = np.bincount(ids, weights=turn_tokens, minlength=speaker_count).astype(np.int64)
+        chars = np.bincount(ids, weights=turn_chars, minlength=speaker_count).astype(np.int64)
+        longest = np.zeros(speaker_count, dtype=np.int64)
+        np.maximum.at(longest, ids, turn_tokens)
+        total_tokens = max(1, int(tokens.sum()))
+        
+        # Transições falante → próximo falante
+        transitions = np.zeros((speaker_count, speaker_count), dtype=np.int64)
+        np.add.at(transitions, (ids[:-1], ids[1:]), 1)
+        
+        # Respostas: turnos de respondente logo após um turno do entrevistador
+        roles = self.interviewer[ids]
+        answers = np.flatnonzero(~roles[1:] & roles[:-1]) + 1
+        
+        return {
+            'turn_count': self.turn_count,
+            'speaker_switches': int(np.count_nonzero(ids[1:] != ids[:-1])),
+            'interviewer_share': round(float(tokens[self.interviewer].sum()) / total_tokens, 3),
+            'mean_answer_tokens': round(float(turn_tokens[answers].mean()), 1) if len(answers) else 0.0,
+            'speakers': {
+                name: {
+                    'role': 'interviewer' if self.interviewer[i] else 'respondent',
+                    'turns': int(turns[i]),
+                    'tokens': int(tokens[i]),
+                    'chars': int(chars[i]),
+                    'talk_share': round(float(tokens[i]) / total_tokens, 3),
+                    'mean_turn_tokens': round(float(tokens[i]) / turns[i], 1) if turns[i] else 0.0,
+                    'longest_turn_tokens': int(longest[i])
+                } for i, name in enumerate(self.speakers)
+            },
+            'transitions': {
+                self.speakers[i]: {self.speakers[j]: int(transitions[i, j])
+                                   for j in np.flatnonzero(transitions[i])}
+                for i in range(speaker_count) if transitions[i].any()
+            }
+        }
+
+
+class StreamScope:
+    """
+    Recorte de respondentes aplicado segmento a segmento (analyze_stream)
+    
+    Enquanto nenhum rótulo de entrevistador apareceu, os segmentos passam
+    inteiros (como uma transcrição sem entrevistador). Depois disso, só as
+    falas de respondentes seguem adiante; o texto no início de um segmento,
+    antes do primeiro rótulo, pertence ao turno que ficou em aberto.
+    """
+    
+    def __init__(self, interviewer_labels: Iterable[str] = INTERVIEWER_LABELS):
+        self.interviewer_labels = tuple(interviewer_labels)
+        self.known: set = set()
+        self.open_role: Optional[str] = None
+        self.has_interviewer = False
+        
+    def select(self, document: TokenizedDocument) -> TokenizedDocument:
+        """Documento do segmento restrito às falas dos respondentes"""
+        turns = SpeakerTurns.parse(document, self.interviewer_labels, self.known,
+                                   after_interviewer=self.open_role == 'interviewer')
+        carried = self.open_role
+        roles = turns.interviewer[turns.speaker_ids]
+        self.known.update(turns.speakers)
+        if turns.turn_count:
+            self.open_role = 'interviewer' if roles[-1] else 'respondent'
+        self.has_interviewer = self.has_interviewer or bool(roles.any())
+        if not self.has_interviewer:
+            return document
+            
+        ranges = turns.token_ranges(role='respondent')
+        if carried == 'respondent':
+            prefix_end = self._first_label_token(turns) if turns.turn_count else document.token_count
+            ranges = np.concatenate([[[0, prefix_end]], ranges]).astype(np.int64)
+        return document.select(ranges)
+        
+    @staticmethod
+    def _first_label_token(turns: SpeakerTurns) -> int:
+        """Índice do primeiro token do rótulo que abre o primeiro turno"""
+        text = turns.document.text
+        position = int(turns.turn_spans[0, 0])
+        while position > 0 and text[position - 1].isspace():
+            position -= 1
+        label_start = text.rfind('\n', 0, position) + 1
+        return int(np.searchsorted(turns.document.token_starts, label_start, side='left'))
@@ -0,0 +1,143 @@
+"""
+Leitura incremental de transcrições muito longas
+
+Lê o arquivo em blocos de bytes e produz segmentos (parágrafos, sentenças ou
+turnos de fala) por um gerador, sem nunca manter o texto inteiro em memória.
+Analisadores com suporte a streaming consomem os segmentos um a um (ver
+BaseAnalyzer.supports_streaming); o pico de memória fica limitado ao bloco
+mais o maior segmento.
+"""
+import codecs
+from pathlib import Path
+from typing import Iterator, Tuple
+
+from engine.text.tokenized_document import PARAGRAPH_DELIMITER, SENTENCE_DELIMITER, SPEAKER_LABEL
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Segmentos sem delimitador são cortados no último espaço após este tamanho
+DEFAULT_MAX_SEGMENT_CHARS = 256 * 1024
+
+SEGMENT_UNITS = {
+    'paragraph': PARAGRAPH_DELIMITER,
+    'sentence': SENTENCE_DELIMITER,
+    'turn': SPEAKER_LABEL,
+}
+
+
+class TranscriptStream:
+    """
+    Gerador de segmentos de uma transcrição lida em blocos
+    
+    Cada item é (segmento, posição), com posição em [0, 1) indicando a fração
+    do arquivo já percorrida no início do segmento.
+    """
+    
+    def __init__(self, file_path: Path, unit: str = 'paragraph',
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_segment_chars: int = DEFAULT_MAX_SEGMENT_CHARS,
+                 encoding: str = 'utf-8'):
+        if unit not in SEGMENT_UNITS:
+            raise ValueError(f"Unidade desconhecida: {unit} (opções: {', '.join(SEGMENT_UNITS)})")
+            
+        self.file_path = Path(file_path)
+        self.unit = unit
+        self.chunk_size = chunk_size
+        self.max_segment_chars = max_segment_chars
+        self.encoding = encoding
+        self.size_bytes = self.file_path.stat().st_size
+        
+        # Estatísticas da última leitura
+        self.bytes_read = 0
+        self.chars_read = 0
+        self.segments_read = 0
+        
+    def chunks(self) -> Iterator[str]:
+        """Blocos de texto decodificados (sem cortar caracteres multibyte)"""
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+        with open(self.file_path, 'rb') as f:
+            while True:
+                data = f.read(self.chunk_size)
+                if not data:
+                    break
+                self.bytes_read += len(data)
+                text = decoder.decode(data)
+                if text:
+                    yield text
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail
+                
+    def __iter__(self) -> Iterator[Tuple[str, float]]:
+        self.bytes_read = 0
+        self.chars_read = 0
+        self.segments_read = 0
+        emitted = 0
+        buffer = ''
+        
+        for chunk in self.chunks():
+            self.chars_read += len(chunk)
+            buffer += chunk
+            
+            pieces, buffer = self._split(buffer, final=False)
+            for piece, consumed in pieces:
+                segment = piece.strip()
+                if segment:
+                    self.segments_read += 1
+                    yield segment, self._position(emitted)
+                emitted += consumed
+                
+        pieces, _ = self._split(buffer, final=True)
+        for piece, consumed in pieces:
+            segment = piece.strip()
+            if segment:
+                self.segments_read += 1
+                yield segment, self._position(emitted)
+            emitted += consumed
+            
+    def _split(self, buffer: str, final: bool):
+        """
+        Separa os segmentos completos do buffer.
+        
+        Retorna ([(segmento, chars consumidos)], resto). Delimitadores que tocam
+        o fim do buffer ficam no resto, pois podem continuar no próximo bloco.
+        """
+        pieces = []
+        start = 0
+        delimiter = SEGMENT_UNITS[self.unit]
+        
+        for match in delimiter.finditer(buffer):
+            if not final and match.end() >= len(buffer):
+                break
+                
+            if self.unit == 'turn':
+                # Rótulo abre o turno: cortar antes dele
+                if match.start() > start:
+                    pieces.append((buffer[start:match.start()], match.start() - start))
+                    start = match.start()
+            else:
+                pieces.append((buffer[start:match.start()], match.end() - start))
+                start = match.end()
+                
+        rest = buffer[start:]
+        if final:
+            if rest:
+                pieces.append((rest, len(rest)))
+            return pieces, ''
+            
+        # Sem delimitador por muito tempo: cortar no último espaço para limitar memória
+        if len(rest) > self.max_segment_chars:
+            cut = rest.rfind(' ', 0, self.max_segment_chars)
+            if cut <= 0:
+                cut = self.max_segment_chars
+            pieces.append((rest[:cut], cut))
+            rest = rest[cut:]
+            
+        return pieces, rest
+        
+    def _position(self, emitted_chars: int) -> float:
+        """Fração do arquivo percorrida (bytes estimados a partir dos chars emitidos)"""
+        if not self.size_bytes or not self.chars_read:
+            return 0.0
+        bytes_per_char = self.bytes_read / self.chars_read
+        return min(emitted_chars * bytes_per_char / self.size_bytes, 0.999999)
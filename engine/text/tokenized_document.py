@@ -0,0 +1,214 @@
+"""
+Documento tokenizado compartilhado entre analisadores
+
+Construído uma única vez por transcrição pelo AnalysisOrchestrator e repassado
+a todos os analisadores, evitando que cada um refaça lower(), split() e
+re.split() sobre o mesmo texto.
+"""
+import re
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"\w+(?:[-']\w+)*")
+SENTENCE_DELIMITER = re.compile(r'[.!?]+')
+PARAGRAPH_DELIMITER = re.compile(r'\n[^\S\n]*\n\s*')
+
+# Rótulo de falante no início da linha ("Entrevistador:", "Mãe:")
+SPEAKER_LABEL = re.compile(r'^[^\S\n]*[^\W\d_][^\n:]{0,40}:', re.MULTILINE)
+
+
+class TokenizedDocument:
+    """
+    Tokenização em passada única de uma transcrição
+
+    Atributos:
+        text: texto original (referência, sem cópia)
+        lower: texto em minúsculas (única cópia adicional)
+        tokens: lista de tokens em minúsculas
+        token_starts / token_ends: offsets (char) de cada token em `lower`
+        sentence_spans: array (n, 2) com início/fim de cada sentença não vazia
+        paragraph_spans: array (n, 2) com início/fim de cada parágrafo
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+        if len(self.lower) != len(text):
+            # lower() pode expandir caracteres raros (ex: 'İ'); manter offsets consistentes
+            self.lower = ''.join(c.lower()[0] for c in text)
+
+        tokens = []
+        starts = []
+        ends = []
+        for match in TOKEN_PATTERN.finditer(self.lower):
+            tokens.append(match.group())
+            starts.append(match.start())
+            ends.append(match.end())
+
+        self.tokens: List[str] = tokens
+        self.token_starts = np.asarray(starts, dtype=np.int64)
+        self.token_ends = np.asarray(ends, dtype=np.int64)
+
+        self.sentence_spans = self._find_spans(SENTENCE_DELIMITER)
+        self.paragraph_spans = self._find_spans(PARAGRAPH_DELIMITER)
+
+        # Índices de token que iniciam cada sentença/parágrafo (para fatiar sem copiar texto)
+        self.sentence_token_bounds = self._token_bounds(self.sentence_spans)
+        self.paragraph_token_bounds = self._token_bounds(self.paragraph_spans)
+
+    def _find_spans(self, delimiter: re.Pattern) -> np.ndarray:
+        """Calcula spans (início, fim) entre delimitadores, descartando trechos vazios"""
+        spans = []
+        position = 0
+        for match in delimiter.finditer(self.text):
+            self._append_span(spans, position, match.start())
+            position = match.end()
+        self._append_span(spans, position, len(self.text))
+        return np.asarray(spans, dtype=np.int64).reshape(-1, 2)
+
+    def _append_span(self, spans: List[Tuple[int, int]], start: int, end: int):
+        """Adiciona span com espaços aparados, se não for vazio"""
+        text = self.text
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if end > start:
+            spans.append((start, end))
+
+    def _token_bounds(self, spans: np.ndarray) -> np.ndarray:
+        """Converte spans de caracteres em intervalos [início, fim) de índices de token"""
+        if len(spans) == 0:
+            return np.zeros((0, 2), dtype=np.int64)
+        first = np.searchsorted(self.token_starts, spans[:, 0], side='left')
+        last = np.searchsorted(self.token_starts, spans[:, 1], side='left')
+        return np.stack([first, last], axis=1)
+
+    # ------------------------------------------------------------------
+    # Acessores
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    @property
+    def token_count(self) -> int:
+        return len(self.tokens)
+
+    @property
+    def sentence_count(self) -> int:
+        return len(self.sentence_spans)
+
+    @property
+    def paragraph_count(self) -> int:
+        return len(self.paragraph_spans)
+
+    def words(self, min_length: int = 1, alpha_only: bool = False) -> List[str]:
+        """Tokens filtrados por tamanho mínimo (e opcionalmente só letras)"""
+        if alpha_only:
+            return [t for t in self.tokens if len(t) >= min_length and t.isalpha()]
+        if min_length <= 1:
+            return self.tokens
+        return [t for t in self.tokens if len(t) >= min_length]
+
+    def sentences(self, lower: bool = False) -> Iterator[str]:
+        """Gera o texto de cada sentença (fatia sob demanda)"""
+        source = self.lower if lower else self.text
+        for start, end in self.sentence_spans:
+            yield source[start:end]
+
+    def paragraphs(self, lower: bool = False) -> Iterator[str]:
+        """Gera o texto de cada parágrafo (fatia sob demanda)"""
+        source = self.lower if lower else self.text
+        for start, end in self.paragraph_spans:
+            yield source[start:end]
+
+    def sentence_tokens(self, index: int) -> List[str]:
+        """Tokens de uma sentença, via fatia da lista de tokens"""
+        first, last = self.sentence_token_bounds[index]
+        return self.tokens[first:last]
+
+    def iter_sentence_tokens(self) -> Iterator[List[str]]:
+        """Gera a lista de tokens de cada sentença"""
+        tokens = self.tokens
+        for first, last in self.sentence_token_bounds:
+            yield tokens[first:last]
+
+    def sentence_lengths(self) -> np.ndarray:
+        """Número de tokens por sentença"""
+        if len(self.sentence_token_bounds) == 0:
+            return np.zeros(0, dtype=np.int64)
+        return self.sentence_token_bounds[:, 1] - self.sentence_token_bounds[:, 0]
+
+    def select(self, token_ranges: np.ndarray) -> 'DocumentView':
+        """Recorte do documento a intervalos [início, fim) de tokens, sem copiar texto"""
+        return DocumentView(self, token_ranges)
+
+    def speaker_label_mask(self) -> np.ndarray:
+        """Máscara (bool por token) dos rótulos de falante ("Entrevistador:")"""
+        mask = np.zeros(self.token_count, dtype=bool)
+        spans = [(m.start(), m.end()) for m in SPEAKER_LABEL.finditer(self.text)]
+        if spans:
+            for first, last in self._token_bounds(np.asarray(spans, dtype=np.int64)):
+                mask[first:last] = True
+        return mask
+
+
+class DocumentView(TokenizedDocument):
+    """
+    Recorte de um TokenizedDocument a intervalos de tokens (ex: falas do respondente)
+
+    text/lower são os do documento de origem, então todos os offsets continuam
+    válidos e nenhuma string é copiada: tokens é uma lista de referências e os
+    spans de sentença/parágrafo são os originais recortados aos trechos
+    selecionados. Analisadores recebem a view no lugar do documento inteiro.
+    """
+
+    def __init__(self, source: TokenizedDocument, token_ranges: np.ndarray):
+        self.source = source
+        self.text = source.text
+        self.lower = source.lower
+
+        ranges = np.asarray(token_ranges, dtype=np.int64).reshape(-1, 2)
+        ranges = ranges[ranges[:, 1] > ranges[:, 0]]
+        self.token_ranges = ranges
+
+        tokens = []
+        for first, last in ranges.tolist():
+            tokens.extend(source.tokens[first:last])
+        self.tokens: List[str] = tokens
+
+        index = (np.concatenate([np.arange(first, last) for first, last in ranges])
+                 if len(ranges) else np.zeros(0, dtype=np.int64))
+        self.token_starts = source.token_starts[index]
+        self.token_ends = source.token_ends[index]
+
+        # Trechos de texto cobertos: do primeiro ao último token de cada intervalo
+        self.char_ranges = (np.stack([source.token_starts[ranges[:, 0]],
+                                      source.token_ends[ranges[:, 1] - 1]], axis=1)
+                            if len(ranges) else np.zeros((0, 2), dtype=np.int64))
+
+        self.sentence_spans = _clip_spans(source.sentence_spans, self.char_ranges)
+        self.paragraph_spans = _clip_spans(source.paragraph_spans, self.char_ranges)
+        self.sentence_token_bounds = self._token_bounds(self.sentence_spans)
+        self.paragraph_token_bounds = self._token_bounds(self.paragraph_spans)
+
+    def __len__(self) -> int:
+        return int(np.sum(self.char_ranges[:, 1] - self.char_ranges[:, 0]))
+
+
+def _clip_spans(spans: np.ndarray, ranges: np.ndarray) -> np.ndarray:
+    """Interseção dos spans com trechos [início, fim) ordenados e disjuntos"""
+    pieces = []
+    for start, end in ranges.tolist():
+        first = np.searchsorted(spans[:, 1], start, side='right')
+        last = np.searchsorted(spans[:, 0], end, side='left')
+        piece = spans[first:last].copy()
+        np.maximum(piece[:, 0], start, out=piece[:, 0])
+        np.minimum(piece[:, 1], end, out=piece[:, 1])
+        pieces.append(piece)
+    if not pieces:
+        return np.zeros((0, 2), dtype=np.int64)
+    clipped = np.concatenate(pieces)
+    return clipped[clipped[:, 1] > clipped[:, 0]]
@@ -0,0 +1,311 @@
+"""
+Modelo de tópicos do projeto (LDA / NMF sobre parágrafos)
+
+Um único vocabulário e um único modelo são ajustados sobre os parágrafos de
+todas as transcrições do projeto, então o tópico 'topic_3' significa a mesma
+coisa em todos os arquivos. O ajuste é online: a matriz parágrafo × termo
+(esparsa) é entregue em minilotes a partial_fit(), em até `passes` épocas e
+no máximo ~`max_updates` minilotes: corpora grandes já convergem em poucas
+épocas, e o custo do ajuste deixa de crescer com passes × tamanho. Depois de salvo, cada
+arquivo novo só passa por transform() — barato e sem alterar os tópicos já
+atribuídos aos demais.
+
+TF-IDF: o idf do corpus (parágrafos como documentos) é guardado junto com o
+modelo e usado para os termos distintivos de cada arquivo e, no NMF, como
+entrada do próprio modelo.
+"""
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+
+from engine.text.lexicons import load_lexicon
+from engine.text.tokenized_document import TokenizedDocument
+
+TOPIC_METHODS = ('lda', 'nmf')
+MODEL_VERSION = 4
+
+STOPWORDS_FILE = 'resources/stopwords_custom.txt'
+
+# Palavras frequentes da fala que não caracterizam tópicos
+SPOKEN_STOPWORDS = frozenset({
+    'que', 'para', 'com', 'por', 'mas', 'como', 'isso', 'isto', 'então', 'muito', 'mais',
+    'também', 'porque', 'quando', 'não', 'sim', 'ele', 'ela', 'eles', 'elas', 'você',
+    'vocês', 'gente', 'né', 'tipo', 'assim', 'aqui', 'ali', 'lá', 'foi', 'ser', 'ter',
+    'tem', 'era', 'está', 'estava', 'são', 'vai', 'fazer', 'coisa', 'coisas', 'bem',
+    'sobre', 'ainda', 'até', 'depois', 'aí', 'essa', 'esse', 'esta', 'este', 'pra',
+    'seu', 'sua', 'meu', 'minha', 'nosso', 'nossa', 'já', 'só', 'mesmo', 'cada',
+    'pode', 'nem', 'todo', 'toda', 'todos', 'sabe', 'acho', 'vou', 'tenho', 'temos',
+    'sempre', 'hoje', 'qual', 'quais', 'essas', 'esses', 'têm', 'pela', 'pelo'
+})
+
+
+def topic_stopwords() -> frozenset:
+    """Stopwords de resources/ + palavras frequentes da fala"""
+    return frozenset(load_lexicon(STOPWORDS_FILE)) | SPOKEN_STOPWORDS
+
+
+class TopicModel:
+    """Vocabulário + idf + modelo de tópicos ajustados sobre um corpus de parágrafos"""
+    
+    def __init__(self, n_topics: int = 5, method: str = 'lda', min_word_length: int = 3,
+                 max_features: int = 2000, min_df: int = 2, batch_size: int = 128,
+                 passes: int = 10, max_updates: int = 100, random_state: int = 0):
+        if method not in TOPIC_METHODS:
+            raise ValueError(f"Método de tópicos desconhecido: {method} "
+                             f"(opções: {', '.join(TOPIC_METHODS)})")
+        self.n_topics = n_topics
+        self.method = method
+        self.min_word_length = min_word_length
+        self.max_features = max_features
+        self.min_df = min_df
+        self.batch_size = batch_size
+        self.passes = passes
+        self.max_updates = max_updates
+        self.random_state = random_state
+        
+        self.vocabulary: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.idf: Optional[np.ndarray] = None
+        self.estimator = None
+        # Arquivo ajustado → (tamanho, mtime_ns), como no DuplicateIndex/ProjectManifest
+        self.fitted_files: Dict[str, Tuple[int, int]] = {}
+        # Recorte de falas usado no ajuste (ex: speaker_scope), definido por quem ajusta
+        self.scope: Dict = {}
+        self.units = 0
+        self.signature: Optional[str] = None
+        self._stopwords = topic_stopwords()
+        
+    @property
+    def settings(self) -> Dict:
+        """Parâmetros que definem o modelo (mudança → novo ajuste)"""
+        return {
+            'n_topics': self.n_topics,
+            'method': self.method,
+            'min_word_length': self.min_word_length,
+            'max_features': self.max_features,
+            'min_df': self.min_df,
+            'passes': self.passes,
+            'max_updates': self.max_updates
+        }
+        
+    @property
+    def fitted(self) -> bool:
+        return self.estimator is not None
+        
+    # ------------------------------------------------------------------
+    # Ajuste
+    # ------------------------------------------------------------------
+    
+    def fit(self, sources: Iterable[Union[Path, TokenizedDocument]],
+            select: Callable[[TokenizedDocument], TokenizedDocument] = None) -> 'TopicModel':
+        """
+        Ajusta vocabulário, idf e modelo sobre os parágrafos das fontes
+        
+        sources: caminhos de transcrições (lidos um a um) ou documentos já tokenizados
+        select: recorte aplicado a cada documento lido (ex: só falas dos respondentes)
+        """
+        vocabulary: Dict[str, int] = {}
+        blocks = []
+        fitted_files = {}
+        
+        for source in sources:
+            if isinstance(source, TokenizedDocument):
+                document = source
+            else:
+                path = Path(source)
+                document = TokenizedDocument(path.read_text(encoding='utf-8'))
+                stat = path.stat()
+                fitted_files[path.name] = (stat.st_size, stat.st_mtime_ns)
+                if select is not None:
+                    document = select(document)
+            blocks.append(self._unit_counts(document, vocabulary, grow=True))
+            
+        # Matriz parágrafo × termo do corpus inteiro (colunas = vocabulário completo)
+        # (blocos anteriores são alargados até o vocabulário final)
+        width = len(vocabulary)
+        counts = sparse.csr_matrix((0, width))
+        if blocks:
+            counts = sparse.vstack([sparse.csr_matrix((block.data, block.indices, block.indptr),
+                                                      shape=(block.shape[0], width))
+                                    for block in blocks], format='csr')
+                                    
+        counts = self._select_vocabulary(counts, vocabulary)
+        self.units = counts.shape[0]
+        self.fitted_files = fitted_files
+        
+        # idf suavizado (mesma fórmula do TfidfTransformer)
+        document_frequency = np.bincount(counts.indices, minlength=counts.shape[1])
+        self.idf = np.log((1 + self.units) / (1 + document_frequency)) + 1.0
+        
+        self.estimator = self._new_estimator(min(self.n_topics, max(1, self.units)))
+        if counts.nnz:
+            self._partial_fit(counts)
+        else:
+            self.estimator = None
+            
+        self.signature = hashlib.sha256(json.dumps(
+            [self.settings, self.scope, sorted(fitted_files.items()), self.vocabulary, self.units],
+            ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+        return self
+        
+    def _unit_counts(self, document: TokenizedDocument, vocabulary: Dict[str, int],
+                     grow: bool = False) -> sparse.csr_matrix:
+        """Contagens parágrafo × termo (termos novos entram no vocabulário se grow)"""
+        bounds = document.paragraph_token_bounds
+        tokens = document.tokens
+        stopwords = self._stopwords
+        min_length = self.min_word_length
+        rows, cols = [], []
+        
+        # Rótulos de falante ("Entrevistador:") não são conteúdo
+        in_label = document.speaker_label_mask().tolist()
+        
+        for row, (first, last) in enumerate(bounds):
+            for position in range(first, last):
+                token = tokens[position]
+                if (len(token) < min_length or token in stopwords or in_label[position]
+                        or not token.isalpha()):
+                    continue
+                column = vocabulary.get(token)
+                if column is None:
+                    if not grow:
+                        continue
+                    column = vocabulary[token] = len(vocabulary)
+                rows.append(row)
+                cols.append(column)
+                
+        data = np.ones(len(rows), dtype=np.float64)
+        matrix = sparse.coo_matrix((data, (rows, cols)), shape=(len(bounds), len(vocabulary)))
+        return matrix.tocsr()
+        
+    def _select_vocabulary(self, counts: sparse.csr_matrix, vocabulary: Dict[str, int]) -> sparse.csr_matrix:
+        """Mantém termos com df >= min_df (os max_features mais frequentes)"""
+        terms = sorted(vocabulary, key=vocabulary.get)
+        if not terms:
+            self.vocabulary, self.index = [], {}
+            return counts
+            
+        document_frequency = np.bincount(counts.indices, minlength=len(terms))
+        min_df = self.min_df if counts.shape[0] >= self.min_df else 1
+        keep = np.flatnonzero(document_frequency >= min_df)
+        if len(keep) == 0:
+            keep = np.arange(len(terms))
+            
+        # Mais frequentes primeiro; empate pela ordem de aparição (determinístico)
+        totals = np.asarray(counts.sum(axis=0)).ravel()
+        keep = keep[np.lexsort((keep, -totals[keep]))][:self.max_features]
+        keep.sort()
+        
+        self.vocabulary = [terms[i] for i in keep]
+        self.index = {term: i for i, term in enumerate(self.vocabulary)}
+        return counts[:, keep]
+        
+    def _new_estimator(self, n_components: int):
+        from sklearn.decomposition import LatentDirichletAllocation, MiniBatchNMF
+        
+        if self.method == 'nmf':
+            return MiniBatchNMF(n_components=n_components, batch_size=self.batch_size,
+                                init='nndsvda', random_state=self.random_state)
+        return LatentDirichletAllocation(n_components=n_components, learning_method='online',
+                                         batch_size=self.batch_size, random_state=self.random_state)
+                                         
+    def _partial_fit(self, counts: sparse.csr_matrix):
+        """Ajuste online: até `passes` épocas de minilotes embaralhados (~max_updates minilotes)"""
+        matrix = self._model_input(counts)
+        batches = -(-matrix.shape[0] // self.batch_size)
+        passes = max(1, min(self.passes, -(-self.max_updates // max(1, batches))))
+        rng = np.random.RandomState(self.random_state)
+        for _ in range(passes):
+            order = rng.permutation(matrix.shape[0])
+            for start in range(0, len(order), self.batch_size):
+                self.estimator.partial_fit(matrix[order[start:start + self.batch_size]])
+                
+    def _model_input(self, counts: sparse.csr_matrix) -> sparse.csr_matrix:
+        """LDA usa contagens; NMF usa TF-IDF normalizado (L2)"""
+        if self.method != 'nmf':
+            return counts
+        weighted = sparse.csr_matrix(counts.multiply(self.idf))
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.csr_matrix(sparse.diags(1.0 / norms) @ weighted)
+        
+    # ------------------------------------------------------------------
+    # Uso
+    # ------------------------------------------------------------------
+    
+    def document_counts(self, document: TokenizedDocument) -> sparse.csr_matrix:
+        """Contagens do arquivo inteiro (1 × vocabulário), sem alterar o vocabulário"""
+        units = self._unit_counts(document, self.index)
+        return sparse.csr_matrix(units.sum(axis=0))
+        
+    def transform(self, document: TokenizedDocument) -> np.ndarray:
+        """Distribuição de tópicos do arquivo (soma 1; zeros se nenhum termo conhecido)"""
+        distribution = np.zeros(self.topic_count)
+        counts = self.document_counts(document)
+        if not self.fitted or counts.nnz == 0:
+            return distribution
+            
+        weights = self.estimator.transform(self._model_input(counts))[0]
+        total = weights.sum()
+        return weights / total if total > 0 else distribution
+        
+    @property
+    def topic_count(self) -> int:
+        return self.estimator.components_.shape[0] if self.fitted else 0
+        
+    def top_terms(self, topic: int, limit: int = 10) -> List[str]:
+        """Termos de maior peso do tópico"""
+        weights = self.estimator.components_[topic]
+        return [self.vocabulary[i] for i in np.argsort(-weights, kind='stable')[:limit]]
+        
+    def distinctive_terms(self, document: TokenizedDocument, limit: int = 10) -> List[str]:
+        """Termos com maior TF-IDF no arquivo (idf do corpus)"""
+        counts = self.document_counts(document)
+        if counts.nnz == 0:
+            return []
+        scores = counts.multiply(self.idf).toarray()[0]
+        order = np.argsort(-scores, kind='stable')[:limit]
+        return [self.vocabulary[i] for i in order if scores[i] > 0]
+        
+    def is_stale(self, paths: List[Path], growth: float) -> bool:
+        """Corpus cresceu (arquivos novos/alterados) mais que `growth` do ajustado?"""
+        fitted_bytes = sum(size for size, _ in self.fitted_files.values())
+        new_bytes = 0
+        for path in paths:
+            stat = path.stat()
+            # Edição que mantém o tamanho também muda o mtime
+            if self.fitted_files.get(path.name) != (stat.st_size, stat.st_mtime_ns):
+                new_bytes += stat.st_size
+        return new_bytes > growth * max(1, fitted_bytes)
+        
+    # ------------------------------------------------------------------
+    # Persistência
+    # ------------------------------------------------------------------
+    
+    def save(self, path: Path):
+        """💾 Gravação atômica do modelo ajustado"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({'version': MODEL_VERSION, 'model': self}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        
+    @staticmethod
+    def load(path: Path) -> Optional['TopicModel']:
+        """Modelo salvo (None se ausente, ilegível ou de outra versão)"""
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.load(f)
+        except Exception:
+            return None
+        if not isinstance(payload, dict) or payload.get('version') != MODEL_VERSION:
+            return None
+        return payload.get('model')
@@ -8,10 +8,10 @@ import sys
 import logging
 from pathlib import Path
 
-# Imports dos módulos
+# Imports dos módulos (AnalysisRunner só no comando analyze: numpy/plotly não
+# são carregados para --list-projects / --create-project)
 from core.managers.cli_manager import CLIManager
 from core.managers.project_manager import ProjectManager
-from core.managers.analysis_runner import AnalysisRunner
 # from core.visuals.visualization_manager import test_visualization_system
 
 
@@ -65,8 +65,22 @@ def main():
         print(message)
         
         # Executar análise
-        runner = AnalysisRunner()
+        from core.managers.analysis_runner import AnalysisRunner
+        runner = AnalysisRunner(jobs=args.jobs, use_cache=False if args.no_cache else None,
+                                stream=True if args.stream else None, cprofile=args.profile)
         project_path = Path("projects") / params
+        
+        if args.watch:
+            # Motor aquecido: cada ciclo só reanalisa arquivos novos/alterados
+            from core.managers.project_watcher import ProjectWatcher
+            system = runner.global_config.get('system', {})
+            runner.use_cache = True
+            watcher = ProjectWatcher(runner, project_path,
+                                     interval=system.get('watch_interval', 0.5),
+                                     debounce=system.get('watch_debounce', 1.0))
+            watcher.run()
+            sys.exit(0)
+            
         success = runner.analyze_project(project_path)
         
         if success:
@@ -76,9 +90,70 @@ def main():
         sys.exit(0 if success else 1)
         
     elif command == 'compare':
-        # TODO: Implementar comparação
-        print("⚠️  Comparação ainda não implementada na nova versão")
-        sys.exit(1)
+        # Comparar projetos (similaridade entre todas as transcrições)
+        projects = {}
+        for name in params:
+            valid, message = project_manager.validate_project(name)
+            if not valid:
+                print(f"❌ {name}: {message}")
+                sys.exit(1)
+            projects[name] = sorted((Path("projects") / name / "arquivos").glob("*.txt"))
+            
+        from core.engine.comparative_analyzer import ComparativeAnalyzer
+        comparator = ComparativeAnalyzer()
+        comparison = comparator.compare_projects(projects)
+        comparator.print_summary(comparison)
+        output_path = comparator.save(comparison, Path("projects") / "comparisons")
+        
+        print(f"\n✅ Análise comparativa concluída")
+        print(f"📂 Resultados salvos em: {output_path}")
+        sys.exit(0)
+        
+    elif command in ('query', 'aggregate', 'sql'):
+        # Consultas ao banco de resultados (gravado a cada análise de projeto)
+        import sqlite3
+        from core.managers.result_store import ResultStore, print_table
+        store_path = ResultStore.configured_path()
+        if store_path is None or not store_path.exists():
+            print("❌ Banco de resultados não encontrado: analise um projeto primeiro "
+                  "(system.result_store)")
+            sys.exit(1)
+            
+        try:
+            with ResultStore(store_path, read_only=True) as store:
+                if command == 'query' and not params:
+                    columns, rows = ['analyzer', 'metric', 'files'], store.metric_names()
+                elif command == 'query':
+                    columns, rows = store.query(params, limit=args.limit)
+                elif command == 'aggregate':
+                    columns, rows = store.aggregate(params)
+                else:
+                    columns, rows = store.execute(params)
+        except (ValueError, sqlite3.Error) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+            
+        print_table(columns, rows)
+        sys.exit(0)
+        
+    elif command == 'search':
+        # Concordância de um termo/frase (índice invertido atualizado a cada análise)
+        import time
+        from core.managers.fulltext_index import FULLTEXT_INDEX_PATH, FullTextIndex
+        query, projects = params[0], params[1:]
+        index = FullTextIndex(FULLTEXT_INDEX_PATH)
+        if not index.segments:
+            print("❌ Índice de busca vazio: analise um projeto primeiro (system.fulltext_index)")
+            sys.exit(1)
+            
+        start = time.perf_counter()
+        hits = index.search(query, projects=projects)
+        elapsed = (time.perf_counter() - start) * 1000
+        lines = index.concordance(hits[:args.limit] if args.limit else hits, width=args.context)
+        index.print_concordance(lines, width=args.context)
+        print(f"\n🔎 {len(hits)} ocorrência(s) em {len({(h['project'], h['file']) for h in hits})} "
+              f"arquivo(s) ({elapsed:.1f} ms)")
+        sys.exit(0)
         
     elif command == 'test':
         # Testar visualizações
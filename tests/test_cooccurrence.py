@@ -0,0 +1,109 @@
+"""CooccurrenceMatrix comparada a contagens ingênuas por janela e a PMI/NPMI calculados à mão"""
+import math
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from engine.text.cooccurrence import CooccurrenceMatrix
+from engine.text.tokenized_document import TokenizedDocument
+
+VOCABULARY = ['escola', 'aluno', 'professor', 'prova', 'recreio', 'leitura']
+WORDS = VOCABULARY + ['ontem', 'muito']
+
+
+def random_document(rng):
+    sentences = [' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 12)))
+                 for _ in range(rng.randint(1, 6))]
+    return TokenizedDocument('. '.join(sentences) + '.')
+
+
+def naive_window_counts(documents, vocabulary):
+    index = {term: i for i, term in enumerate(vocabulary)}
+    counts = np.zeros((len(vocabulary), len(vocabulary)), dtype=np.int64)
+    for document in documents:
+        for start, end in document.sentence_token_bounds:
+            present = Counter(index[token] for token in document.tokens[start:end] if token in index)
+            for a, count_a in present.items():
+                for b, count_b in present.items():
+                    if a != b:
+                        counts[a, b] += count_a * count_b
+    return counts
+
+
+def naive_sliding_counts(documents, vocabulary, window_size):
+    index = {term: i for i, term in enumerate(vocabulary)}
+    counts = np.zeros((len(vocabulary), len(vocabulary)), dtype=np.int64)
+    for document in documents:
+        ids = [index.get(token, -1) for token in document.tokens]
+        for i, a in enumerate(ids):
+            for b in ids[i + 1:i + window_size]:
+                if a >= 0 and b >= 0 and a != b:
+                    counts[a, b] += 1
+                    counts[b, a] += 1
+    return counts
+
+
+def test_sentence_windows_match_naive_counts():
+    rng = random.Random(11)
+    documents = [random_document(rng) for _ in range(30)]
+    matrix = CooccurrenceMatrix(VOCABULARY).add(documents)
+    assert matrix.counts.toarray().tolist() == naive_window_counts(documents, VOCABULARY).tolist()
+    assert matrix.documents == 30
+
+
+def test_fixed_window_matches_naive_pairs():
+    rng = random.Random(12)
+    documents = [random_document(rng) for _ in range(30)]
+    matrix = CooccurrenceMatrix(VOCABULARY, window='fixed_window', window_size=3).add(documents)
+    assert matrix.counts.toarray().tolist() == naive_sliding_counts(documents, VOCABULARY, 3).tolist()
+
+
+def test_pmi_and_npmi_match_hand_computation():
+    rng = random.Random(13)
+    matrix = CooccurrenceMatrix(VOCABULARY).add([random_document(rng) for _ in range(20)])
+    counts = matrix.counts.toarray().astype(float)
+    total = counts.sum()
+    marginals = counts.sum(axis=1) / total
+
+    pmi = matrix.association('pmi').toarray()
+    npmi = matrix.association('npmi').toarray()
+    for a, b in zip(*np.nonzero(np.triu(counts, k=1))):
+        joint = counts[a, b] / total
+        expected = math.log(joint / (marginals[a] * marginals[b]))
+        assert pmi[a, b] == pytest.approx(expected) and pmi[b, a] == pytest.approx(expected)
+        assert npmi[a, b] == pytest.approx(expected / -math.log(joint))
+    assert np.all(np.abs(npmi) <= 1 + 1e-9)
+
+
+def test_top_edges_rank_by_weighting():
+    matrix = CooccurrenceMatrix(['escola', 'aluno', 'prova', 'recreio'])
+    matrix.add(TokenizedDocument("escola aluno. escola aluno. escola aluno prova. recreio prova."))
+    edges = matrix.top_edges(limit=2)
+    # Empate em 1 (escola–prova, aluno–prova, prova–recreio): ordem do vocabulário
+    assert [(edge['word1'], edge['word2'], edge['weight']) for edge in edges] == [
+        ('aluno', 'escola', 3), ('escola', 'prova', 1)]
+    # Par exclusivo (recreio só aparece com prova) tem o maior PMI; o NPMI favorece o par frequente
+    best = matrix.top_edges(limit=1, weighting='pmi')[0]
+    assert (best['word1'], best['word2'], best['pmi']) == ('prova', 'recreio', round(math.log(4), 4))
+    best = matrix.top_edges(limit=1, weighting='npmi')[0]
+    assert (best['word1'], best['word2']) == ('aluno', 'escola')
+    assert matrix.top_edges(min_count=4) == []
+
+
+def test_from_documents_picks_most_frequent_terms_in_first_seen_order():
+    documents = [TokenizedDocument("prova escola aluno. aluno escola"), TokenizedDocument("leitura prova aluno")]
+    matrix = CooccurrenceMatrix.from_documents(documents, limit=3)
+    # aluno (3), prova/escola (2, prova aparece antes)
+    assert matrix.vocabulary == ['aluno', 'prova', 'escola']
+    expected = CooccurrenceMatrix(matrix.vocabulary).add(documents)
+    assert matrix.counts.toarray().tolist() == expected.counts.toarray().tolist()
+    assert matrix.term_counts.tolist() == [3, 2, 2]
+
+
+def test_unknown_window_or_weighting_is_rejected():
+    with pytest.raises(ValueError):
+        CooccurrenceMatrix(VOCABULARY, window='documento')
+    with pytest.raises(ValueError):
+        CooccurrenceMatrix(VOCABULARY).association('tfidf')
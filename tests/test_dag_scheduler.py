@@ -0,0 +1,92 @@
+"""DAGScheduler: ordem de dependências, concorrência, cache, erros e ciclos"""
+import threading
+
+from core.engine.dag_scheduler import DAGScheduler
+
+# a → (b, c) → d; e independente
+DEPENDENCIES = {'b': ['a'], 'c': ['a'], 'd': ['b', 'c'], 'e': []}
+ORDER = ['a', 'b', 'c', 'e', 'd']
+
+
+def run(scheduler, plans, dependencies=DEPENDENCIES, order=ORDER):
+    """Executa o DAG; registra o que já tinha terminado quando cada nó foi liberado"""
+    completed, seen_at_resolve, values = [], {}, {}
+
+    def resolve(node):
+        seen_at_resolve[node] = set(completed)
+        return plans(node)
+
+    def on_complete(node, value):
+        completed.append(node)
+        values[node] = value
+
+    timeline = scheduler.run(order, dependencies, resolve, on_complete)
+    return timeline, seen_at_resolve, values
+
+
+def test_nodes_start_after_their_dependencies():
+    scheduler = DAGScheduler(max_threads=4)
+    try:
+        timeline, seen, values = run(scheduler, lambda node: ('thread', str.upper, (node,)))
+    finally:
+        scheduler.close()
+    assert values == {node: node.upper() for node in ORDER}
+    for node, deps in DEPENDENCIES.items():
+        assert set(deps) <= seen[node]
+        assert all(timeline[node]['start'] >= timeline[dep]['end'] for dep in deps)
+    assert {record['mode'] for record in timeline.values()} == {'thread'}
+
+
+def test_independent_nodes_run_concurrently():
+    # b e c só passam da barreira se estiverem rodando ao mesmo tempo
+    barrier = threading.Barrier(2, timeout=5)
+    scheduler = DAGScheduler(max_threads=2)
+    try:
+        _, _, values = run(scheduler, lambda node: ('thread', barrier.wait, ()) if node in 'bc'
+                           else ('thread', len, (node,)))
+    finally:
+        scheduler.close()
+    assert not any(isinstance(value, Exception) for value in values.values())
+
+
+def test_cached_nodes_and_errors_still_release_dependents():
+    def plans(node):
+        if node == 'a':
+            return ('done', 'do cache')
+        if node == 'b':
+            return ('inline', int, ('não é número',))
+        return ('inline', str, (node,))
+
+    timeline, _, values = run(DAGScheduler(max_threads=1), plans)
+    assert values['a'] == 'do cache' and timeline['a']['mode'] == 'cache'
+    assert isinstance(values['b'], ValueError)
+    assert values['d'] == 'd'
+    assert timeline['d']['mode'] == 'inline'
+
+
+def test_single_thread_runs_inline_ready_nodes_in_waves():
+    completed = []
+    scheduler = DAGScheduler(max_threads=1)
+    scheduler.run(ORDER, DEPENDENCIES, lambda node: ('thread', str, (node,)),
+                  lambda node, value: completed.append(node))
+    # Nós prontos de cada rodada, na ordem topológica: (a, e), depois (b, c), depois d
+    assert completed == ['a', 'e', 'b', 'c', 'd']
+
+
+def test_cycles_and_unknown_dependencies_do_not_block():
+    dependencies = {'x': ['y'], 'y': ['x'], 'z': ['ausente']}
+    _, _, values = run(DAGScheduler(max_threads=1), lambda node: ('inline', str, (node,)),
+                       dependencies, ['x', 'y', 'z'])
+    assert values == {'x': 'x', 'y': 'y', 'z': 'z'}
+
+
+def test_process_mode_returns_values():
+    scheduler = DAGScheduler(max_threads=2, max_processes=1)
+    try:
+        timeline, _, values = run(scheduler, lambda node: ('process', pow, (2, 10)),
+                                  {'b': ['a']}, ['a', 'b'])
+    finally:
+        scheduler.close()
+    assert values == {'a': 1024, 'b': 1024}
+    assert timeline['b']['mode'] == 'process'
+    assert DAGScheduler.makespan(timeline) >= 0
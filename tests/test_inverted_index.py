@@ -0,0 +1,71 @@
+"""match_phrase: frases e prefixos em vários segmentos, antes e depois da fusão"""
+import numpy as np
+import pytest
+
+from engine.text.inverted_index import Segment, match_phrase, merge_segments, parse_query, write_segment
+from engine.text.tokenized_document import TokenizedDocument
+
+TEXTS = {
+    0: "Eu não sei. Não sei não, talvez a tecnologia ajude.",
+    1: "A tecnologia na escola: não sei se os professores usam tecnologias novas.",
+    2: "Não gosto. Sei lá, não sei dizer.",
+    3: "Tecnológico demais para mim. Não sei.",
+}
+
+
+def naive_hits(query, doc_ids):
+    """(doc, start, end) testando todas as posições de cada documento"""
+    terms = parse_query(query)
+    hits = []
+    for doc_id in doc_ids:
+        document = TokenizedDocument(TEXTS[doc_id])
+        tokens = document.tokens
+        for i in range(len(tokens) - len(terms) + 1):
+            if all(tokens[i + k].startswith(term) if prefix else tokens[i + k] == term
+                   for k, (term, prefix) in enumerate(terms)):
+                hits.append((doc_id, int(document.token_starts[i]),
+                             int(document.token_ends[i + len(terms) - 1])))
+    return hits
+
+
+def search(segments, query, live=None):
+    hits = []
+    for segment in segments:
+        found = match_phrase(segment, parse_query(query), live)
+        hits.extend(zip(found['doc'].tolist(), found['start'].tolist(), found['end'].tolist()))
+    return sorted(hits)
+
+
+@pytest.fixture
+def segments(tmp_path):
+    write_segment(tmp_path / "a", [(0, TokenizedDocument(TEXTS[0])), (1, TokenizedDocument(TEXTS[1]))])
+    write_segment(tmp_path / "b", [(2, TokenizedDocument(TEXTS[2])), (3, TokenizedDocument(TEXTS[3]))])
+    return [Segment(tmp_path / "a"), Segment(tmp_path / "b")]
+
+
+@pytest.mark.parametrize("query", ["não sei", "sei não", "não sei*", "tecnolog*", "a tecnolog*",
+                                   "não", "inexistente", "não inexistente"])
+def test_queries_across_segments(segments, query):
+    assert search(segments, query) == sorted(naive_hits(query, TEXTS))
+
+
+def test_sentence_and_offsets(segments):
+    # Frases ignoram pontuação: "sei. Não" também casa, na sentença do primeiro termo
+    found = match_phrase(segments[0], parse_query("sei não"))
+    assert found['doc'].tolist() == [0, 0]
+    assert found['sentence'].tolist() == [0, 1]
+    matched = [TEXTS[0][start:end].lower() for start, end in zip(found['start'], found['end'])]
+    assert matched == ["sei. não", "sei não"]
+
+
+def test_live_mask_and_merge(segments, tmp_path):
+    live = np.ones(len(TEXTS), dtype=bool)
+    live[1] = False
+    expected = sorted(naive_hits("tecnolog*", [0, 2, 3]))
+    assert search(segments, "tecnolog*", live) == expected
+
+    merge_segments(tmp_path / "merged", segments, live)
+    merged = Segment(tmp_path / "merged")
+    assert search([merged], "tecnolog*") == expected
+    assert search([merged], "não sei") == sorted(naive_hits("não sei", [0, 2, 3]))
+    assert "usam" not in merged.terms.tolist()
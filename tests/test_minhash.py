@@ -0,0 +1,59 @@
+"""Jaccard estimado pelo MinHash comparado ao Jaccard exato dos shingles"""
+import random
+
+import numpy as np
+
+from engine.text.minhash import LSHIndex, MinHasher, estimate_jaccard, shingle_hashes
+from engine.text.tokenized_document import TokenizedDocument
+
+
+def exact_jaccard(first, second):
+    a, b = set(shingle_hashes(first).tolist()), set(shingle_hashes(second).tolist())
+    return len(a & b) / len(a | b)
+
+
+def words(rng, count):
+    return [f"palavra{rng.randint(0, 5000)}" for _ in range(count)]
+
+
+def test_estimate_tracks_exact_jaccard():
+    rng = random.Random(11)
+    hasher = MinHasher(num_perm=256)
+    base = words(rng, 400)
+    for changed in (0, 20, 80, 200, 400):
+        edited = base[:]
+        for position in rng.sample(range(len(base)), changed):
+            edited[position] = f"outra{position}"
+        first, second = TokenizedDocument(' '.join(base)), TokenizedDocument(' '.join(edited))
+        estimate = estimate_jaccard(hasher.signature(first), hasher.signature(second))
+        assert abs(estimate - exact_jaccard(first, second)) < 0.1
+
+
+def test_identical_and_empty_documents():
+    hasher = MinHasher(num_perm=64)
+    document = TokenizedDocument("Entrevistador: como foi?\nMãe: foi bom, muito bom mesmo.")
+    signature = hasher.signature(document)
+    assert estimate_jaccard(signature, hasher.signature(document)) == 1.0
+    assert len(hasher.signature(TokenizedDocument("... !!!"))) == 0
+    assert estimate_jaccard(signature, np.zeros(0, dtype=np.uint64)) == 0.0
+
+
+def test_speaker_labels_do_not_count():
+    hasher = MinHasher(num_perm=64)
+    first = TokenizedDocument("Mãe: a escola mudou bastante neste ano letivo")
+    second = TokenizedDocument("Pai: a escola mudou bastante neste ano letivo")
+    assert estimate_jaccard(hasher.signature(first), hasher.signature(second)) == 1.0
+
+
+def test_lsh_finds_near_duplicate():
+    rng = random.Random(5)
+    hasher = MinHasher(num_perm=128)
+    index = LSHIndex(num_perm=128, bands=32)
+    base = words(rng, 300)
+    index.add('original', hasher.signature(TokenizedDocument(' '.join(base))))
+    index.add('outro', hasher.signature(TokenizedDocument(' '.join(words(rng, 300)))))
+    edited = base[:]
+    edited[150] = 'editado'
+    assert index.query(hasher.signature(TokenizedDocument(' '.join(edited)))) == {'original'}
+    index.remove('original')
+    assert 'original' not in index and len(index) == 1
@@ -0,0 +1,60 @@
+"""PatternMatcher (Aho–Corasick) comparado a uma contagem ingênua por padrão"""
+import random
+
+from engine.text.pattern_matcher import PatternMatcher
+from engine.text.tokenized_document import TOKEN_PATTERN, TokenizedDocument
+
+LEXICONS = {
+    'hesitations': ['né', 'tipo', 'assim', 'sabe', 'tipo assim'],
+    'uncertainty': ['não sei', 'acho que', 'talvez', 'não sei não', 'preocup*'],
+    'overlap': ['sei', 'não sei', 'sei não', 'não'],
+}
+VOCABULARY = ['né', 'tipo', 'assim', 'sabe', 'não', 'sei', 'acho', 'que', 'talvez', 'preocupado',
+              'preocupação', 'protótipo', 'escola', 'aluno', 'eu']
+
+
+def naive_counts(tokens, lexicons):
+    """Ocorrências de cada categoria testando todas as posições de cada padrão"""
+    counts = {}
+    for category, entries in lexicons.items():
+        total = 0
+        for entry in entries:
+            if entry.endswith('*'):
+                stem = entry[:-1]
+                total += sum(token.startswith(stem) for token in tokens)
+                continue
+            pattern = TOKEN_PATTERN.findall(entry)
+            total += sum(tokens[i:i + len(pattern)] == pattern
+                         for i in range(len(tokens) - len(pattern) + 1))
+        counts[category] = total
+    return counts
+
+
+def test_counts_match_naive_on_random_text():
+    rng = random.Random(7)
+    matcher = PatternMatcher(LEXICONS)
+    for _ in range(50):
+        text = ' '.join(rng.choice(VOCABULARY) for _ in range(rng.randint(0, 200)))
+        document = TokenizedDocument(text)
+        assert matcher.scan(document).counts() == naive_counts(document.tokens, LEXICONS)
+
+
+def test_string_and_document_scans_agree():
+    text = "Eu não sei, tipo assim... Não sei não. Fiquei preocupado com o protótipo."
+    matcher = PatternMatcher(LEXICONS)
+    from_text = matcher.scan(text)
+    from_document = matcher.scan(TokenizedDocument(text))
+    assert from_text.counts() == from_document.counts()
+    assert from_text.offsets('uncertainty').tolist() == from_document.offsets('uncertainty').tolist()
+
+
+def test_matches_respect_word_boundaries():
+    result = PatternMatcher({'hesitations': ['tipo']}).scan("protótipo tipo tipos")
+    assert result.count('hesitations') == 1
+    assert result.offsets('hesitations').tolist() == [[10, 14]]
+
+
+def test_by_pattern_follows_lexicon_order():
+    result = PatternMatcher(LEXICONS).scan("não sei não sei não")
+    assert result.by_pattern('overlap') == {'sei': 2, 'não sei': 2, 'sei não': 2, 'não': 3}
+    assert result.present('hesitations') == []
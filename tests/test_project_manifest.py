@@ -0,0 +1,126 @@
+"""ProjectManifest: plano incremental, gráficos desatualizados e limpeza de transcrições removidas"""
+import os
+
+from core.managers.project_manifest import ProjectManifest
+
+ANALYSIS, RENDER = 'analise-v1', 'render-v1'
+
+
+def make_project(tmp_path, texts):
+    folder = tmp_path / 'arquivos'
+    folder.mkdir(exist_ok=True)
+    paths = []
+    for name, text in texts.items():
+        path = folder / name
+        path.write_text(text, encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+def run(tmp_path, paths, analysis=ANALYSIS, render=RENDER, charts_per_file=False):
+    """Uma execução: planeja, 'produz' relatório e resultado e grava o manifesto"""
+    manifest = ProjectManifest(tmp_path)
+    plan = manifest.plan(paths, analysis, render, charts_per_file)
+    for item in plan:
+        report = tmp_path / f"report_{item['path'].stem}.md"
+        report.write_text('relatório', encoding='utf-8')
+        result = {'filename': item['path'].name} if item['analyze'] else None
+        manifest.record(item, analysis, result, rendered=True, outputs=[str(report)],
+                        digest={'charts': ['wordcloud'], 'file': item['path'].name})
+    manifest.save([path.name for path in paths], render)
+    return plan
+
+
+def flags(plan, key):
+    return {item['path'].name: item[key] for item in plan}
+
+
+def test_unchanged_files_are_reused_with_their_digest(tmp_path):
+    paths = make_project(tmp_path, {'a.txt': 'primeira', 'b.txt': 'segunda'})
+    first = run(tmp_path, paths)
+    assert flags(first, 'analyze') == {'a.txt': True, 'b.txt': True}
+
+    plan = ProjectManifest(tmp_path).plan(paths, ANALYSIS, RENDER, False)
+    assert flags(plan, 'analyze') == {'a.txt': False, 'b.txt': False}
+    assert flags(plan, 'report') == {'a.txt': False, 'b.txt': False}
+    assert plan[0]['digest'] == {'charts': ['wordcloud'], 'file': 'a.txt'}
+    assert ProjectManifest(tmp_path).load_result('b.txt') == {'filename': 'b.txt'}
+
+
+def test_only_changed_content_is_reanalyzed(tmp_path):
+    paths = make_project(tmp_path, {'a.txt': 'primeira', 'b.txt': 'segunda'})
+    run(tmp_path, paths)
+
+    # a.txt: conteúdo novo; b.txt: só o mtime muda (hash igual)
+    paths[0].write_text('primeira, editada', encoding='utf-8')
+    stat = paths[1].stat()
+    os.utime(paths[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    plan = ProjectManifest(tmp_path).plan(paths, ANALYSIS, RENDER, False)
+    assert flags(plan, 'analyze') == {'a.txt': True, 'b.txt': False}
+    assert flags(plan, 'report') == {'a.txt': True, 'b.txt': False}
+    assert plan[0]['digest'] is None
+
+
+def test_signatures_and_missing_outputs(tmp_path):
+    paths = make_project(tmp_path, {'a.txt': 'primeira', 'b.txt': 'segunda'})
+    run(tmp_path, paths)
+
+    plan = ProjectManifest(tmp_path).plan(paths, 'analise-v2', RENDER, False)
+    assert flags(plan, 'analyze') == {'a.txt': True, 'b.txt': True}
+
+    plan = ProjectManifest(tmp_path).plan(paths, ANALYSIS, 'render-v2', False)
+    assert flags(plan, 'analyze') == {'a.txt': False, 'b.txt': False}
+    assert flags(plan, 'report') == {'a.txt': True, 'b.txt': True}
+
+    (tmp_path / 'report_b.md').unlink()
+    plan = ProjectManifest(tmp_path).plan(paths, ANALYSIS, RENDER, False)
+    assert flags(plan, 'report') == {'a.txt': False, 'b.txt': True}
+
+
+def test_single_page_charts_follow_any_change(tmp_path):
+    paths = make_project(tmp_path, {'a.txt': 'primeira', 'b.txt': 'segunda'})
+    run(tmp_path, paths, charts_per_file=True)
+    assert not any(flags(ProjectManifest(tmp_path).plan(paths, ANALYSIS, RENDER, True), 'charts').values())
+
+    paths[1].write_text('segunda, editada', encoding='utf-8')
+    plan = ProjectManifest(tmp_path).plan(paths, ANALYSIS, RENDER, True)
+    assert flags(plan, 'charts') == {'a.txt': True, 'b.txt': True}
+    # Ordem diferente dos arquivos também refaz a página única
+    run(tmp_path, paths, charts_per_file=True)
+    plan = ProjectManifest(tmp_path).plan(paths[::-1], ANALYSIS, RENDER, True)
+    assert all(flags(plan, 'charts').values())
+
+
+def test_stale_charts_follow_owner_and_html(tmp_path):
+    paths = make_project(tmp_path, {'a.txt': 'primeira', 'b.txt': 'segunda'})
+    run(tmp_path, paths)
+    output_dir = tmp_path / 'output'
+    output_dir.mkdir()
+    chart_files = {'wordcloud': 'wordcloud.html', 'timeline': 'timeline.html'}
+    for filename in chart_files.values():
+        (output_dir / filename).write_text('<html>', encoding='utf-8')
+
+    manifest = ProjectManifest(tmp_path)
+    plan = manifest.plan(paths, ANALYSIS, RENDER, False)
+    owners = {'wordcloud': plan[1], 'timeline': plan[0]}
+    assert set(manifest.stale_charts(owners, output_dir, chart_files)) == {'wordcloud', 'timeline'}
+    manifest.record_charts(owners, failed=set())
+    assert manifest.stale_charts(owners, output_dir, chart_files) == {}
+
+    # Novo dono, HTML apagado ou falha de renderização: refazer
+    assert set(manifest.stale_charts({'wordcloud': plan[0]}, output_dir, chart_files)) == {'wordcloud'}
+    (output_dir / 'timeline.html').unlink()
+    assert set(manifest.stale_charts(owners, output_dir, chart_files)) == {'timeline'}
+    manifest.record_charts(owners, failed={plan[1]['index']})
+    assert 'wordcloud' in manifest.stale_charts(owners, output_dir, chart_files)
+
+
+def test_removed_transcripts_lose_outputs_and_results(tmp_path):
+    paths = make_project(tmp_path, {'a.txt': 'primeira', 'b.txt': 'segunda'})
+    run(tmp_path, paths)
+    manifest = ProjectManifest(tmp_path)
+    removed = manifest.remove_missing(['a.txt'])
+    assert sorted(os.path.basename(path) for path in removed) == ['b.txt.pkl', 'report_b.md']
+    assert list(manifest.files) == ['a.txt']
+    assert manifest.load_result('b.txt') is None
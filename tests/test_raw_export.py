@@ -0,0 +1,98 @@
+"""RawExport: ida e volta de output/raw/ (colunas, dicionários, mmap e troca atômica da pasta)"""
+import json
+import math
+
+import numpy as np
+import pytest
+
+from core.managers.raw_export import RAW_EXPORT_DIR, RawExport, write_raw_export
+
+
+def result(name, sentiment, words, edges=()):
+    return {
+        'filename': name,
+        'global_sentiment': 9.9,  # cópia no nível raiz: não é exportada
+        'global_metrics': {'analysis_type': 'global_metrics', 'global_sentiment': sentiment},
+        'word_frequency': {'analysis_type': 'word_frequency', 'word_frequencies': words},
+        'temporal_analysis': [{'segment': 1, 'sentiment': sentiment, 'cognitive_load': None,
+                               'hesitations': 2, 'word_count': 12},
+                              'não é segmento'],
+        'concept_network': [{'word1': a, 'word2': b, 'weight': 1, 'pmi': 0.5} for a, b in edges],
+    }
+
+
+RESULTS = [result('a.txt', -0.5, {'escola': 3, 'aluno': 1}, [('escola', 'aluno')]),
+           result('b.txt', 0.25, {'aluno': 2, 'prova': 1}, [('prova', 'recreio')])]
+
+
+def test_columns_round_trip_with_dictionaries(tmp_path):
+    target = write_raw_export(RESULTS, tmp_path, signature='s1')
+    assert target == tmp_path / RAW_EXPORT_DIR
+    export = RawExport(target)
+
+    assert export.column('files', 'file').tolist() == ['a.txt', 'b.txt']
+    metrics = export.table('metrics', decode=True)
+    assert metrics['file_id'].tolist() == [0, 1]
+    assert metrics['metric'].tolist() == ['global_metrics.global_sentiment'] * 2
+    assert metrics['value'].tolist() == [-0.5, 0.25]
+
+    # Vocabulário único entre frequências e arestas, na ordem de primeira aparição
+    assert export.dictionary('vocabulary').tolist() == ['escola', 'aluno', 'prova', 'recreio']
+    frequencies = export.table('word_frequencies', decode=True)
+    assert list(zip(frequencies['file_id'].tolist(), frequencies['word'].tolist(),
+                    frequencies['count'].tolist())) == [(0, 'escola', 3), (0, 'aluno', 1),
+                                                        (1, 'aluno', 2), (1, 'prova', 1)]
+    assert export.column('concept_edges', 'word2', decode=True).tolist() == ['aluno', 'recreio']
+    assert export.column('concept_edges', 'word1').dtype == np.int32
+
+
+def test_missing_values_become_nan_or_minus_one(tmp_path):
+    export = RawExport(write_raw_export(RESULTS, tmp_path))
+    segments = export.table('segments')
+    assert segments['segment'].tolist() == [1, 1]
+    assert segments['sentiment'].tolist() == [-0.5, 0.25]
+    assert all(math.isnan(value) for value in segments['cognitive_load'].tolist())
+    assert segments['hesitations'].tolist() == [2, 2]
+    assert all(math.isnan(value) for value in export.column('concept_edges', 'npmi').tolist())
+
+
+def test_schema_and_memory_mapping(tmp_path):
+    target = write_raw_export(RESULTS, tmp_path, signature='s1')
+    schema = json.loads((target / 'schema.json').read_text(encoding='utf-8'))
+    assert schema['signature'] == 's1'
+    assert schema['tables']['word_frequencies']['rows'] == 4
+    assert schema['tables']['concept_edges']['columns']['word1']['dictionary'] == 'vocabulary'
+    assert schema['dictionaries'] == {'vocabulary': 4, 'metric_names': 1}
+
+    assert isinstance(RawExport(target).column('metrics', 'value'), np.memmap)
+    assert not isinstance(RawExport(target, mmap=False).column('metrics', 'value'), np.memmap)
+
+
+def test_rewrite_replaces_previous_export(tmp_path):
+    write_raw_export(RESULTS, tmp_path)
+    target = write_raw_export(RESULTS[1:], tmp_path)
+    export = RawExport(target)
+    assert export.column('files', 'file').tolist() == ['b.txt']
+    assert export.dictionary('vocabulary').tolist() == ['aluno', 'prova', 'recreio']
+    assert [path.name for path in tmp_path.iterdir()] == [RAW_EXPORT_DIR]
+
+
+def test_empty_project_and_unknown_version(tmp_path):
+    target = write_raw_export([], tmp_path)
+    export = RawExport(target)
+    assert export.column('metrics', 'value').shape == (0,)
+    assert export.dictionary('vocabulary').shape == (0,)
+
+    schema = json.loads((target / 'schema.json').read_text(encoding='utf-8'))
+    schema['version'] = 0
+    (target / 'schema.json').write_text(json.dumps(schema), encoding='utf-8')
+    with pytest.raises(ValueError):
+        RawExport(target)
+
+
+def test_frame_uses_categoricals_for_dictionary_columns(tmp_path):
+    pd = pytest.importorskip('pandas')
+    frame = RawExport(write_raw_export(RESULTS, tmp_path)).frame('word_frequencies')
+    assert list(frame.columns) == ['word', 'count', 'file']
+    assert isinstance(frame['word'].dtype, pd.CategoricalDtype)
+    assert frame['file'].tolist() == ['a.txt', 'a.txt', 'b.txt', 'b.txt']
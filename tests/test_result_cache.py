@@ -0,0 +1,66 @@
+"""ResultCache: chaves, entradas corrompidas e remoção LRU por tamanho"""
+import os
+
+from core.engine.result_cache import ResultCache
+
+PAYLOAD = b'x' * 1000
+MIB = 1024 * 1024
+
+
+def test_put_get_and_counters(tmp_path):
+    cache = ResultCache(tmp_path)
+    key = cache.make_key('texto', 'mod.Analyzer', 'v1')
+    assert cache.get(key) is None
+    cache.put(key, {'value': [1, 2, 3]})
+    assert cache.get(key) == {'value': [1, 2, 3]}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_key_changes_with_each_input_but_not_upstream_order(tmp_path):
+    cache = ResultCache(tmp_path)
+    base = cache.make_key('texto', 'mod.Analyzer', 'v1', {'a': 1}, ['x:1', 'y:2'], {'topic_model': 's1'})
+    assert base == cache.make_key('texto', 'mod.Analyzer', 'v1', {'a': 1}, ['y:2', 'x:1'], {'topic_model': 's1'})
+    variants = [
+        cache.make_key('outro', 'mod.Analyzer', 'v1', {'a': 1}, ['x:1', 'y:2'], {'topic_model': 's1'}),
+        cache.make_key('texto', 'mod.Analyzer', 'v2', {'a': 1}, ['x:1', 'y:2'], {'topic_model': 's1'}),
+        cache.make_key('texto', 'mod.Analyzer', 'v1', {'a': 2}, ['x:1', 'y:2'], {'topic_model': 's1'}),
+        cache.make_key('texto', 'mod.Analyzer', 'v1', {'a': 1}, ['x:1', 'y:3'], {'topic_model': 's1'}),
+        cache.make_key('texto', 'mod.Analyzer', 'v1', {'a': 1}, ['x:1', 'y:2'], {'topic_model': 's2'}),
+    ]
+    assert base not in variants and len(set(variants)) == len(variants)
+
+
+def test_corrupted_entry_is_discarded(tmp_path):
+    cache = ResultCache(tmp_path)
+    key = cache.make_key('texto', 'mod.Analyzer', 'v1')
+    cache.put(key, PAYLOAD)
+    path = cache._path(key)
+    path.write_bytes(b'corrompido')
+    assert cache.get(key) is None
+    assert not path.exists()
+
+
+def test_evicts_least_recently_used_first(tmp_path):
+    # Cabem duas entradas de ~1 KB
+    cache = ResultCache(tmp_path, max_size_mb=2500 / MIB)
+    keys = [cache.make_key(str(i), 'mod.Analyzer', 'v1') for i in range(3)]
+    for age, key in zip((300, 200), keys[:2]):
+        cache.put(key, PAYLOAD)
+        os.utime(cache._path(key), (0, cache._path(key).stat().st_mtime - age))
+
+    # Leitura renova a entrada mais antiga; a outra passa a ser a menos usada
+    assert cache.get(keys[0]) == PAYLOAD
+    assert cache.evict() == 0
+    cache.put(keys[2], PAYLOAD)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == PAYLOAD and cache.get(keys[2]) == PAYLOAD
+    assert cache.size_bytes() <= cache.max_bytes
+
+
+def test_clear_empties_the_cache(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache.put(cache.make_key('texto', 'mod.Analyzer', 'v1'), PAYLOAD)
+    cache.clear()
+    assert cache.size_bytes() == 0
+    assert list(tmp_path.glob('*/*.pkl')) == []
@@ -0,0 +1,106 @@
+"""ResultStore: gravação incremental por arquivo, filtros, agregados e SQL somente leitura"""
+import sqlite3
+
+import pytest
+
+from core.managers.result_store import ResultStore, flatten_metrics
+
+
+def result(name, sentiment, words, hesitations=0):
+    return {
+        'filename': name,
+        'file_path': f'/projeto/{name}',
+        'analysis_timestamp': '2026-01-01T00:00:00',
+        'global_metrics': {'analysis_type': 'global_metrics', 'global_sentiment': sentiment,
+                           'speakers': {'Mãe': {'turns': 3}}, 'label': 'texto ignorado'},
+        'word_frequency': {'analysis_type': 'word_frequency', 'total_words': sum(words.values()),
+                           'word_frequencies': words},
+        'temporal_analysis': [{'segment': 1, 'timestamp': '00:00', 'sentiment': sentiment,
+                               'hesitations': hesitations, 'word_count': 10}],
+        'concept_network': [{'word1': 'escola', 'word2': 'aluno', 'weight': 2, 'pmi': 0.5, 'npmi': 0.1}],
+    }
+
+
+RESULTS = [result('a.txt', -0.4, {'escola': 3, 'aluno': 1}),
+           result('b.txt', 0.2, {'escola': 1}),
+           result('c.txt', -0.1, {'prova': 2})]
+
+
+def count(store, table):
+    return store.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_flatten_metrics_keeps_numeric_leaves_with_dotted_names():
+    metrics = {(analyzer, metric): value for analyzer, metric, value in flatten_metrics(RESULTS[0])}
+    assert metrics == {('global_metrics', 'global_sentiment'): -0.4,
+                       ('global_metrics', 'speakers.Mãe.turns'): 3.0,
+                       ('word_frequency', 'total_words'): 4.0}
+
+
+def test_write_project_replaces_previous_rows(tmp_path):
+    with ResultStore(tmp_path / 'results.db') as store:
+        counts = store.write_project('escola', RESULTS)
+        assert counts['files'] == 3 and counts['removed'] == 0
+        assert counts['word_frequencies'] == 4 and counts['segments'] == 3 and counts['concept_edges'] == 3
+
+        store.write_project('escola', RESULTS[:2])
+        assert store.project_files('escola') == ['a.txt', 'b.txt']
+        assert count(store, 'metrics') == 6 and count(store, 'word_frequencies') == 3
+
+
+def test_write_files_rewrites_only_given_files_and_removes_missing(tmp_path):
+    with ResultStore(tmp_path / 'results.db') as store:
+        store.write_project('escola', RESULTS)
+        store.write_project('outro', [result('a.txt', 0.9, {'casa': 1})])
+
+        edited = result('a.txt', 0.3, {'escola': 5})
+        counts = store.write_files('escola', [edited], present=['a.txt', 'b.txt'])
+        assert (counts['files'], counts['removed']) == (1, 1)
+        assert store.project_files('escola') == ['a.txt', 'b.txt']
+        assert store.project_files('outro') == ['a.txt']
+
+        # b.txt não foi regravado; a.txt tem só as linhas novas
+        rows = store.connection.execute(
+            "SELECT f.file, w.word, w.count FROM word_frequencies w JOIN files f ON f.id = w.file_id "
+            "WHERE f.project = 'escola' ORDER BY f.file, w.word").fetchall()
+        assert rows == [('a.txt', 'escola', 5), ('b.txt', 'escola', 1)]
+        assert count(store, 'segments') == 3
+
+
+def test_query_filters_and_aggregates(tmp_path):
+    with ResultStore(tmp_path / 'results.db') as store:
+        store.write_project('escola', RESULTS)
+        store.write_project('outro', [result('x.txt', -0.8, {'casa': 1})])
+
+        columns, rows = store.query(['global_sentiment<0'])
+        assert columns == ['project', 'file', 'global_metrics.global_sentiment']
+        assert rows == [('escola', 'a.txt', -0.4), ('escola', 'c.txt', -0.1), ('outro', 'x.txt', -0.8)]
+
+        _, rows = store.query(['global_sentiment<0', 'total_words>=2', 'project=escola'])
+        assert rows == [('escola', 'a.txt', -0.4, 4.0), ('escola', 'c.txt', -0.1, 2.0)]
+        assert len(store.query(['global_sentiment<0'], limit=1)[1]) == 1
+
+        columns, rows = store.aggregate('global_metrics.global_sentiment')
+        assert columns == ['project', 'files', 'mean', 'min', 'max']
+        assert rows[0][:2] == ('escola', 3) and rows[0][2] == pytest.approx(-0.1)
+        assert rows[1] == ('outro', 1, -0.8, -0.8, -0.8)
+
+
+def test_invalid_filters_are_rejected(tmp_path):
+    with ResultStore(tmp_path / 'results.db') as store:
+        store.write_project('escola', RESULTS)
+        for expression in ('global_sentiment', 'inexistente<1', 'global_sentiment<alto', 'project>a'):
+            with pytest.raises(ValueError):
+                store.parse_filter(expression)
+
+
+def test_read_only_store_rejects_writes(tmp_path):
+    path = tmp_path / 'results.db'
+    with ResultStore(path) as store:
+        store.write_project('escola', RESULTS)
+
+    with ResultStore(path, read_only=True) as store:
+        columns, rows = store.execute("SELECT COUNT(*) AS total FROM files")
+        assert (columns, rows) == (['total'], [(3,)])
+        with pytest.raises(sqlite3.OperationalError):
+            store.execute("DELETE FROM files")
@@ -0,0 +1,39 @@
+"""segment_sums (np.add.reduceat) comparado a somas por fatia, inclusive segmentos vazios"""
+import numpy as np
+
+from engine.text.segments import segment_bounds, segment_sums
+from engine.text.tokenized_document import TokenizedDocument
+
+
+def naive_sums(values, bounds):
+    return np.asarray([values[start:end].sum() for start, end in bounds], dtype=values.dtype)
+
+
+def test_sums_with_empty_segments():
+    values = np.arange(1, 11, dtype=np.int64)
+    bounds = np.asarray([[0, 0], [0, 3], [3, 3], [3, 7], [7, 10], [10, 10]], dtype=np.int64)
+    sums = segment_sums(values, bounds)
+    assert sums.tolist() == [0, 6, 0, 22, 27, 0]
+    assert sums.tolist() == naive_sums(values, bounds).tolist()
+
+
+def test_sums_match_naive_on_random_bounds():
+    rng = np.random.RandomState(3)
+    for _ in range(100):
+        values = rng.randint(0, 5, size=rng.randint(1, 60)).astype(np.int64)
+        edges = np.sort(rng.randint(0, len(values) + 1, size=rng.randint(1, 12)))
+        bounds = np.column_stack([edges[:-1], edges[1:]]) if len(edges) > 1 else np.zeros((0, 2), np.int64)
+        assert segment_sums(values, bounds).tolist() == naive_sums(values, bounds).tolist()
+
+
+def test_no_segments():
+    sums = segment_sums(np.ones(5, dtype=np.float32), np.zeros((0, 2), dtype=np.int64))
+    assert sums.shape == (0,) and sums.dtype == np.float32
+
+
+def test_fixed_bounds_cover_document():
+    document = TokenizedDocument("um dois três quatro cinco seis sete")
+    bounds = segment_bounds(document, method='fixed', max_segments=3)
+    assert bounds[0, 0] == 0 and bounds[-1, 1] == document.token_count
+    assert (bounds[1:, 0] == bounds[:-1, 1]).all()
+    assert segment_sums(np.ones(document.token_count, dtype=np.int64), bounds).sum() == document.token_count
@@ -0,0 +1,55 @@
+"""SentimentScorer: escores por sentença e distribuição do sentiment_analysis"""
+import numpy as np
+
+from engine.analyzers.sentiment_analysis import SentimentAnalysisAnalyzer
+from engine.text.sentiment import SentimentLexicon, SentimentScorer
+from engine.text.tokenized_document import TokenizedDocument
+
+INTERVIEW = ("Então, eu comecei o curso no ano passado e fiquei muito satisfeito com as aulas. "
+             "A gente fazia os trabalhos em grupo toda semana, na sala do segundo andar. "
+             "No começo foi difícil, tinha dúvida em quase tudo que o professor passava no quadro. "
+             "Não foi ruim, no fim das contas eu aprendi bastante com os colegas. "
+             "Hoje eu trabalho na área e lembro do curso quase todo dia.")
+
+
+def test_sentence_score_is_mean_of_lexicon_hits():
+    scorer = SentimentScorer(SentimentLexicon(['bom', 'legal'], ['ruim']))
+    document = TokenizedDocument("Foi bom e legal, mas o resto do dia inteiro foi ruim. Nada a declarar.")
+    # Palavras neutras não diluem o escore; sentença sem ocorrências = 0
+    assert np.allclose(scorer.sentence_scores(document), [1 / 3, 0.0])
+
+
+def test_distribution_of_interview_sentences():
+    result = SentimentAnalysisAnalyzer().analyze(INTERVIEW)
+    assert result['sentence_scores'].tolist() == [1.0, 0.0, -1.0, 1.0, 0.0]
+    assert result['sentiment_distribution'] == {'positive': 2, 'negative': 1, 'neutral': 2}
+    assert result['overall_sentiment'] == 0.188
+
+
+def window_scorer(**options):
+    return SentimentScorer(SentimentLexicon(['bom'], ['ruim']), negation_words=['não', 'nunca'],
+                           intensity_modifiers={'muito': 1.5, 'pouco': 0.5}, context_window=2, **options)
+
+
+def test_negation_flips_polarity_inside_the_window():
+    scorer = window_scorer()
+    assert scorer.token_scores(TokenizedDocument("não é ruim")).tolist() == [0, 0, 1]
+    # Três tokens depois da negação: fora da janela
+    assert scorer.token_scores(TokenizedDocument("não foi tão ruim")).tolist() == [0, 0, 0, -1]
+
+
+def test_intensity_scales_token_but_sentence_score_is_clipped():
+    scorer = window_scorer()
+    document = TokenizedDocument("Muito bom. Pouco bom. Nunca muito bom.")
+    assert scorer.token_scores(document).tolist() == [0, 1.5, 0, 0.5, 0, 0, -1.5]
+    assert scorer.sentence_scores(document).tolist() == [1.0, 0.5, -1.0]
+
+
+def test_rules_do_not_cross_sentence_boundaries():
+    document = TokenizedDocument("Não. Bom. Muito. Ruim.")
+    assert window_scorer().sentence_scores(document).tolist() == [0.0, 1.0, 0.0, -1.0]
+
+
+def test_disabled_rules_keep_lexicon_polarity():
+    scorer = window_scorer(negation=False, intensity=False)
+    assert scorer.token_scores(TokenizedDocument("não é muito bom")).tolist() == [0, 0, 0, 1]
@@ -0,0 +1,63 @@
+"""Matrizes de similaridade em blocos comparadas ao cálculo par a par"""
+import random
+
+import numpy as np
+
+from engine.text.similarity import cosine_matrix, group_means, jaccard_matrix, term_counts, tfidf
+from engine.text.tokenized_document import TokenizedDocument
+
+VOCABULARY = ['escola', 'aluno', 'professor', 'matemática', 'futebol', 'campo', 'laboratório',
+              'ciências', 'prova', 'recreio', 'biblioteca', 'leitura']
+
+
+def random_corpus(seed, size=23):
+    rng = random.Random(seed)
+    # Inclui um documento vazio (linha sem termos)
+    return [TokenizedDocument(' '.join(rng.choice(VOCABULARY) for _ in range(rng.randint(0, 40))))
+            for _ in range(size)] + [TokenizedDocument("")]
+
+
+def naive_cosine(vectors):
+    dense = vectors.toarray().astype(np.float64)
+    return np.clip(dense @ dense.T, 0.0, 1.0)
+
+
+def naive_jaccard(counts):
+    sets = [set(np.flatnonzero(row)) for row in counts.toarray()]
+    return np.asarray([[len(a & b) / len(a | b) if a | b else 0.0 for b in sets] for a in sets])
+
+
+def test_blocked_matrices_match_pairwise_for_any_block_size():
+    counts, _ = term_counts(random_corpus(3))
+    vectors = tfidf(counts)
+    for block_rows in (1, 5, 7, 1024):
+        assert np.allclose(cosine_matrix(vectors, block_rows), naive_cosine(vectors), atol=1e-6)
+        assert np.allclose(jaccard_matrix(counts, block_rows), naive_jaccard(counts), atol=1e-6)
+
+
+def test_matrices_are_symmetric_with_unit_diagonal():
+    counts, _ = term_counts(random_corpus(5))
+    cosine = cosine_matrix(tfidf(counts), block_rows=4)
+    jaccard = jaccard_matrix(counts, block_rows=4)
+    assert np.array_equal(cosine, cosine.T) and np.array_equal(jaccard, jaccard.T)
+    # Documento vazio: zero consigo mesmo; os demais, 1
+    assert np.allclose(np.diag(cosine)[:-1], 1.0) and np.diag(cosine)[-1] == 0.0
+    assert np.allclose(np.diag(jaccard)[:-1], 1.0) and np.diag(jaccard)[-1] == 0.0
+
+
+def test_term_counts_skip_stopwords_labels_and_short_tokens():
+    document = TokenizedDocument("Entrevistador: a escola e a escola de novo\nMaria: sim, escola 2024")
+    counts, vocabulary = term_counts([document], stopwords=frozenset({'novo'}))
+    assert vocabulary == ['escola', 'sim']
+    assert counts.toarray().tolist() == [[3.0, 1.0]]
+
+
+def test_group_means_exclude_self_pairs():
+    matrix = np.asarray([[1.0, 0.5, 0.2],
+                         [0.5, 1.0, 0.4],
+                         [0.2, 0.4, 1.0]])
+    means = group_means(matrix, np.asarray([0, 0, 1]), 2)
+    assert np.allclose(means[0], [0.5, 0.3])
+    assert np.isclose(means[1, 0], 0.3)
+    # Grupo de um único arquivo: sem pares distintos
+    assert np.isnan(means[1, 1])
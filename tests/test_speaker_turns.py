@@ -0,0 +1,62 @@
+"""SpeakerTurns (rótulos, recortes e estatísticas) e StreamScope segmento a segmento"""
+from engine.text.speaker_turns import SpeakerTurns, StreamScope
+from engine.text.tokenized_document import TokenizedDocument
+
+INTERVIEW = ("Entrevista 3\n\n"
+             "Entrevistador: Como foi o curso?\n"
+             "Maria: Foi bom.\n"
+             "O problema é: tempo curto.\n"
+             "Entrevistador: E depois?\n"
+             "Maria: Melhorou muito.\n"
+             "João: Eu concordo.")
+
+
+def test_only_repeated_or_answering_labels_open_turns():
+    turns = SpeakerTurns.parse(TokenizedDocument(INTERVIEW))
+    # "O problema é:" e "João:" (uma vez, fora de resposta ao entrevistador) ficam na fala de Maria
+    assert turns.speakers == ['Entrevistador', 'Maria']
+    assert turns.interviewer.tolist() == [True, False]
+    assert turns.speaker_ids.tolist() == [0, 1, 0, 1]
+    assert turns.has_roles
+
+
+def test_select_keeps_only_the_chosen_turns():
+    turns = SpeakerTurns.parse(TokenizedDocument(INTERVIEW))
+    assert turns.select(role='interviewer').tokens == ['como', 'foi', 'o', 'curso', 'e', 'depois']
+    assert turns.select(speaker='Maria').tokens == turns.select(role='respondent').tokens
+    assert turns.select(speaker='Ninguém').tokens == []
+
+
+def test_statistics_count_turns_tokens_and_transitions():
+    statistics = SpeakerTurns.parse(TokenizedDocument(INTERVIEW)).statistics()
+    assert statistics['turn_count'] == 4
+    assert statistics['speaker_switches'] == 3
+    assert statistics['interviewer_share'] == 0.333
+    assert statistics['mean_answer_tokens'] == 6.0
+    assert statistics['speakers']['Maria']['tokens'] == 12
+    assert statistics['speakers']['Entrevistador']['longest_turn_tokens'] == 4
+    assert statistics['transitions'] == {'Entrevistador': {'Maria': 2}, 'Maria': {'Entrevistador': 1}}
+
+
+def test_text_without_labels_has_no_turns():
+    turns = SpeakerTurns.parse(TokenizedDocument("Um relato corrido, sem rótulos de falante."))
+    assert turns.turn_count == 0
+    assert not turns.has_roles
+    assert turns.statistics()['speakers'] == {}
+
+
+def test_stream_scope_carries_the_open_turn_between_segments():
+    scope = StreamScope()
+    segments = ["Introdução sem rótulos.", "Entrevistador: Como foi o curso?", "Maria: Foi bom.",
+                "E continuou assim.", "Entrevistador: E depois?", "Ainda pergunto.", "Maria: Melhorou."]
+    selected = [scope.select(TokenizedDocument(segment)).tokens for segment in segments]
+    assert selected == [
+        ['introdução', 'sem', 'rótulos'],  # antes do primeiro entrevistador: segmento inteiro
+        [],
+        ['foi', 'bom'],
+        ['e', 'continuou', 'assim'],  # continuação da fala de Maria
+        [],
+        [],  # continuação da fala do entrevistador
+        ['melhorou'],
+    ]
+    assert scope.known == {'Entrevistador', 'Maria'}
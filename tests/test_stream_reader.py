@@ -0,0 +1,69 @@
+"""TranscriptStream: segmentos iguais para qualquer tamanho de bloco e comparados à divisão do texto inteiro"""
+import random
+
+import pytest
+
+from engine.text.stream_reader import TranscriptStream
+from engine.text.tokenized_document import PARAGRAPH_DELIMITER, SENTENCE_DELIMITER
+
+TRANSCRIPT = ("Entrevistador: Como você começou na escola?\n\n"
+              "Mãe: Eu comecei lá em 2010. Não sabia nada! Aprendi com as colegas.\n\n\n"
+              "Entrevistador: E a coordenação?\n"
+              "Mãe: A coordenação ajudou... Ainda ajuda, né?\n\n"
+              "Pai: Concordo. Foi ótimo.")
+
+
+def write(tmp_path, text):
+    path = tmp_path / 'transcricao.txt'
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+def naive_segments(text, delimiter):
+    return [piece.strip() for piece in delimiter.split(text) if piece.strip()]
+
+
+@pytest.mark.parametrize('unit, delimiter', [('paragraph', PARAGRAPH_DELIMITER),
+                                             ('sentence', SENTENCE_DELIMITER)])
+def test_segments_match_whole_text_split_for_any_chunk_size(tmp_path, unit, delimiter):
+    path = write(tmp_path, TRANSCRIPT)
+    expected = naive_segments(TRANSCRIPT, delimiter)
+    # Blocos de 1 byte cortam caracteres multibyte ('ã', 'ç', 'ó') ao meio
+    for chunk_size in (1, 2, 3, 7, 64, 1 << 20):
+        stream = TranscriptStream(path, unit=unit, chunk_size=chunk_size)
+        assert [segment for segment, _ in stream] == expected
+
+
+def test_turns_start_at_speaker_labels(tmp_path):
+    stream = TranscriptStream(write(tmp_path, TRANSCRIPT), unit='turn', chunk_size=5)
+    segments = [segment for segment, _ in stream]
+    assert [segment.split(':')[0] for segment in segments] == ['Entrevistador', 'Mãe', 'Entrevistador',
+                                                              'Mãe', 'Pai']
+    assert segments[1] == "Mãe: Eu comecei lá em 2010. Não sabia nada! Aprendi com as colegas."
+
+
+def test_long_text_without_delimiters_is_cut_at_spaces(tmp_path):
+    rng = random.Random(5)
+    words = [''.join(rng.choice('abcdeçã') for _ in range(rng.randint(1, 9))) for _ in range(400)]
+    text = ' '.join(words)
+    stream = TranscriptStream(write(tmp_path, text), chunk_size=16, max_segment_chars=50)
+    segments = [segment for segment, _ in stream]
+    assert len(segments) > 1
+    assert all(len(segment) <= 50 for segment in segments)
+    assert ' '.join(segments).split() == words
+
+
+def test_positions_and_statistics(tmp_path):
+    path = write(tmp_path, TRANSCRIPT)
+    stream = TranscriptStream(path, unit='sentence', chunk_size=8)
+    positions = [position for _, position in stream]
+    assert positions[0] == 0.0
+    assert positions == sorted(positions) and all(0.0 <= position < 1.0 for position in positions)
+    assert stream.chars_read == len(TRANSCRIPT)
+    assert stream.bytes_read == path.stat().st_size
+    assert stream.segments_read == len(positions)
+
+
+def test_unknown_unit_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        TranscriptStream(write(tmp_path, TRANSCRIPT), unit='capitulo')
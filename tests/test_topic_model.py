@@ -0,0 +1,72 @@
+"""TopicModel: ajuste do projeto, persistência, transform() e detecção de corpus alterado"""
+import os
+
+import numpy as np
+
+from engine.text.topic_model import TopicModel
+from engine.text.tokenized_document import TokenizedDocument
+
+CORPUS = {
+    'escola.txt': ("O professor explicou matemática na escola com exemplos do laboratório.\n\n"
+                   "A escola tinha laboratório de ciências e aulas de matemática."),
+    'futebol.txt': ("Os alunos jogavam futebol no campo depois das aulas.\n\n"
+                    "O campo de futebol ficava atrás do laboratório da escola."),
+}
+
+
+def write_corpus(folder):
+    paths = []
+    for name, text in CORPUS.items():
+        path = folder / name
+        path.write_text(text, encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+def test_saved_model_transforms_like_the_fitted_one(tmp_path):
+    paths = write_corpus(tmp_path)
+    model = TopicModel(n_topics=2).fit(paths)
+    model.save(tmp_path / 'topic_model.pkl')
+    loaded = TopicModel.load(tmp_path / 'topic_model.pkl')
+
+    document = TokenizedDocument("Na escola a matemática era no laboratório.")
+    assert loaded.signature == model.signature
+    assert loaded.vocabulary == model.vocabulary
+    assert np.allclose(loaded.transform(document), model.transform(document))
+    assert np.isclose(model.transform(document).sum(), 1.0)
+    assert loaded.top_terms(0, limit=3) == model.top_terms(0, limit=3)
+
+
+def test_fit_is_deterministic(tmp_path):
+    paths = write_corpus(tmp_path)
+    first, second = TopicModel(n_topics=2).fit(paths), TopicModel(n_topics=2).fit(paths)
+    assert first.signature == second.signature
+    assert np.allclose(first.estimator.components_, second.estimator.components_)
+
+
+def test_unknown_terms_give_empty_distribution(tmp_path):
+    model = TopicModel(n_topics=2).fit(write_corpus(tmp_path))
+    document = TokenizedDocument("Choveu ontem à tarde.")
+    assert model.transform(document).tolist() == [0.0, 0.0]
+    assert model.distinctive_terms(document) == []
+
+
+def test_load_rejects_missing_or_foreign_files(tmp_path):
+    assert TopicModel.load(tmp_path / 'ausente.pkl') is None
+    (tmp_path / 'outro.pkl').write_bytes(b'nao e pickle')
+    assert TopicModel.load(tmp_path / 'outro.pkl') is None
+
+
+def test_edit_with_same_size_makes_model_stale(tmp_path):
+    paths = write_corpus(tmp_path)
+    model = TopicModel(n_topics=2).fit(paths)
+    assert not model.is_stale(paths, growth=0.4)
+
+    # Mesmo tamanho, conteúdo e mtime diferentes
+    edited = paths[0]
+    stat = edited.stat()
+    edited.write_text(CORPUS['escola.txt'].replace('com', 'sem'), encoding='utf-8')
+    os.utime(edited, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert edited.stat().st_size == stat.st_size
+    assert model.is_stale(paths, growth=0.4)
+    assert not model.is_stale(paths, growth=0.9)
@@ -13,6 +13,7 @@ class BaseChart(ABC):
     def __init__(self, config_path: str = None):
         self.config = self.load_config(config_path) if config_path else {}
         self.backend = self.config.get("backend", "plotly")  # plotly, matplotlib, text
+        self.figure = None  # última figura plotly criada (ver save_figure)
     
     def load_config(self, config_path: str) -> dict:
         """Carrega configuração específica do gráfico"""
@@ -29,6 +30,22 @@ class BaseChart(ABC):
         """Cria a visualização"""
         pass
     
+    def save_figure(self, fig, html_path: str) -> str:
+        """
+        Grava uma figura plotly respeitando o modo de renderização do orquestrador
+        
+        - include_plotlyjs (config): True embute o plotly.js (~3 MB) no HTML; um
+          caminho '.js' apenas referencia o arquivo compartilhado
+        - defer_write (config): não grava; a figura fica em self.figure para a
+          página única do projeto
+        """
+        self.figure = fig
+        if self.config.get('defer_write'):
+            return html_path
+        
+        fig.write_html(html_path, include_plotlyjs=self.config.get('include_plotlyjs', True))
+        return html_path
+    
     def adjust_for_data_size(self, data: Dict) -> Dict:
         """Ajusta parâmetros visuais baseado no volume de dados"""
         if isinstance(data, dict):
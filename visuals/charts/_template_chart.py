@@ -47,7 +47,7 @@ class TemplateChart(BaseChart):
         # Adicionar seus dados ao gráfico
         
         html_path = output_path.replace('.png', '.html')
-        fig.write_html(html_path)
+        self.save_figure(fig, html_path)
         return html_path
     
     def _create_matplotlib(self, data: Dict, output_path: str, adjustments: Dict) -> str:
@@ -54,7 +54,7 @@ class NetworkChart(BaseChart):
             )
             fig.update_layout(title=self.config.get('title', 'Rede de Conceitos'))
             html_path = output_path.replace('.png', '.html')
-            fig.write_html(html_path)
+            self.save_figure(fig, html_path)
             return html_path
         
         # Layout simples sem NetworkX
@@ -96,7 +96,7 @@ class NetworkChart(BaseChart):
         )
         
         html_path = output_path.replace('.png', '.html')
-        fig.write_html(html_path)
+        self.save_figure(fig, html_path)
         return html_path
     
     def _create_text(self, nodes, edges, output_path: str, adjustments: Dict) -> str:
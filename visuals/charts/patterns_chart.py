@@ -44,7 +44,7 @@ class PatternsChart(BaseChart):
         fig.update_layout(title=self.config.get('title', 'Padrões Linguísticos'))
         
         html_path = output_path.replace('.png', '.html')
-        fig.write_html(html_path)
+        self.save_figure(fig, html_path)
         return html_path
 
     def _create_text(self, categories, values, output_path: str) -> str:
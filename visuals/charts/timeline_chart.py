@@ -50,7 +50,7 @@ class TimelineChart(BaseChart):
         )
         
         html_path = output_path.replace('.png', '.html')
-        fig.write_html(html_path)
+        self.save_figure(fig, html_path)
         return html_path
     
     def _create_matplotlib(self, x_data, y_data, output_path: str, adjustments: Dict) -> str:
@@ -73,7 +73,7 @@ class WordCloudChart(BaseChart):
         )
         
         html_path = output_path.replace('.png', '.html')
-        fig.write_html(html_path)
+        self.save_figure(fig, html_path)
         return html_path
 
     def _create_text(self, words, frequencies, output_path: str, adjustments: Dict) -> str: